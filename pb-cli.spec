@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +7,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('plubo/templates', 'plubo/templates')],
-    hiddenimports=[],
+    hiddenimports=collect_submodules('plubo'),  # commands are imported lazily by name
     hookspath=[],
     hooksconfig={},
     runtime_hooks=['scripts/pyinstaller_subprocess_env_hook.py'],
@@ -8,7 +8,7 @@ def _normalize_token(value):
     return re.sub(r"[^a-z0-9]+", "", value.lower())
 
 
-def _resolve_functionality(value):
+def resolve_functionality(value):
     normalized_value = _normalize_token(value)
 
     for option, template_filename in FUNCTIONALITY_OPTIONS.items():
@@ -38,7 +38,7 @@ def add_functionality_command(args):
         template_filename = "Functionality.php"
     else:
         requested = " ".join(args).strip()
-        resolved_name, template_filename = _resolve_functionality(requested)
+        resolved_name, template_filename = resolve_functionality(requested)
         functionality_name = resolved_name if resolved_name else requested
 
     created, message = create_functionality(functionality_name, template_filename)
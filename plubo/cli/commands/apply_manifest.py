@@ -0,0 +1,436 @@
+"""`pb-cli apply`: scaffold a whole plugin layout from one manifest.
+
+The manifest lists functionalities, components, entities, CPTs,
+taxonomies, REST endpoints and dependencies. Every edit is planned in
+memory first (edits to the same file accumulate), the plan and its diff
+are printed, and once confirmed each touched file is written exactly once.
+Dependencies are installed afterwards with one `composer require` and one
+`yarn add`, side by side; those already listed in composer.json or
+package.json are skipped.
+
+Example plubo.manifest.json:
+
+    {
+      "functionalities": ["admin-menus", "shortcodes", "custom Payments"],
+      "components": ["hero-banner"],
+      "entities": ["book"],
+      "cpts": ["book", {"slug": "movie", "singular": "Movie", "plural": "Movies"}],
+      "taxonomies": [{"slug": "genre", "post_type": "book", "hierarchical": true}],
+      "endpoints": [{"path": "books", "type": "get"}],
+      "dependencies": {"php": ["routes"], "node": ["alpine"]}
+    }
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+from plubo.cli.commands.add_functionality import resolve_functionality
+from plubo.cli.commands.create_plugin import (
+    composer_package_key,
+    install_node_dependencies,
+    install_php_dependencies,
+    is_blade_requested,
+    load_composer_require,
+)
+from plubo.cli.commands.functionalities._shared import default_plural, normalize_slug, slug_to_label
+from plubo.cli.commands.functionalities.add_cpt import append_cpt, cpt_registered
+from plubo.cli.commands.functionalities.add_taxonomy import append_taxonomy, taxonomy_registered
+from plubo.generators.component import component_class_name
+from plubo.generators.elements import ENDPOINT_TYPES, append_endpoint, endpoint_registered
+from plubo.generators.entity import entity_class_name
+from plubo.generators.functionality import functionality_class_name, functionality_path, resolve_template
+from plubo.generators.node_dependency import get_dependency_packages, resolve_dependency as resolve_node_dependency
+from plubo.generators.php_dependency import get_dependency_package, resolve_dependency as resolve_php_dependency
+from plubo.utils import project
+from plubo.utils.edit_plan import EditPlan
+from plubo.utils.php_source import PhpEditor
+from plubo.utils.steps import Step, first_failure, run_steps
+from plubo.utils.templates import render_template
+
+DEFAULT_MANIFEST = "plubo.manifest.json"
+USAGE = f"Usage: plubo apply [manifest] [--dry-run] [--yes]  (default manifest: {DEFAULT_MANIFEST})"
+SECTIONS = ("functionalities", "components", "entities", "cpts", "taxonomies", "endpoints", "dependencies")
+LABEL_FIELDS = {
+    "cpts": ("slug", "singular", "plural"),
+    "taxonomies": ("slug", "post_type", "singular", "plural"),
+    "endpoints": ("path", "type", "namespace"),
+}
+
+
+def _parse_args(args):
+    manifest_path = None
+    dry_run = False
+    assume_yes = False
+    for arg in args:
+        if arg == "--dry-run":
+            dry_run = True
+        elif arg in {"--yes", "-y"}:
+            assume_yes = True
+        elif arg.startswith("-") or manifest_path is not None:
+            print(USAGE)
+            sys.exit(1)
+        else:
+            manifest_path = arg
+    return Path(manifest_path or DEFAULT_MANIFEST), dry_run, assume_yes
+
+
+def _labels(entry, slug):
+    singular = (entry.get("singular") or "").strip() or slug_to_label(slug)
+    plural = (entry.get("plural") or "").strip() or default_plural(singular)
+    return singular, plural
+
+
+def _endpoint_type(value):
+    value = str(value or "get").strip()
+    if value.lower() in {"get", "post", "put", "delete"}:
+        value = value.capitalize() + "Endpoint"
+    return value if value in ENDPOINT_TYPES else None
+
+
+def load_manifest(manifest_path):
+    """Read and validate a manifest. Returns (manifest, errors)."""
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except OSError as error:
+        return None, [f"Could not read {manifest_path}: {error.strerror or error}"]
+    except ValueError as error:
+        return None, [f"{manifest_path} is not valid JSON: {error}"]
+    if not isinstance(manifest, dict):
+        return None, [f"{manifest_path} must contain a JSON object"]
+
+    errors = [f"Unknown section '{key}' (expected one of: {', '.join(SECTIONS)})" for key in manifest if key not in SECTIONS]
+    for section in SECTIONS[:-1]:
+        entries = manifest.setdefault(section, [])
+        if not isinstance(entries, list):
+            errors.append(f"'{section}' must be a list")
+            manifest[section] = []
+            continue
+        for index, entry in enumerate(entries, start=1):
+            where = f"{section}[{index}]"
+            if isinstance(entry, dict):
+                wrong_fields = [
+                    key for key in LABEL_FIELDS.get(section, ())
+                    if entry.get(key) is not None and not isinstance(entry[key], str)
+                ]
+                if wrong_fields:
+                    errors.append(f"{where}: {', '.join(repr(key) for key in wrong_fields)} must be text")
+                    continue
+            if section in {"functionalities", "components", "entities"}:
+                if not isinstance(entry, str) or not entry.strip():
+                    errors.append(f"{where}: expected a non-empty name")
+            elif section == "cpts":
+                slug = entry if isinstance(entry, str) else entry.get("slug") if isinstance(entry, dict) else None
+                if not isinstance(slug, str) or not normalize_slug(slug):
+                    errors.append(f"{where}: expected a slug or an object with a 'slug'")
+            elif section == "taxonomies":
+                if not isinstance(entry, dict) or not normalize_slug(entry.get("slug") or "") \
+                        or not normalize_slug(entry.get("post_type") or ""):
+                    errors.append(f"{where}: expected an object with 'slug' and 'post_type'")
+            elif section == "endpoints":
+                if not isinstance(entry, dict) or not (entry.get("path") or "").strip():
+                    errors.append(f"{where}: expected an object with a 'path'")
+                elif not _endpoint_type(entry.get("type")):
+                    errors.append(f"{where}: unknown endpoint type '{entry.get('type')}' (get, post, put or delete)")
+
+    dependencies = manifest.setdefault("dependencies", {})
+    if not isinstance(dependencies, dict):
+        errors.append("'dependencies' must be an object with 'php' and/or 'node' lists")
+        manifest["dependencies"] = {}
+    else:
+        for kind in ("php", "node"):
+            packages = dependencies.setdefault(kind, [])
+            if not isinstance(packages, list) or not all(isinstance(package, str) and package.strip() for package in packages):
+                errors.append(f"'dependencies.{kind}' must be a list of package names or presets")
+                dependencies[kind] = []
+    return manifest, errors
+
+
+class _Planner:
+    """Turns manifest entries into EditPlan changes, collecting skips and errors."""
+
+    def __init__(self, plan, plugin_root, namespace, text_domain, blade):
+        self.plan = plan
+        self.plugin_root = plugin_root
+        self.namespace = namespace
+        self.text_domain = text_domain
+        self.blade = blade
+        self.editors = {}  # One outline per edited file, shared by all its insertions
+        self.skipped = []
+        self.errors = []
+
+    def _render(self, template, **values):
+        try:
+            return render_template(template, PluginPlaceholder=self.namespace, **values)
+        except FileNotFoundError:
+            self.errors.append(f"Template file '{template}' not found.")
+        except ValueError as error:
+            self.errors.append(str(error))
+        return None
+
+    def _create(self, kind, class_name, path, template, **values):
+        if self.plan.exists(path):
+            self.skipped.append(f"{kind} '{class_name}' already exists at {self.plan.relative(path)}")
+            return
+        code = self._render(template, **values)
+        if code is not None:
+            self.plan.create(path, code, f"{kind.lower()} {class_name}")
+
+    def functionality(self, name, template_filename):
+        class_name = functionality_class_name(name)
+        path = functionality_path(self.plugin_root, name, template_filename)
+        template = resolve_template(template_filename, self.plugin_root, blade=self.blade or None)
+        self._create("Functionality", class_name, path, template, FunctionalityName=class_name)
+        return path
+
+    def component(self, name):
+        class_name = component_class_name(name.strip().replace(" ", "-"))
+        path = self.plugin_root / "Components" / f"{class_name}.php"
+        self._create("Component", class_name, path, "Component.php", ComponentName=class_name)
+
+    def entity(self, name):
+        class_name = entity_class_name(name.strip().replace(" ", "-"))
+        path = self.plugin_root / "Entities" / f"{class_name}.php"
+        self._create("Entity", class_name, path, "Entity.php", EntityName=class_name)
+
+    def _host_file(self, name, template_filename):
+        """The functionality file that receives registrations, planned for creation if missing."""
+        path = functionality_path(self.plugin_root, name, template_filename)
+        if not self.plan.exists(path):
+            self.functionality(name, template_filename)
+        return path if self.plan.exists(path) else None
+
+    def _insert(self, path, label, registered, append, method):
+        editor = self.editors.get(path)
+        if editor is None:
+            editor = self.editors[path] = PhpEditor(self.plan.read(path))
+        if registered(editor.text()):
+            self.skipped.append(f"{label} is already registered in {self.plan.relative(path)}")
+            return
+        if not append(editor):
+            self.errors.append(f"Could not find method {method} in {self.plan.relative(path)}")
+            return
+        self.plan.update(path, editor.text(), label)
+
+    def cpt(self, entry):
+        entry = {"slug": entry} if isinstance(entry, str) else entry
+        slug = normalize_slug(entry["slug"])
+        singular, plural = _labels(entry, slug)
+        path = self._host_file("Custom Post Types", "CustomPostTypes.php")
+        if path:
+            self._insert(
+                path,
+                f"CPT '{slug}'",
+                lambda content: cpt_registered(content, slug),
+                lambda editor: append_cpt(editor, slug, singular, plural, self.text_domain),
+                "register_post_types()",
+            )
+
+    def taxonomy(self, entry):
+        slug = normalize_slug(str(entry["slug"]))
+        post_type = normalize_slug(str(entry["post_type"]))
+        singular, plural = _labels(entry, slug)
+        hierarchical = bool(entry.get("hierarchical"))
+        path = self._host_file("Taxonomies", "Taxonomies.php")
+        if path:
+            self._insert(
+                path,
+                f"Taxonomy '{slug}'",
+                lambda content: taxonomy_registered(content, slug),
+                lambda editor: append_taxonomy(editor, slug, post_type, singular, plural, self.text_domain, hierarchical),
+                "register_taxonomies()",
+            )
+
+    def endpoint(self, entry):
+        namespace = str(entry.get("namespace") or f"{self.text_domain}/v1").strip()
+        endpoint_path = str(entry["path"]).strip()
+        type_choice = _endpoint_type(entry.get("type"))
+        path = self._host_file("Api Endpoints", "ApiEndpoints.php")
+        if path:
+            self._insert(
+                path,
+                f"{type_choice} '{namespace}/{endpoint_path}'",
+                lambda content: endpoint_registered(content, namespace, endpoint_path, type_choice),
+                lambda editor: append_endpoint(editor, namespace, endpoint_path, type_choice),
+                "add_endpoints()",
+            )
+
+
+def build_plan(manifest, plugin_root, context):
+    """Plan every file change of the manifest. Returns (plan, skipped, errors)."""
+    plan = EditPlan(plugin_root)
+    blade = is_blade_requested(manifest["dependencies"]["php"])
+    planner = _Planner(plan, plugin_root, context.namespace, context.plugin_slug, blade)
+
+    for name in manifest["functionalities"]:
+        name = name.strip()
+        if name.lower().startswith("custom "):
+            planner.functionality(name[len("custom "):].strip(), "Functionality.php")
+        else:
+            resolved_name, template_filename = resolve_functionality(name)
+            planner.functionality(resolved_name or name, template_filename)
+    for name in manifest["components"]:
+        planner.component(name)
+    for name in manifest["entities"]:
+        planner.entity(name)
+    for entry in manifest["cpts"]:
+        planner.cpt(entry)
+    for entry in manifest["taxonomies"]:
+        planner.taxonomy(entry)
+    for entry in manifest["endpoints"]:
+        planner.endpoint(entry)
+
+    return plan, planner.skipped, planner.errors
+
+
+def _node_package_key(package_spec):
+    """`daisyui@latest` -> `daisyui`, `@scope/name@1.2` -> `@scope/name`."""
+    version_at = package_spec.rfind("@")
+    return package_spec[:version_at] if version_at > 0 else package_spec
+
+
+def _load_node_packages(plugin_root):
+    try:
+        package_data = json.loads((plugin_root / "package.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return set()
+    if not isinstance(package_data, dict):
+        return set()
+    names = set()
+    for section in ("dependencies", "devDependencies"):
+        if isinstance(package_data.get(section), dict):
+            names.update(package_data[section])
+    return names
+
+
+def pending_dependencies(plugin_root, dependencies):
+    """Drop the dependencies whose packages are already required. Returns (pending, skipped)."""
+    pending = {"php": [], "node": []}
+    skipped = []
+
+    required_packages = load_composer_require(plugin_root)
+    for dependency_input in dependencies["php"]:
+        package_name = get_dependency_package(resolve_php_dependency(dependency_input)[0])
+        if package_name and composer_package_key(package_name) in required_packages:
+            skipped.append(f"PHP dependency '{dependency_input}' is already in composer.json")
+        else:
+            pending["php"].append(dependency_input)
+
+    node_packages = _load_node_packages(plugin_root)
+    for dependency_input in dependencies["node"]:
+        packages = get_dependency_packages(resolve_node_dependency(dependency_input)[0])
+        if packages and all(_node_package_key(package["name"]) in node_packages for package in packages):
+            skipped.append(f"Node dependency '{dependency_input}' is already in package.json")
+        else:
+            pending["node"].append(dependency_input)
+
+    return pending, skipped
+
+
+def _print_plan(plan, skipped, dependencies):
+    changed = plan.changed_files()
+    print(f"📋 Plan: {len(changed)} file(s) to write")
+    for planned in changed:
+        marker = "+" if planned.is_new else "~"
+        print(f"  {marker} {plan.relative(planned.path)}: {', '.join(planned.notes)}")
+    for message in skipped:
+        print(f"  ⏭️ {message}")
+    if dependencies["php"]:
+        print(f"  📦 PHP dependencies: {', '.join(dependencies['php'])}")
+    if dependencies["node"]:
+        print(f"  📦 Node dependencies: {', '.join(dependencies['node'])}")
+
+    diff = plan.diff()
+    if diff:
+        print()
+        sys.stdout.write(diff)
+        print()
+
+
+def _confirm():
+    if not sys.stdin.isatty():
+        print("❌ Not a terminal: pass --yes to apply the plan without confirmation.")
+        sys.exit(1)
+    try:
+        answer = input("Apply these changes? [y/N] ").strip().lower()
+    except EOFError:
+        answer = ""
+    return answer in {"y", "yes"}
+
+
+def _install_dependencies(plugin_root, use_lando, dependencies):
+    install_steps = []
+    if dependencies["php"]:
+        install_steps.append(Step(
+            "composer",
+            action=lambda run: install_php_dependencies(plugin_root, use_lando, dependencies["php"], run),
+        ))
+    if dependencies["node"]:
+        install_steps.append(Step(
+            "node",
+            action=lambda run: install_node_dependencies(plugin_root, dependencies["node"], run),
+        ))
+    if not install_steps:
+        return []
+
+    results = run_steps(install_steps, plugin_root)
+    failed = first_failure(results)
+    if failed:
+        raise failed.error
+    return [message for result in results.values() for message in result.messages]
+
+
+def apply_command(args):
+    manifest_path, dry_run, assume_yes = _parse_args(args)
+
+    if not project.detect_plugin_name():
+        print("❌ No plugin detected. Run this command from a plugin root.")
+        sys.exit(1)
+
+    manifest, errors = load_manifest(manifest_path)
+    if not errors:
+        plugin_root = Path.cwd()
+        context = project.get_context(plugin_root)
+        plan, skipped, errors = build_plan(manifest, plugin_root, context)
+        dependencies, skipped_dependencies = pending_dependencies(plugin_root, manifest["dependencies"])
+        skipped += skipped_dependencies
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        print("Nothing was written.")
+        sys.exit(1)
+
+    if not plan.changed_files() and not dependencies["php"] and not dependencies["node"]:
+        for message in skipped:
+            print(f"⏭️ {message}")
+        print("✅ Nothing to do: the plugin already matches the manifest.")
+        return
+
+    _print_plan(plan, skipped, dependencies)
+    if dry_run:
+        print("ℹ️ Dry run: nothing was written.")
+        return
+    if not assume_yes and not _confirm():
+        print("❌ Aborted.")
+        sys.exit(1)
+
+    try:
+        written = plan.write()
+    except FileExistsError as error:
+        print(f"❌ Changed on disk since the plan was made: {error}. Nothing was written; run apply again.")
+        sys.exit(1)
+    except OSError as error:
+        print(f"❌ Failed to write {error.filename or ''}: {error.strerror or error}")
+        sys.exit(1)
+    print(f"✅ Wrote {len(written)} file(s).")
+
+    try:
+        messages = _install_dependencies(plugin_root, context.is_lando, dependencies)
+    except FileNotFoundError as error:
+        print(f"❌ Command not found: {error.filename}")
+        sys.exit(1)
+    except subprocess.CalledProcessError as error:
+        failed_command = error.cmd if isinstance(error.cmd, list) else [str(error.cmd)]
+        print(f"❌ Command failed with exit code {error.returncode}: {' '.join(failed_command)}")
+        sys.exit(error.returncode)
+    for message in messages:
+        print(f"ℹ️ {message}")
@@ -0,0 +1,38 @@
+import sys
+from plubo.utils import build_stamp, project, steps
+
+USAGE = "Usage: plubo build [--force]"
+
+
+def build_command(args):
+    if any(arg != "--force" for arg in args):
+        print(USAGE)
+        print("--force: run yarn and yarn build even if nothing changed since the last build")
+        sys.exit(1)
+
+    context = project.get_context()
+    plugin_root = context.plugin_root
+    if not plugin_root:
+        print("❌ No plugin detected. Aborting.")
+        sys.exit(1)
+
+    if not (plugin_root / "package.json").exists():
+        print("❌ No package.json found in the plugin. Nothing to build.")
+        sys.exit(1)
+
+    node_steps, skipped, stamp = build_stamp.node_steps(plugin_root, force="--force" in args)
+    for name in skipped:
+        print(f"⏭️ Skipped `{name}`: inputs unchanged since the last successful run.")
+
+    if not node_steps:
+        print("✅ Assets are up to date.")
+        return
+
+    results = steps.run_steps(node_steps, plugin_root)
+    stamp.record(results)
+    failed = steps.first_failure(results)
+    if failed:
+        print(f"❌ `{failed.name}` failed: {failed.error}")
+        sys.exit(1)
+
+    print("✅ Assets built.")
@@ -1,18 +1,43 @@
+import json
 import sys
-from plubo.generators.dependencies import check_composer_dependencies, get_yarn_outdated
+from pathlib import Path
+from plubo.generators.dependencies import dependency_report, fleet_dependency_report
+from plubo.utils import project
 
-def check_dependencies_command(args):
-    strict = "--strict" in args
-    invalid_args = [arg for arg in args if arg != "--strict"]
+USAGE = "Usage: plubo check-dep [--strict] [--refresh] [--all] [--json] [--jobs <n>]"
+FLAGS = {"--strict", "--refresh", "--all", "--json"}
+
+
+def _print_usage():
+    print(USAGE)
+    print("--strict: exit with code 1 if outdated dependencies are found")
+    print("--refresh: ask composer/yarn for the latest versions instead of the cached snapshot")
+    print("--all: check every plugin in wp-content/plugins of the detected WordPress install")
+    print("--json: print the report as JSON")
+    print("--jobs: number of plugins checked in parallel with --all")
+
+
+def _parse_args(args):
+    flags = set()
+    workers = None
+    index = 0
+
+    while index < len(args):
+        arg = args[index]
+        if arg == "--jobs" and index + 1 < len(args) and args[index + 1].isdigit() and int(args[index + 1]) > 0:
+            workers = int(args[index + 1])
+            index += 2
+            continue
+        if arg not in FLAGS:
+            _print_usage()
+            sys.exit(1)
+        flags.add(arg)
+        index += 1
 
-    if invalid_args:
-        print("Usage: plubo check-dep [--strict]")
-        print("--strict: exit with code 1 if outdated dependencies are found")
-        sys.exit(1)
+    return flags, workers
 
-    composer_outdated = check_composer_dependencies()
-    yarn_outdated = get_yarn_outdated()
 
+def _print_single_report(composer_outdated, yarn_outdated):
     if composer_outdated:
         print("Outdated Composer dependencies:")
         for package, versions in composer_outdated.items():
@@ -27,10 +52,66 @@ def check_dependencies_command(args):
     else:
         print("All Yarn dependencies are up to date.")
 
-    outdated_count = len(composer_outdated) + len(yarn_outdated)
+
+def _print_fleet_table(reports):
+    rows = [
+        (plugin, manager, package, versions["current"], versions["latest"])
+        for plugin, (composer_outdated, yarn_outdated) in reports.items()
+        for manager, outdated in (("composer", composer_outdated), ("yarn", yarn_outdated))
+        for package, versions in sorted(outdated.items())
+    ]
+    if not rows:
+        print(f"All dependencies of {len(reports)} plugin(s) are up to date.")
+        return
+
+    header = ("Plugin", "Manager", "Package", "Current", "Latest")
+    widths = [max(len(str(row[column])) for row in rows + [header]) for column in range(len(header))]
+    for row in [header] + rows:
+        print("  ".join(str(value).ljust(width) for value, width in zip(row, widths)).rstrip())
+
+
+def _report_json(reports, paths):
+    return {
+        plugin: {"path": str(paths[plugin]), "composer": composer_outdated, "yarn": yarn_outdated}
+        for plugin, (composer_outdated, yarn_outdated) in reports.items()
+    }
+
+
+def check_dependencies_command(args):
+    flags, workers = _parse_args(args)
+    refresh = "--refresh" in flags
+
+    if "--all" in flags:
+        plugins_directory = project.get_context().plugins_directory
+        if not plugins_directory or not plugins_directory.is_dir():
+            print("❌ No WordPress installation detected.")
+            sys.exit(1)
+
+        contexts = project.find_plugins(plugins_directory)
+        paths = {context.path.name: context.path for context in contexts}
+        fleet = fleet_dependency_report(paths.values(), refresh=refresh, workers=workers)
+        reports = {folder: fleet[Path(path)] for folder, path in paths.items()}
+    else:
+        context = project.get_context()
+        paths = {context.plugin_slug or context.path.name: context.path}
+        reports = {next(iter(paths)): dependency_report(refresh=refresh)}
+
+    outdated_count = sum(len(composer_outdated) + len(yarn_outdated) for composer_outdated, yarn_outdated in reports.values())
+
+    if "--json" in flags:
+        print(json.dumps({"plugins": _report_json(reports, paths), "outdated_count": outdated_count}, indent=2))
+        sys.exit(1 if outdated_count and "--strict" in flags else 0)
+
+    if "--all" in flags:
+        _print_fleet_table(reports)
+    else:
+        _print_single_report(*next(iter(reports.values())))
+
     if outdated_count == 0:
         print("✅ No outdated dependencies found.")
         sys.exit(0)
 
-    print(f"⚠️ Found {outdated_count} outdated dependencies.")
-    sys.exit(1 if strict else 0)
+    affected = sum(1 for composer_outdated, yarn_outdated in reports.values() if composer_outdated or yarn_outdated)
+    suffix = f" across {affected} plugin(s)" if "--all" in flags else ""
+    print(f"⚠️ Found {outdated_count} outdated dependencies{suffix}.")
+    sys.exit(1 if "--strict" in flags else 0)
@@ -3,6 +3,7 @@ import subprocess
 import json
 from pathlib import Path
 from plubo.cli.commands.plugin_headers import HEADER_OPTION_TO_LABEL, apply_plugin_header_updates, find_main_plugin_file
+from plubo.cli.commands.rename_plugin import print_progress
 from plubo.generators.plugin import rename_plugin
 from plubo.generators.php_dependency import (
     apply_post_install_actions as apply_php_post_install_actions,
@@ -15,9 +16,11 @@ from plubo.generators.node_dependency import (
     resolve_dependency as resolve_node_dependency,
 )
 from plubo.utils import project
+from plubo.utils.skeleton import create_skeleton
+from plubo.utils.steps import Step, first_failure, run_steps
 
 USAGE = (
-    "Usage: pb-cli create <plugin_name> [--lando] [--blade] "
+    "Usage: pb-cli create <plugin_name> [--lando] [--blade] [--refresh-skeleton] "
     "[--php-dep <package|preset>] [--composer-dep <package|preset>] "
     "[--node-dep <package|preset>] "
     "[--plugin-name <name>] [--plugin-uri <url>] [--author <name>] "
@@ -33,6 +36,7 @@ BLADE_LOADER_PATHS = (
 )
 def _parse_create_args(args):
     use_lando = False
+    refresh_skeleton = False
     use_blade = False
     php_dependencies = []
     node_dependencies = []
@@ -42,6 +46,10 @@ def _parse_create_args(args):
 
     while index < len(args):
         arg = args[index]
+        if arg == "--refresh-skeleton":
+            refresh_skeleton = True
+            index += 1
+            continue
         if arg == "--lando":
             use_lando = True
             index += 1
@@ -134,7 +142,7 @@ def _parse_create_args(args):
         print(USAGE)
         sys.exit(1)
 
-    return new_name, use_lando, use_blade, header_updates, php_dependencies, node_dependencies
+    return new_name, use_lando, use_blade, header_updates, php_dependencies, node_dependencies, refresh_skeleton
 
 
 def _confirm_create_in_current_directory():
@@ -148,7 +156,7 @@ def _confirm_create_in_current_directory():
 
     return answer in {"y", "yes"}
 
-def _load_composer_require(plugin_directory):
+def load_composer_require(plugin_directory):
     composer_json_path = plugin_directory / "composer.json"
     if not composer_json_path.exists():
         return {}
@@ -163,7 +171,7 @@ def _load_composer_require(plugin_directory):
         return {}
     return required_packages
 
-def _composer_package_key(package_spec):
+def composer_package_key(package_spec):
     package_spec = (package_spec or "").strip()
     if not package_spec:
         return package_spec
@@ -173,11 +181,18 @@ def _composer_package_key(package_spec):
         return first_token.split(":", 1)[0]
     return first_token
 
-def _composer_require_command(use_lando, package_spec):
+def _composer_require_arguments(package_spec):
+    """Turn `vendor/package ^1.0` into the single argument `vendor/package:^1.0`."""
     package_tokens = package_spec.split()
+    if len(package_tokens) == 2 and ":" not in package_tokens[0]:
+        return [f"{package_tokens[0]}:{package_tokens[1]}"]
+    return package_tokens
+
+def _composer_require_command(use_lando, package_specs):
+    package_arguments = [argument for package_spec in package_specs for argument in _composer_require_arguments(package_spec)]
     if use_lando:
-        return ["lando", "composer", "require"] + package_tokens
-    return ["composer", "require"] + package_tokens
+        return ["lando", "composer", "require"] + package_arguments
+    return ["composer", "require"] + package_arguments
 
 def _build_node_install_commands(packages):
     regular_packages = [package["name"] for package in packages if not package["dev"]]
@@ -209,17 +224,21 @@ def _merge_node_packages(packages):
 
     return [{"name": package_name, "dev": package_dev_flags[package_name]} for package_name in ordered_names]
 
-def _is_blade_requested(php_dependency_inputs):
+def is_blade_requested(php_dependency_inputs):
     for dependency_input in php_dependency_inputs:
         dependency_option, _ = resolve_php_dependency(dependency_input)
         package_name = get_dependency_package(dependency_option)
-        if _composer_package_key(package_name) == BLADE_PACKAGE:
+        if composer_package_key(package_name) == BLADE_PACKAGE:
             return True
     return False
 
-def _install_php_dependencies(plugin_directory, use_lando, php_dependency_inputs):
+def install_php_dependencies(plugin_directory, use_lando, php_dependency_inputs, run):
+    """Install every requested package with a single `composer require`, then run post-install actions."""
     messages = []
     seen_package_keys = set()
+    dependency_options = []
+    packages_to_install = []
+    required_packages = load_composer_require(plugin_directory)
 
     for dependency_input in php_dependency_inputs:
         dependency_option, _ = resolve_php_dependency(dependency_input)
@@ -227,24 +246,28 @@ def _install_php_dependencies(plugin_directory, use_lando, php_dependency_inputs
         if not package_name:
             continue
 
-        package_key = _composer_package_key(package_name)
+        package_key = composer_package_key(package_name)
         if package_key in seen_package_keys:
             continue
         seen_package_keys.add(package_key)
+        dependency_options.append(dependency_option)
 
-        required_packages = _load_composer_require(plugin_directory)
-        if package_key not in required_packages:
-            command = _composer_require_command(use_lando, package_name)
-            subprocess.run(command, cwd=str(plugin_directory), check=True)
-            messages.append(f"Installed `{package_name}`")
-        else:
+        if package_key in required_packages:
             messages.append(f"Kept existing `{package_key}` dependency")
+        else:
+            packages_to_install.append(package_name)
 
+    # One solver run (and one container exec under Lando) for all packages
+    if packages_to_install:
+        run(_composer_require_command(use_lando, packages_to_install))
+        messages.extend(f"Installed `{package_name}`" for package_name in packages_to_install)
+
+    for dependency_option in dependency_options:
         messages.extend(apply_php_post_install_actions(dependency_option, cwd=plugin_directory))
 
     return messages
 
-def _install_node_dependencies(plugin_directory, node_dependency_inputs):
+def install_node_dependencies(plugin_directory, node_dependency_inputs, run):
     messages = []
     dependency_options = []
     packages_to_install = []
@@ -258,7 +281,7 @@ def _install_node_dependencies(plugin_directory, node_dependency_inputs):
     commands = _build_node_install_commands(merged_packages)
 
     for command in commands:
-        subprocess.run(command, cwd=str(plugin_directory), check=True)
+        run(command)
 
     if merged_packages:
         package_display = ", ".join(package["name"] for package in merged_packages)
@@ -269,9 +292,9 @@ def _install_node_dependencies(plugin_directory, node_dependency_inputs):
 
     return messages
 
-def _disable_blade_support(plugin_directory, use_lando):
+def _disable_blade_support(plugin_directory, use_lando, run):
     messages = []
-    required_packages = _load_composer_require(plugin_directory)
+    required_packages = load_composer_require(plugin_directory)
 
     if BLADE_PACKAGE in required_packages:
         command = (
@@ -279,7 +302,7 @@ def _disable_blade_support(plugin_directory, use_lando):
             if use_lando
             else ["composer", "remove", BLADE_PACKAGE]
         )
-        subprocess.run(command, cwd=str(plugin_directory), check=True)
+        run(command)
         messages.append(f"Removed `{BLADE_PACKAGE}`")
     else:
         messages.append(f"`{BLADE_PACKAGE}` was not installed")
@@ -306,6 +329,7 @@ def create_plugin_command(args):
         header_updates,
         php_dependency_inputs,
         node_dependency_inputs,
+        refresh_skeleton,
     ) = _parse_create_args(args)
     wp_root = project.detect_wp_root()
 
@@ -333,8 +357,18 @@ def create_plugin_command(args):
     )
 
     try:
-        subprocess.run(command, cwd=str(target_directory), check=True)
-        rename_plugin("plugin-placeholder", new_name, plugin_directory)
+        skeleton_source = create_skeleton(
+            target_directory,
+            plugin_name,
+            use_lando,
+            lambda skeleton_command, cwd: subprocess.run(skeleton_command, cwd=str(cwd)).returncode == 0,
+            refresh=refresh_skeleton,
+        )
+        if skeleton_source == "cache":
+            print("⚡ Plugin skeleton copied from the local cache")
+        elif skeleton_source == "stale-cache":
+            print("⚠️ composer create-project failed, using the last cached plugin skeleton")
+        rename_plugin("plugin-placeholder", new_name, plugin_directory, progress=print_progress)
         main_plugin_file = find_main_plugin_file(plugin_directory, plugin_name)
         if main_plugin_file:
             headers_updated, header_messages = apply_plugin_header_updates(main_plugin_file, header_updates)
@@ -345,17 +379,33 @@ def create_plugin_command(args):
         else:
             header_messages = []
 
-        blade_requested = _is_blade_requested(php_dependency_inputs)
+        blade_requested = is_blade_requested(php_dependency_inputs)
         php_dependencies = list(php_dependency_inputs)
         if use_blade and not blade_requested:
             php_dependencies.append("bladeone")
 
-        post_create_messages = []
-        post_create_messages.extend(_install_php_dependencies(plugin_directory, use_lando, php_dependencies))
-        post_create_messages.extend(_install_node_dependencies(plugin_directory, node_dependency_inputs))
-
+        # Composer and Node installs run side by side; Composer mutations stay in one chain
+        install_steps = [
+            Step(
+                "composer",
+                action=lambda run: install_php_dependencies(plugin_directory, use_lando, php_dependencies, run),
+            ),
+            Step("node", action=lambda run: install_node_dependencies(plugin_directory, node_dependency_inputs, run)),
+        ]
         if not use_blade and not blade_requested:
-            post_create_messages.extend(_disable_blade_support(plugin_directory, use_lando))
+            install_steps.append(Step(
+                "blade",
+                action=lambda run: _disable_blade_support(plugin_directory, use_lando, run),
+                after=("composer",),
+                lane="composer",
+            ))
+
+        results = run_steps(install_steps, plugin_directory)
+        failed = first_failure(results)
+        if failed:
+            raise failed.error
+
+        post_create_messages = [message for result in results.values() for message in result.messages]
 
         print(f"✅ Plugin created and renamed to: {plugin_name}")
         for header_message in header_messages:
@@ -374,3 +424,6 @@ def create_plugin_command(args):
         failed_command = error.cmd if isinstance(error.cmd, list) else [str(error.cmd)]
         print(f"❌ Command failed with exit code {error.returncode}: {' '.join(failed_command)}")
         sys.exit(error.returncode)
+    except RuntimeError as error:
+        print(f"❌ {error}")
+        sys.exit(1)
@@ -1,6 +1,7 @@
 import re
 from pathlib import Path
 from plubo.generators.functionality import create_functionality
+from plubo.utils import php_source
 
 
 def normalize_slug(value):
@@ -24,27 +25,8 @@ def default_plural(label):
 
 
 def find_method_bounds(content, method_signature):
-    method_start = content.find(method_signature)
-    if method_start < 0:
-        return None
-
-    opening_brace = content.find("{", method_start)
-    if opening_brace < 0:
-        return None
-
-    depth = 1
-    index = opening_brace + 1
-    while index < len(content):
-        char = content[index]
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                return opening_brace + 1, index
-        index += 1
-
-    return None
+    """Return (body_start, body_end) of a method; strings and comments are skipped (see php_source)."""
+    return php_source.find_method_bounds(content, method_signature)
 
 
 def ensure_functionality_file(class_name, template_filename):
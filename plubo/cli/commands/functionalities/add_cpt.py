@@ -1,9 +1,9 @@
 import sys
 from plubo.utils import project
+from plubo.utils.php_source import PhpEditor
 from ._shared import (
     default_plural,
     ensure_functionality_file,
-    find_method_bounds,
     normalize_slug,
     slug_to_label,
 )
@@ -86,6 +86,24 @@ def _build_cpt_block(slug, singular_label, plural_label, text_domain):
     )
 
 
+def cpt_registered(content, slug):
+    return f"register_post_type('{slug}'" in content or f'register_post_type("{slug}"' in content
+
+
+def append_cpt(editor, slug, singular_label, plural_label, text_domain):
+    """Queue the CPT registration at the end of register_post_types(). Returns False if the method is missing."""
+    cpt_block = _build_cpt_block(slug, singular_label, plural_label, text_domain)
+    return editor.append_to_method("register_post_types", cpt_block)
+
+
+def insert_cpt(content, slug, singular_label, plural_label, text_domain):
+    """Return content with the CPT registered in register_post_types(), or None if the method is missing."""
+    editor = PhpEditor(content)
+    if not append_cpt(editor, slug, singular_label, plural_label, text_domain):
+        return None
+    return editor.text()
+
+
 def add_cpt_command(args):
     if not project.detect_plugin_name():
         print("❌ No plugin detected. Run this command from a plugin root.")
@@ -98,27 +116,15 @@ def add_cpt_command(args):
         sys.exit(1)
 
     content = file_path.read_text(encoding="utf-8")
-    if (
-        f"register_post_type('{slug}'" in content
-        or f'register_post_type("{slug}"' in content
-    ):
+    if cpt_registered(content, slug):
         print(f"❌ CPT '{slug}' is already registered in {file_path}")
         sys.exit(1)
 
-    bounds = find_method_bounds(content, "public function register_post_types()")
-    if not bounds:
+    text_domain = project.detect_plugin_name()
+    updated_content = insert_cpt(content, slug, singular_label, plural_label, text_domain)
+    if updated_content is None:
         print(f"❌ Could not find method register_post_types() in {file_path}")
         sys.exit(1)
-
-    text_domain = project.detect_plugin_name()
-    _, body_end = bounds
-    cpt_block = _build_cpt_block(slug, singular_label, plural_label, text_domain)
-    closing_line_start = content.rfind("\n", 0, body_end) + 1
-    closing_indent = content[closing_line_start:body_end]
-    before_closing = content[:closing_line_start]
-    if not before_closing.endswith("\n"):
-        before_closing += "\n"
-    updated_content = before_closing + cpt_block + closing_indent + content[body_end:]
     file_path.write_text(updated_content, encoding="utf-8")
 
     if message:
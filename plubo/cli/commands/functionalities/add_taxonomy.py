@@ -1,9 +1,9 @@
 import sys
 from plubo.utils import project
+from plubo.utils.php_source import PhpEditor
 from ._shared import (
     default_plural,
     ensure_functionality_file,
-    find_method_bounds,
     normalize_slug,
     slug_to_label,
 )
@@ -90,6 +90,34 @@ def _build_taxonomy_block(taxonomy_slug, post_type_slug, singular_label, plural_
     )
 
 
+def taxonomy_registered(content, taxonomy_slug):
+    return (
+        f"register_taxonomy('{taxonomy_slug}'" in content
+        or f'register_taxonomy("{taxonomy_slug}"' in content
+    )
+
+
+def append_taxonomy(editor, taxonomy_slug, post_type_slug, singular_label, plural_label, text_domain, hierarchical):
+    """Queue the taxonomy registration at the end of register_taxonomies(). Returns False if the method is missing."""
+    taxonomy_block = _build_taxonomy_block(
+        taxonomy_slug,
+        post_type_slug,
+        singular_label,
+        plural_label,
+        text_domain,
+        hierarchical,
+    )
+    return editor.append_to_method("register_taxonomies", taxonomy_block)
+
+
+def insert_taxonomy(content, taxonomy_slug, post_type_slug, singular_label, plural_label, text_domain, hierarchical):
+    """Return content with the taxonomy registered in register_taxonomies(), or None if the method is missing."""
+    editor = PhpEditor(content)
+    if not append_taxonomy(editor, taxonomy_slug, post_type_slug, singular_label, plural_label, text_domain, hierarchical):
+        return None
+    return editor.text()
+
+
 def add_taxonomy_command(args):
     if not project.detect_plugin_name():
         print("❌ No plugin detected. Run this command from a plugin root.")
@@ -102,21 +130,13 @@ def add_taxonomy_command(args):
         sys.exit(1)
 
     content = file_path.read_text(encoding="utf-8")
-    if (
-        f"register_taxonomy('{taxonomy_slug}'" in content
-        or f'register_taxonomy("{taxonomy_slug}"' in content
-    ):
+    if taxonomy_registered(content, taxonomy_slug):
         print(f"❌ Taxonomy '{taxonomy_slug}' is already registered in {file_path}")
         sys.exit(1)
 
-    bounds = find_method_bounds(content, "public function register_taxonomies()")
-    if not bounds:
-        print(f"❌ Could not find method register_taxonomies() in {file_path}")
-        sys.exit(1)
-
     text_domain = project.detect_plugin_name()
-    _, body_end = bounds
-    taxonomy_block = _build_taxonomy_block(
+    updated_content = insert_taxonomy(
+        content,
         taxonomy_slug,
         post_type_slug,
         singular_label,
@@ -124,12 +144,9 @@ def add_taxonomy_command(args):
         text_domain,
         hierarchical,
     )
-    closing_line_start = content.rfind("\n", 0, body_end) + 1
-    closing_indent = content[closing_line_start:body_end]
-    before_closing = content[:closing_line_start]
-    if not before_closing.endswith("\n"):
-        before_closing += "\n"
-    updated_content = before_closing + taxonomy_block + closing_indent + content[body_end:]
+    if updated_content is None:
+        print(f"❌ Could not find method register_taxonomies() in {file_path}")
+        sys.exit(1)
     file_path.write_text(updated_content, encoding="utf-8")
 
     if message:
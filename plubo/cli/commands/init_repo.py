@@ -17,10 +17,11 @@ def _resolve_gitlab_namespace_id(namespace, username, token, gitlab_domain):
     if namespace == username:
         return None
 
-    groups = fetch_gitlab_groups(token, gitlab_domain)
-    for group in groups:
-        if group.get("full_path") == namespace:
-            return group.get("id")
+    # Served from the namespace cache; refresh once in case the group is new
+    for refresh in (False, True):
+        for group in fetch_gitlab_groups(token, gitlab_domain, refresh=refresh):
+            if group.get("full_path") == namespace:
+                return group.get("id")
 
     return None
 
@@ -32,18 +33,17 @@ def init_repo_command(args):
     platform = args[0].lower() if args else "github"
     namespace_arg = args[1] if len(args) == 2 else None
 
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    context = project.get_context()
+    if not context.wp_root:
         print("❌ No WordPress installation detected. Aborting.")
         sys.exit(1)
 
-    plugin_name = project.detect_plugin_name()
-    if not plugin_name:
+    if not context.plugin_slug:
         print("❌ No plugin detected. Aborting.")
         sys.exit(1)
 
-    plugin_name = plugin_name.lower().replace(" ", "-")
-    plugin_directory = wp_root / "wp-content/plugins" / plugin_name
+    plugin_name = context.plugin_slug.lower().replace(" ", "-")
+    plugin_directory = context.plugin_root
 
     try:
         if platform == "github":
@@ -1,5 +1,6 @@
 import re
 from pathlib import Path
+from plubo.utils.plugin_header import iter_plugin_headers
 
 HEADER_OPTION_TO_LABEL = {
     "--plugin-name": "Plugin Name",
@@ -20,13 +21,8 @@ def find_main_plugin_file(plugin_directory, plugin_slug=None):
         if expected_file.exists():
             return expected_file
 
-    for php_file in plugin_directory.glob("*.php"):
-        try:
-            content = php_file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            continue
-
-        if "Plugin Name:" in content and "Text Domain:" in content:
+    for php_file, header in iter_plugin_headers(plugin_directory):
+        if header.is_plugin and header.text_domain:
             return php_file
 
     return None
@@ -1,111 +1,134 @@
 import sys
-import re
 import subprocess
 from plubo.utils import project
 from plubo.settings.Config import Config
 from plubo.git.github import create_github_release
 from plubo.git.git_utils import get_git_remote_repo, clear_git_lock
+from plubo.utils.dist_archive import build_dist_archive, dist_archive_path
+from plubo.git.release import (
+    StageTimer,
+    bump_version,
+    commit_command,
+    current_branch,
+    push_release,
+    tag_command,
+)
 
 
 def _run_git(command, cwd):
     subprocess.run(command, cwd=str(cwd), check=True)
 
+USAGE = "Usage: plubo release <version> [--no-github-release] [--zip]"
+OPTIONS = {"--no-github-release", "--zip"}
+
+def _print_timings(timer):
+    print("⏱️ Release timings:")
+    for line in timer.summary():
+        print(f"   {line}")
+
 def prepare_release_command(args):
     if not args:
-        print("Usage: plubo release <version> [--no-github-release]")
+        print(USAGE)
         sys.exit(1)
 
     release = args[0]
     options = set(args[1:])
-    invalid_options = [option for option in options if option != "--no-github-release"]
+    invalid_options = [option for option in options if option not in OPTIONS]
 
     if invalid_options:
-        print("Usage: plubo release <version> [--no-github-release]")
+        print(USAGE)
         sys.exit(1)
 
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    context = project.get_context()
+    if not context.wp_root:
         print("❌ No WordPress installation detected. Aborting.")
         sys.exit(1)
 
-    plugin_name = project.detect_plugin_name()
-    if not plugin_name:
+    if not context.plugin_slug:
         print("❌ No plugin detected. Aborting.")
         sys.exit(1)
 
-    plugin_name = plugin_name.lower().replace(" ", "-")
-    plugin_root = wp_root / "wp-content/plugins" / plugin_name
+    plugin_name = context.plugin_slug.lower().replace(" ", "-")
+    plugin_root = context.plugin_root
     main_plugin_file = plugin_root / f"{plugin_name}.php"
 
     if not main_plugin_file.exists():
         print(f"❌ Main plugin file not found: {main_plugin_file}")
         sys.exit(1)
 
+    branch = current_branch(plugin_root)
+    if not branch:
+        print("❌ HEAD is detached; check out the branch to release from. Aborting.")
+        sys.exit(1)
+
     plugin_constant = plugin_name.upper().replace("-", "_") + "_VERSION"
+    timer = StageTimer()
 
-    content = main_plugin_file.read_text(encoding="utf-8")
-    new_content, header_count = re.subn(
-        r"(Version:\s*)([\d\.]+)",
-        lambda match: match.group(1) + release,
-        content,
-        flags=re.IGNORECASE
-    )
-
-    constant_pattern = rf"(define\(\s*['\"]{re.escape(plugin_constant)}['\"]\s*,\s*['\"])([\d\.]+)(['\"]\s*\))"
-    new_content, constant_count = re.subn(
-        constant_pattern,
-        lambda match: match.group(1) + release + match.group(3),
-        new_content
-    )
+    with timer.stage("version bump"):
+        header_count, constant_count = bump_version(main_plugin_file, plugin_constant, release)
 
     if header_count == 0:
         print("⚠️ Plugin header version not found; no header update made.")
     if constant_count == 0:
         print(f"⚠️ Version constant '{plugin_constant}' not found; no constant update made.")
 
-    main_plugin_file.write_text(new_content, encoding="utf-8")
     print(f"✅ Updated version references in {main_plugin_file}")
 
     clear_git_lock(plugin_root)
 
     try:
-        relative_main_file = str(main_plugin_file.relative_to(plugin_root))
-        _run_git(["git", "add", relative_main_file], plugin_root)
-        _run_git(["git", "commit", "-m", f"Release version {release}"], plugin_root)
-        _run_git(["git", "tag", release], plugin_root)
-
-        branch = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=str(plugin_root),
-            capture_output=True,
-            text=True,
-            check=True
-        ).stdout.strip()
-        _run_git(["git", "push", "origin", branch], plugin_root)
-        _run_git(["git", "push", "origin", release], plugin_root)
+        relative_main_file = main_plugin_file.relative_to(plugin_root)
+        with timer.stage("commit"):
+            _run_git(commit_command(f"Release version {release}", [relative_main_file]), plugin_root)
+        with timer.stage("tag"):
+            _run_git(tag_command(release), plugin_root)
+
+        if "--zip" in options:
+            # Built before pushing so a failed archive leaves the remote untouched
+            with timer.stage("zip"):
+                report = build_dist_archive(plugin_root, dist_archive_path(plugin_root, plugin_name, release), plugin_name)
+            print(f"✅ Built {report.path} ({report.files} files, {report.reused} reused, {report.size} bytes)")
+            print(f"   SHA-256 manifest: {report.manifest_path}")
+
+        with timer.stage("push"):
+            push_release(plugin_root, branch, release)
         print(f"✅ Release commit, tag, and push completed on branch '{branch}'.")
+    except (OSError, ValueError) as error:
+        print(f"❌ Building the release archive failed: {error}")
+        _print_timings(timer)
+        sys.exit(1)
     except subprocess.CalledProcessError as error:
+        if error.stderr:
+            print(error.stderr.rstrip())
         print(f"❌ Git operation failed with exit code {error.returncode}.")
+        _print_timings(timer)
         sys.exit(error.returncode)
 
     if "--no-github-release" in options:
         print("ℹ️ Skipped GitHub release creation.")
+        _print_timings(timer)
         return
 
     token = Config.get("github", "token")
     repo = get_git_remote_repo(plugin_root)
     if not token or not repo:
         print("ℹ️ Skipped GitHub release: missing GitHub token or non-GitHub remote.")
+        _print_timings(timer)
         return
 
     try:
-        success, payload = create_github_release(release, repo, token)
+        with timer.stage("github release"):
+            success, payload = create_github_release(release, repo, token)
         if success:
             print(f"✅ GitHub release created for tag {release}.")
         else:
             message = payload.get("message", "unknown error") if isinstance(payload, dict) else str(payload)
             print(f"❌ GitHub release failed: {message}")
+            _print_timings(timer)
             sys.exit(1)
     except Exception as error:
         print(f"❌ GitHub release failed: {error}")
+        _print_timings(timer)
         sys.exit(1)
+
+    _print_timings(timer)
@@ -1,18 +1,96 @@
 # plubo/cli/commands/rename_plugin.py
 import sys
-from plubo.generators.plugin import rename_plugin
+from pathlib import Path
+from plubo.generators.plugin import RENAME_PATTERNS, rename_plugin, undo_rename
 
-def rename_command(args):
-    if len(args) != 2:
-        print("Usage: plubo rename <old_name> <new_name>")
+USAGE = (
+    "Usage: plubo rename <old_name> <new_name> "
+    "[--glob <pattern>]... [--jobs <n>] [--distignore]\n"
+    "       plubo rename --undo"
+)
+
+
+def _parse_args(args):
+    names = []
+    patterns = []
+    workers = None
+    ignore_files = [".gitignore"]
+    index = 0
+
+    while index < len(args):
+        arg = args[index]
+        if arg in {"--glob", "--jobs"}:
+            if index + 1 >= len(args):
+                print(f"❌ Missing value for option: {arg}")
+                print(USAGE)
+                sys.exit(1)
+            value = args[index + 1].strip()
+            if arg == "--glob":
+                patterns.append(value)
+            elif value.isdigit() and int(value) > 0:
+                workers = int(value)
+            else:
+                print(f"❌ Invalid value for --jobs: {value}")
+                sys.exit(1)
+            index += 2
+            continue
+        if arg == "--distignore":
+            ignore_files.append(".distignore")
+            index += 1
+            continue
+        if arg.startswith("--"):
+            print(f"❌ Unknown option: {arg}")
+            print(USAGE)
+            sys.exit(1)
+        names.append(arg)
+        index += 1
+
+    if len(names) != 2:
+        print(USAGE)
+        print(f"Default globs: {' '.join(RENAME_PATTERNS)}")
+        sys.exit(1)
+
+    return names[0], names[1], patterns or None, workers, tuple(ignore_files)
+
+
+def print_progress(done, total):
+    """Plain-terminal progress counter; only the final count is printed when not on a TTY."""
+    if sys.stdout.isatty():
+        print(f"\r🔄 Renaming files: {done}/{total}", end="" if done < total else "\n", flush=True)
+    elif done == total:
+        print(f"🔄 Processed {total} files")
+
+
+def undo_command():
+    try:
+        plugin_root = undo_rename()
+        print(f"✅ Last rename undone, plugin restored at {plugin_root}")
+        sys.exit(0)
+    except Exception as error:
+        print(f"❌ Undo failed: {error}")
         sys.exit(1)
-    
-    old_name = args[0]
-    new_name = args[1]
+
+
+def rename_command(args):
+    if args == ["--undo"]:
+        undo_command()
+
+    old_name, new_name, patterns, workers, ignore_files = _parse_args(args)
+    plugin_root = Path.cwd()
     try:
-        rename_plugin(old_name, new_name)
-        print(f"✅ Plugin renamed from '{old_name}' to '{new_name}'.")
+        match_counts = rename_plugin(
+            old_name,
+            new_name,
+            plugin_root,
+            patterns=patterns,
+            ignore_files=ignore_files,
+            workers=workers,
+            progress=print_progress,
+        )
+        for file_path, count in sorted(match_counts.items()):
+            print(f"  {file_path.relative_to(plugin_root)}: {count} replacement(s)")
+        print(f"✅ Plugin renamed from '{old_name}' to '{new_name}' ({len(match_counts)} file(s) changed).")
         sys.exit(0)
     except Exception as error:
-        print(f"❌ Rename failed: {error}")
+        print(f"❌ Rename failed, changes rolled back: {error}")
         sys.exit(1)
@@ -1,5 +1,4 @@
 import sys
-from pathlib import Path
 from plubo.cli.commands.plugin_headers import HEADER_OPTION_TO_LABEL, apply_plugin_header_updates, find_main_plugin_file
 from plubo.utils import project
 
@@ -65,9 +64,8 @@ def _parse_set_header_args(args):
 
 def set_plugin_headers_command(args):
     header_updates = _parse_set_header_args(args)
-    plugin_directory = Path.cwd()
-    plugin_slug = project.detect_plugin_name()
-    main_plugin_file = find_main_plugin_file(plugin_directory, plugin_slug)
+    context = project.get_context()
+    main_plugin_file = find_main_plugin_file(context.path, context.plugin_slug)
 
     if not main_plugin_file:
         print("❌ No plugin header file found. Run this command from your plugin root.")
@@ -0,0 +1,336 @@
+"""Optional `pb-cli serve` daemon and the thin client used by the dispatcher.
+
+The daemon imports every command once, keeps the project contexts, the
+parsed config and the template registry warm, and listens on a Unix
+socket. Each request forks a child that inherits that warm state, takes
+over the client's stdin, stdout and stderr (passed over the socket) and
+runs the command as if it had been started in the client's directory,
+environment and umask. The exit code is sent back to the client.
+
+When no daemon is listening, or it was started with different pb-cli
+code or PB_CLI_* settings, the client returns None and the command runs
+in-process as usual. Set PB_CLI_NO_DAEMON=1 to never use the daemon.
+"""
+import hashlib
+import json
+import os
+import signal
+import socket
+import sys
+import traceback
+
+SOCKET_ENV = "PB_CLI_SOCKET"
+DISABLE_ENV = "PB_CLI_NO_DAEMON"
+MAX_MESSAGE = 1024 * 1024
+USAGE = "Usage: plubo serve [--stop] [--socket <path>]"
+
+
+def socket_path():
+    """$PB_CLI_SOCKET, or a per-user socket in the runtime (or cache) directory."""
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return configured
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if not base:
+        from plubo.utils.files import cache_dir
+        base = str(cache_dir("daemon"))
+    return os.path.join(base, f"pb-cli-{os.getuid()}.sock")
+
+
+def _code_digest():
+    """Hash of the code the daemon runs.
+
+    A frozen build is identified by its executable (a PyInstaller --onefile
+    binary unpacks to a new temporary directory on every run); otherwise by
+    the contents of the package's files, wherever they are installed.
+    """
+    digest = hashlib.sha256()
+    if getattr(sys, "frozen", False):
+        stat = os.stat(sys.executable)
+        digest.update(f"{os.path.abspath(sys.executable)}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sources = []
+    for directory, subdirectories, files in os.walk(package_dir):
+        subdirectories[:] = [name for name in subdirectories if name != "__pycache__"]
+        sources.extend(os.path.join(directory, name) for name in files if not name.endswith((".pyc", ".pyo")))
+    for source in sorted(sources):
+        digest.update(os.path.relpath(source, package_dir).encode("utf-8") + b"\0")
+        with open(source, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def fingerprint(environ=None):
+    """Identify the code and the settings baked in at import time (PB_CLI_* variables, HOME)."""
+    from plubo import version
+
+    environ = os.environ if environ is None else environ
+    settings = sorted(
+        (key, value) for key, value in environ.items()
+        if (key.startswith("PB_CLI_") or key in {"HOME", "XDG_CACHE_HOME"})
+        and key not in {SOCKET_ENV, DISABLE_ENV}
+    )
+    payload = json.dumps([version.__version__, _code_digest(), settings])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _supported():
+    return hasattr(os, "fork") and hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def _read_message(connection, first_chunk=b""):
+    data = first_chunk
+    while b"\n" not in data:
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_MESSAGE:
+            raise ValueError("Request too large")
+    return json.loads(data.split(b"\n", 1)[0] or b"null")
+
+
+def _send_message(connection, message):
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+# --- Client -----------------------------------------------------------------
+
+def run_remote(argv):
+    """Run a command in the daemon. Returns its exit code, or None to run in-process."""
+    if os.environ.get(DISABLE_ENV) or not _supported():
+        return None
+    path = socket_path()
+    if not os.path.exists(path):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+        umask = os.umask(0)  # Can only be queried by setting it
+        os.umask(umask)
+        request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ), "umask": umask, "fingerprint": fingerprint()}
+        sys.stdout.flush()
+        sys.stderr.flush()
+        socket.send_fds(client, [json.dumps(request).encode("utf-8") + b"\n"], [0, 1, 2])
+        reader = client.makefile("rb")
+    except OSError:
+        client.close()
+        return None
+
+    pid = None
+    try:
+        while True:
+            try:
+                line = reader.readline()
+                if not line:
+                    print("❌ pb-cli daemon closed the connection.", file=sys.stderr)
+                    return 1
+                message = json.loads(line)
+                if "mismatch" in message:
+                    return None
+                if "pid" in message:
+                    pid = message["pid"]
+                if "exit" in message:
+                    return message["exit"]
+            except KeyboardInterrupt:
+                # Forward Ctrl-C to the command and wait for it to finish
+                if pid:
+                    os.kill(pid, signal.SIGINT)
+                else:
+                    return 130
+    finally:
+        reader.close()
+        client.close()
+
+
+# --- Server -----------------------------------------------------------------
+
+def _warm_up():
+    """Import every command and load the shared caches once, before forking."""
+    from plubo.cli.dispatcher import COMMANDS, load_command
+    from plubo.settings.Config import Config
+    from plubo.utils import http  # noqa: F401 - keeps requests imported
+    from plubo.utils.templates import get_registry
+
+    for name in COMMANDS:
+        try:
+            load_command(name)
+        except Exception:
+            pass
+    Config._load_config()
+    get_registry().load_all()
+
+
+def _redirect_stdio():
+    """Rebind sys.std* to the client's descriptors (already dup'ed onto 0, 1, 2)."""
+    sys.stdin = open(0, "r", encoding="utf-8", errors="replace", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1 if os.isatty(1) else -1)
+    sys.stderr = open(2, "w", encoding="utf-8", errors="replace", closefd=False, buffering=1)
+
+
+def _run_child(connection, request, fds):
+    from plubo.cli.dispatcher import dispatch
+    from plubo.utils import files
+
+    exit_code = 0
+    try:
+        for target, fd in enumerate(fds[:3]):
+            os.dup2(fd, target)
+        for fd in fds:
+            os.close(fd)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        _redirect_stdio()
+        os.chdir(request["cwd"])
+        if isinstance(request.get("umask"), int):
+            os.umask(request["umask"])
+            files._UMASK = request["umask"]  # Cached at import time in the daemon
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = ["pb-cli", *request["argv"]]
+        _send_message(connection, {"pid": os.getpid()})
+        dispatch(remote=False)
+    except SystemExit as exit_request:
+        if isinstance(exit_request.code, int):
+            exit_code = exit_request.code
+        elif exit_request.code is not None:
+            print(exit_request.code, file=sys.stderr)
+            exit_code = 1
+    except KeyboardInterrupt:
+        exit_code = 130
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        try:
+            _send_message(connection, {"exit": exit_code})
+        except OSError:
+            pass
+        os._exit(0)
+
+
+def _handle(connection, server_fingerprint):
+    """Read one request in the parent and fork a child to run it. Returns False to stop."""
+    from plubo.settings.Config import Config
+    from plubo.utils import project
+
+    data, fds, _flags, _address = socket.recv_fds(connection, 65536, 3)
+    try:
+        request = _read_message(connection, data)
+        if not isinstance(request, dict):
+            return True
+        if request.get("stop"):
+            _send_message(connection, {"exit": 0})
+            return False
+        if request.get("fingerprint") != server_fingerprint or len(fds) != 3:
+            _send_message(connection, {"mismatch": True})
+            return True
+
+        # Refresh the caches the child inherits (both reload only on change)
+        try:
+            project.get_context(request["cwd"])
+        except OSError:
+            pass
+        Config._load_config()
+
+        if os.fork() == 0:
+            _run_child(connection, request, fds)
+    finally:
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    return True
+
+
+def _stop(path):
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+        _send_message(client, {"stop": True})
+        client.recv(1024)
+        return True
+    except OSError:
+        return False
+    finally:
+        client.close()
+
+
+def serve_command(args):
+    if not _supported():
+        print("❌ pb-cli serve needs Unix sockets and fork(); commands keep running in-process.")
+        sys.exit(1)
+
+    path = None
+    stop = False
+    index = 0
+    while index < len(args):
+        if args[index] == "--stop":
+            stop = True
+        elif args[index] == "--socket" and index + 1 < len(args):
+            path = args[index + 1]
+            index += 1
+        else:
+            print(USAGE)
+            sys.exit(1)
+        index += 1
+
+    path = path or socket_path()
+    if stop:
+        if _stop(path):
+            print(f"✅ Stopped pb-cli daemon on {path}")
+            return
+        print(f"ℹ️ No pb-cli daemon listening on {path}")
+        sys.exit(1)
+
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            print(f"❌ A pb-cli daemon is already listening on {path}")
+            sys.exit(1)
+        except OSError:
+            os.remove(path)  # Stale socket from a daemon that did not shut down cleanly
+        finally:
+            probe.close()
+
+    _warm_up()
+    server_fingerprint = fingerprint()
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)  # Children are never waited for
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous_umask = os.umask(0o177)  # Socket only accessible by the current user
+    try:
+        server.bind(path)
+    finally:
+        os.umask(previous_umask)
+    server.listen(16)
+    print(f"✅ pb-cli daemon listening on {path} (stop with `pb-cli serve --stop`)")
+    sys.stdout.flush()
+
+    try:
+        running = True
+        while running:
+            connection, _address = server.accept()
+            try:
+                running = _handle(connection, server_fingerprint)
+            except (OSError, ValueError) as error:
+                print(f"⚠️ Bad request: {error}", file=sys.stderr)
+            finally:
+                connection.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.remove(path)
@@ -1,48 +1,49 @@
 # plubo/cli/dispatcher.py
 import sys
-from plubo.cli.commands import (
-    add_component,
-    add_entity,
-    add_functionality,
-    add_node_dependency,
-    add_php_dependency,
-    check_dependencies,
-    create_plugin,
-    functionalities,
-    init_repo,
-    prepare_release,
-    rename_plugin,
-    set_plugin_headers,
-    version,
-)
-import curses
+from importlib import import_module
 
+# Commands are registered as "module:function" paths and only imported when
+# dispatched, so `pb-cli version` does not pay for requests, curses or the
+# generators pulled in by heavier commands.
 COMMANDS = {
-    'component': add_component.add_component_command,
-    'entity': add_entity.add_entity_command,
-    'functionality': add_functionality.add_functionality_command,
-    'node-dep': add_node_dependency.add_node_dependency_command,
-    'php-dep': add_php_dependency.add_php_dependency_command,
-    'check-dep': check_dependencies.check_dependencies_command,
-    'create': create_plugin.create_plugin_command,
-    'functionalities': functionalities.functionalities_command,
-    'init-repo': init_repo.init_repo_command,
-    'release': prepare_release.prepare_release_command,
-    'rename': rename_plugin.rename_command,
-    'headers': set_plugin_headers.set_plugin_headers_command,
-    'version': version.version_command,
+    'component': 'plubo.cli.commands.add_component:add_component_command',
+    'entity': 'plubo.cli.commands.add_entity:add_entity_command',
+    'functionality': 'plubo.cli.commands.add_functionality:add_functionality_command',
+    'node-dep': 'plubo.cli.commands.add_node_dependency:add_node_dependency_command',
+    'php-dep': 'plubo.cli.commands.add_php_dependency:add_php_dependency_command',
+    'apply': 'plubo.cli.commands.apply_manifest:apply_command',
+    'build': 'plubo.cli.commands.build_assets:build_command',
+    'check-dep': 'plubo.cli.commands.check_dependencies:check_dependencies_command',
+    'create': 'plubo.cli.commands.create_plugin:create_plugin_command',
+    'functionalities': 'plubo.cli.commands.functionalities:functionalities_command',
+    'init-repo': 'plubo.cli.commands.init_repo:init_repo_command',
+    'release': 'plubo.cli.commands.prepare_release:prepare_release_command',
+    'rename': 'plubo.cli.commands.rename_plugin:rename_command',
+    'serve': 'plubo.cli.daemon:serve_command',
+    'headers': 'plubo.cli.commands.set_plugin_headers:set_plugin_headers_command',
+    'version': 'plubo.cli.commands.version:version_command',
 }
 
+def load_command(command_name):
+    """Import the module backing a command and return its entry function."""
+    target = COMMANDS.get(command_name)
+    if not target:
+        return None
+
+    module_path, function_name = target.split(":", 1)
+    return getattr(import_module(module_path), function_name)
+
 def _print_usage():
     print("Usage: pb-cli <command> [args]")
     print("Available commands:", ", ".join(COMMANDS.keys()))
 
 
-def dispatch(menu=None):
+def dispatch(menu=None, remote=True):
     if len(sys.argv) < 2:
         # In interactive shells, open the menu. In non-TTY (e.g. Docker entrypoint),
         # print usage instead of failing with curses.
         if menu and sys.stdin.isatty() and sys.stdout.isatty():
+            import curses
             curses.wrapper(menu)
             return
         _print_usage()
@@ -53,7 +54,15 @@ def dispatch(menu=None):
         sys.exit(0)
 
     command_name = sys.argv[1]
-    command_func = COMMANDS.get(command_name)
+
+    # Hand the command to a running `pb-cli serve` daemon when there is one
+    if remote and command_name != "serve":
+        from plubo.cli.daemon import run_remote
+        exit_code = run_remote(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    command_func = load_command(command_name)
     if not command_func:
         print(f"Unknown command: {command_name}")
         _print_usage()
@@ -2,9 +2,8 @@ import os
 import curses
 from pathlib import Path
 from plubo.utils import project, interface
+from plubo.utils.templates import TEMPLATES_DIR, render_template
 
-# Define the absolute path to the templates directory (sibling folder)
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"  # Move up one level to reach sibling
 
 def add_component(stdscr):
     """Main function to handle component creation within the curses menu."""
@@ -28,6 +27,12 @@ def add_component(stdscr):
             
     stdscr.getch()  # Waits for a key press before returning
 
+
+def component_class_name(component_name):
+    """PascalCase class name for a hyphenated component name."""
+    return ''.join(word.capitalize() for word in component_name.split('-'))
+
+
 def create_component(component_name):
     """Creates a new component file in the Components directory with the given name."""
 
@@ -37,30 +42,27 @@ def create_component(component_name):
     template_file = TEMPLATES_DIR / "Component.php"  # Path to the template file
 
     # Convert component name to PascalCase
-    component_class_name = ''.join(word.capitalize() for word in component_name.split('-'))
+    class_name = component_class_name(component_name)
 
     # Define file path
-    component_file = components_dir / f"{component_class_name}.php"
+    component_file = components_dir / f"{class_name}.php"
 
     # Ensure the Components directory exists
     components_dir.mkdir(parents=True, exist_ok=True)
 
     # Check if the component file already exists
     if component_file.exists():
-        return False, f"Component '{component_class_name}' already exists at {component_file}"
+        return False, f"Component '{class_name}' already exists at {component_file}"
 
-    # Ensure template file exists
-    if not template_file.exists():
+    # Render the template (parsed once per process)
+    plugin_name = project.get_context(plugin_root).namespace  # PHP namespace of the plugin
+    try:
+        php_code = render_template("Component.php", PluginPlaceholder=plugin_name, ComponentName=class_name)
+    except FileNotFoundError:
         return False, f"❌ Template file '{template_file}' not found."
-
-    # Read the template
-    with template_file.open("r", encoding="utf-8") as f:
-        php_template = f.read()
-
-    # Replace placeholders
-    plugin_name = ''.join(word.capitalize() for word in project.detect_plugin_name().split('-'))  # Get actual plugin name
-    php_code = php_template.replace("PluginPlaceholder", plugin_name).replace("ComponentName", component_class_name)
+    except ValueError as error:
+        return False, f"❌ {error}"
 
     # Write the component file
     component_file.write_text(php_code, encoding="utf-8")
-    return True, f"Component '{component_class_name}' created successfully at {component_file}"
+    return True, f"Component '{class_name}' created successfully at {component_file}"
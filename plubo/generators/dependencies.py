@@ -2,7 +2,13 @@ import json
 import os
 import subprocess
 import curses
-from plubo.utils import interface
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from plubo.utils import interface, lockfiles, packagist
+from plubo.utils.registry import RegistrySnapshot
+from plubo.utils.files import atomic_write_text, cache_dir, sha256_bytes
+from plubo.settings.Config import Config
 from packaging import version as packaging_version
 
 def get_composer_dependencies(composer_file="composer.json"):
@@ -22,56 +28,33 @@ def get_composer_dependencies(composer_file="composer.json"):
 
 def get_latest_composer_version(package_name):
     """
-    Uses 'composer show --all' to get the list of available versions for a package.
-    Filters out non-stable versions (like dev-main) and returns the highest stable version.
+    Returns the highest stable version of a package from Packagist metadata
+    (cached on disk, see plubo.utils.packagist), falling back to `composer show -l`
+    for packages Packagist does not know. None when neither knows it.
     """
-    try:
-        result = subprocess.run(
-            ["composer", "show", "--all", package_name],
-            capture_output=True, text=True, check=True
-        )
-        versions = []
-        for line in result.stdout.splitlines():
-            if line.startswith("versions :"):
-                versions_line = line.split(":", 1)[1].strip()
-                # Remove asterisks and split by comma
-                raw_versions = [v.strip(" *") for v in versions_line.split(",")]
-                # Filter versions that appear to be stable (start with a digit)
-                versions = [v for v in raw_versions if v and v[0].isdigit()]
-                break
-
-        if versions:
-            # Sort versions using packaging.version for proper semantic versioning comparison
-            sorted_versions = sorted(versions, key=lambda v: packaging_version.parse(v))
-            return sorted_versions[-1]
-        return None
-    except subprocess.CalledProcessError:
-        return None
+    latest = packagist.latest_stable_versions([package_name]).get(package_name)
+    return latest if latest is not None else packagist.composer_latest_version(package_name)
 
-def check_composer_dependencies():
-    """
-    Checks direct Composer dependencies for outdated versions using
-    installed versions reported by Composer.
-    Returns a dict where keys are package names and values are a dict with
-    'current' and 'latest' version information.
-    """
+def _composer_outdated_probe(cwd=None):
+    """Run `composer outdated`; returns the outdated dict, or None when Composer could not answer."""
     try:
         result = subprocess.run(
             ["composer", "outdated", "--direct", "--format=json"],
             capture_output=True,
             text=True,
             check=False,
+            cwd=str(cwd) if cwd else None,
         )
     except Exception:
-        return {}
+        return None
 
     if result.returncode not in (0, 1):
-        return {}
+        return None
 
     try:
         data = json.loads(result.stdout) if result.stdout else {}
     except json.JSONDecodeError:
-        return {}
+        return None
 
     outdated = {}
     for package in data.get("installed", []):
@@ -83,20 +66,28 @@ def check_composer_dependencies():
 
     return outdated
 
-def get_yarn_outdated():
+def check_composer_dependencies(cwd=None):
     """
-    Uses 'yarn outdated --json' to get outdated packages from package.json.
-    Returns a dictionary mapping package names to a dict with 'current' and 'latest' versions.
-    This version uses check=False so that non-zero exit codes (which indicate outdated packages)
-    do not cause an exception.
+    Checks direct Composer dependencies for outdated versions using
+    installed versions reported by Composer.
+    Returns a dict where keys are package names and values are a dict with
+    'current' and 'latest' version information.
     """
+    return _composer_outdated_probe(cwd) or {}
+
+def _yarn_outdated_probe(cwd=None):
+    """Run `yarn outdated`; returns the outdated dict, or None when Yarn could not answer."""
     try:
         result = subprocess.run(
             ["yarn", "outdated", "--json"],
-            capture_output=True, text=True, check=False
+            capture_output=True, text=True, check=False, cwd=str(cwd) if cwd else None
         )
     except Exception as e:
-        return {}
+        return None
+
+    # yarn outdated exits with 1 when something is outdated
+    if result.returncode not in (0, 1):
+        return None
 
     outdated = {}
     # Yarn outputs multiple JSON objects (one per line)
@@ -125,47 +116,274 @@ def get_yarn_outdated():
                     outdated[package] = {"current": current, "latest": latest}
     return outdated
 
+def get_yarn_outdated(cwd=None):
+    """
+    Uses 'yarn outdated --json' to get outdated packages from package.json.
+    Returns a dictionary mapping package names to a dict with 'current' and 'latest' versions.
+    This version uses check=False so that non-zero exit codes (which indicate outdated packages)
+    do not cause an exception.
+    """
+    return _yarn_outdated_probe(cwd) or {}
+
+def _is_release(version):
+    """False for branch installs (`dev-main`, `1.x-dev`), which `composer outdated` does not compare either."""
+    return not (version.startswith("dev-") or version.endswith("-dev"))
+
+def _is_newer(latest, current):
+    if not (_is_release(latest) and _is_release(current)):
+        return False
+    try:
+        return packaging_version.parse(latest.lstrip("v")) > packaging_version.parse(current.lstrip("v"))
+    except packaging_version.InvalidVersion:
+        return False  # Not comparable
+
+# (snapshot ecosystem, installed-version reader, outdated probe) per package manager
+ECOSYSTEMS = (
+    ("composer", lockfiles.composer_installed_versions, _composer_outdated_probe),
+    ("npm", lockfiles.node_installed_versions, _yarn_outdated_probe),
+)
+# Batched registry lookups tried before falling back to the probes
+BATCH_RESOLVERS = {
+    "composer": packagist.latest_stable_versions,
+}
+DEFAULT_CHECK_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+def _compare(installed, snapshot, local_latest=None):
+    report = {}
+    for name, current in installed.items():
+        latest = snapshot.latest(name) or (local_latest or {}).get(name)
+        if latest and _is_newer(latest, current):
+            report[name] = {"current": current, "latest": latest}
+    return report
+
+def _probe_cover(needed):
+    """
+    Pick few projects whose probes cover every needed package (greedy set cover),
+    so a package shared by many plugins is only looked up once.
+    Returns {project_dir: packages it is responsible for}.
+    """
+    uncovered = set().union(*needed.values()) if needed else set()
+    chosen = {}
+    while uncovered:
+        project_dir = max(needed, key=lambda candidate: len(needed[candidate] & uncovered))
+        chosen[project_dir] = needed[project_dir] & uncovered
+        uncovered -= chosen[project_dir]
+    return chosen
+
+def _still_missing(needed, snapshot, unprobed):
+    """Names of the unprobed projects in `needed` that no probe of this run answered."""
+    remaining = {}
+    for project_dir, names in needed.items():
+        if not unprobed(project_dir):
+            continue
+        names = {name for name in names if name not in snapshot.updated}
+        if names:
+            remaining[project_dir] = names
+    return remaining
+
+def fleet_dependency_report(project_dirs, refresh=False, workers=None, ecosystems=ECOSYSTEMS):
+    """
+    Returns {project_dir: (composer_outdated, yarn_outdated)} for many projects
+    (one entry per item of `ecosystems`).
+    Lock files are read in parallel, then `composer outdated` / `yarn outdated`
+    only run for the smallest set of projects covering the packages missing
+    from the registry snapshots (every package when `refresh` is set), on a
+    bounded worker pool.
+    """
+    project_dirs = [Path(project_dir) for project_dir in project_dirs]
+    with ThreadPoolExecutor(max_workers=workers or DEFAULT_CHECK_WORKERS) as executor:
+        installed = dict(zip(project_dirs, executor.map(
+            lambda project_dir: [reader(project_dir) for _, reader, _ in ecosystems], project_dirs
+        )))
+
+        snapshots = []
+        pending = []
+        for ecosystem, _, _ in ecosystems:
+            index = len(snapshots)
+            snapshot = RegistrySnapshot(ecosystem)
+            snapshots.append(snapshot)
+            needed = {}
+            for project_dir in project_dirs:
+                names = set(installed[project_dir][index])
+                names = names if refresh else set(snapshot.missing(names))
+                if names:
+                    needed[project_dir] = names
+
+            # One batched metadata pass answers most public packages without any probe
+            if needed and not refresh and ecosystem in BATCH_RESOLVERS:
+                resolved = {
+                    name: latest
+                    for name, latest in BATCH_RESOLVERS[ecosystem](set().union(*needed.values())).items()
+                    if latest
+                }
+                snapshot.update(resolved)
+                needed = {
+                    project_dir: names - resolved.keys()
+                    for project_dir, names in needed.items()
+                    if names - resolved.keys()
+                }
+            pending.append(needed)
+
+        # Packages a probe does not list are up to date at the version installed in the
+        # probed project. That only holds for that project, so it is kept out of the
+        # shared snapshot; other projects still missing them are probed in a later round.
+        local_latest = [{} for _ in ecosystems]
+        probed = set()
+        while any(pending):
+            probes = {}
+            for index, needed in enumerate(pending):
+                for project_dir, names in _probe_cover(needed).items():
+                    probes[executor.submit(ecosystems[index][2], project_dir)] = (index, project_dir, names)
+                    probed.add((index, project_dir))
+
+            for future, (index, project_dir, names) in probes.items():
+                outdated = future.result()
+                if outdated is None:
+                    continue
+                listed = {
+                    name: outdated[name]["latest"]
+                    for name in names
+                    if outdated.get(name, {}).get("latest")
+                }
+                snapshots[index].update(listed)
+                project_installed = installed[project_dir][index]
+                local_latest[index][project_dir] = {
+                    name: project_installed[name] for name in names if name not in listed
+                }
+
+            pending = [
+                _still_missing(needed, snapshots[index], lambda project_dir: (index, project_dir) not in probed)
+                for index, needed in enumerate(pending)
+            ]
+
+    for snapshot in snapshots:
+        snapshot.save()
+
+    return {
+        project_dir: tuple(
+            _compare(installed[project_dir][index], snapshots[index], local_latest[index].get(project_dir))
+            for index in range(len(ecosystems))
+        )
+        for project_dir in project_dirs
+    }
+
+def dependency_report(project_dir=None, refresh=False):
+    """
+    Returns (composer_outdated, yarn_outdated) for a project.
+    Installed versions come from composer.lock / installed.json and
+    yarn.lock / node_modules; latest versions come from the cached registry
+    snapshot. `composer outdated` / `yarn outdated` only run when the
+    snapshot is missing or expired for some package, or when `refresh` is set.
+    """
+    project_dir = Path(project_dir) if project_dir else Path(os.getcwd())
+    return fleet_dependency_report([project_dir], refresh=refresh)[project_dir]
+
+# Files whose change invalidates a cached per-plugin report
+ECOSYSTEM_STAMP_FILES = {
+    "composer": ("composer.json", "composer.lock", "vendor/composer/installed.json"),
+    "npm": ("package.json", "yarn.lock"),
+}
+DEFAULT_REPORT_CACHE_TTL = 3600
+
+def report_cache_ttl():
+    """Seconds a per-plugin report stays valid (`dependencies.cache_ttl` in the pb-cli config)."""
+    try:
+        return int(Config.get("dependencies", "cache_ttl", DEFAULT_REPORT_CACHE_TTL))
+    except (TypeError, ValueError):
+        return DEFAULT_REPORT_CACHE_TTL
+
+def _report_stamp(project_dir, ecosystem):
+    stamp = []
+    for relative_path in ECOSYSTEM_STAMP_FILES[ecosystem]:
+        try:
+            stamp.append((project_dir / relative_path).stat().st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+def cached_ecosystem_report(project_dir, ecosystem, ttl=None, refresh=False):
+    """
+    Returns the outdated dict of one ecosystem ("composer" or "npm") for a project,
+    reusing the last report of that plugin while it is younger than `ttl` and
+    its manifest/lock files are unchanged.
+    """
+    project_dir = Path(project_dir)
+    ttl = report_cache_ttl() if ttl is None else ttl
+    cache_key = sha256_bytes(str(project_dir.resolve()).encode("utf-8"))[:16]
+    cache_path = cache_dir("dependency-reports") / f"{cache_key}-{ecosystem}.json"
+    stamp = _report_stamp(project_dir, ecosystem)
+
+    if not refresh:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached["stamp"] == stamp and time.time() - cached["checked_at"] < ttl:
+                return cached["outdated"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    selected = tuple(entry for entry in ECOSYSTEMS if entry[0] == ecosystem)
+    outdated = fleet_dependency_report([project_dir], refresh=refresh, ecosystems=selected)[project_dir][0]
+    atomic_write_text(cache_path, json.dumps({"checked_at": time.time(), "stamp": stamp, "outdated": outdated}))
+    return outdated
+
+SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+def _section_lines(label, outdated):
+    if not outdated:
+        return [f"All {label} dependencies are up to date."]
+    lines = [f"Outdated {label} dependencies detected:"]
+    for package, versions in outdated.items():
+        lines.append(f" - {package}: {versions['current']} → {versions['latest']}")
+    return lines
+
 def dependency_checker(stdscr):
     """
     Integrates the dependency checker with the current curses interface.
-    Displays outdated Composer dependencies (if any) or a success message.
+    Composer and Yarn are checked concurrently; each section is drawn as soon
+    as its result arrives, with a spinner and elapsed time until then.
     """
     stdscr.clear()
     interface.draw_background(stdscr, "🔍 Dependency Checker")
     height, width = stdscr.getmaxyx()
-    
-    # Display initial message
-    # interface.display_message(stdscr, "Checking Composer dependencies...", "info", 2)
-    # stdscr.refresh()
-    
-    # Check dependencies
-    outdated = check_composer_dependencies()
-    
-    # Prepare display lines
-    display_lines = []
-    if not outdated:
-        display_lines.append("All Composer dependencies are up to date.")
-    else:
-        display_lines.append("Outdated Composer dependencies detected:")
-        for package, versions in outdated.items():
-            display_lines.append(f" - {package}: {versions['current']} → {versions['latest']}")
-    
-    outdated = get_yarn_outdated()
-    display_lines.append("")
-    if not outdated:
-        display_lines.append("All Yarn dependencies are up to date.")
-    else:
-        display_lines.append("Outdated Yarn dependencies detected:")
-        for package, versions in outdated.items():
-            display_lines.append(f" - {package}: {versions['current']} → {versions['latest']}")
-    
-    
-    # Display results starting a few lines down
-    y_start = 6
-    for i, line in enumerate(display_lines):
-        if y_start + i < height - 2:
-            stdscr.addstr(y_start + i, 4, line, curses.color_pair(1))
-    stdscr.refresh()
+    project_dir = Path(os.getcwd())
+    sections = (("composer", "Composer"), ("npm", "Yarn"))
+    started = time.monotonic()
+    frame = 0
+
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        futures = [executor.submit(cached_ecosystem_report, project_dir, ecosystem) for ecosystem, _ in sections]
+        stdscr.timeout(100)
+
+        while True:
+            elapsed = time.monotonic() - started
+            display_lines = []
+            for (ecosystem, label), future in zip(sections, futures):
+                if display_lines:
+                    display_lines.append("")
+                if future.done():
+                    try:
+                        display_lines.extend(_section_lines(label, future.result()))
+                    except Exception as error:  # A failed check must not take the whole UI down
+                        display_lines.append(f"❌ Could not check {label} dependencies: {error}")
+                else:
+                    spinner = SPINNER_FRAMES[frame % len(SPINNER_FRAMES)]
+                    display_lines.append(f"{spinner} Checking {label} dependencies... {elapsed:.1f}s")
+
+            # Display results starting a few lines down
+            y_start = 6
+            for y in range(y_start, height - 2):
+                stdscr.addstr(y, 4, " " * (width - 8), curses.color_pair(1))
+            for i, line in enumerate(display_lines):
+                if y_start + i < height - 2:
+                    stdscr.addstr(y_start + i, 4, line[:width - 8], curses.color_pair(1))
+            stdscr.refresh()
+
+            if all(future.done() for future in futures):
+                break
+            stdscr.getch()  # Waits up to one spinner frame
+            frame += 1
+
+    stdscr.timeout(-1)
     
     # Wait for user input before returning to the main menu
     stdscr.getch()
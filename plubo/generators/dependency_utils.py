@@ -1,6 +1,8 @@
 import json
 import re
 from pathlib import Path
+from plubo.utils.files import atomic_write_text
+from plubo.utils.json_edit import insert_members
 
 
 class DependencyScaffoldUtils:
@@ -36,27 +38,32 @@ class DependencyScaffoldUtils:
         if not package_json_path.exists():
             return [f"Skipped package.json script updates: `{cls.display_path(package_json_path, cwd)}` not found"]
 
+        package_text = package_json_path.read_text(encoding="utf-8")
         try:
-            package_data = json.loads(package_json_path.read_text(encoding="utf-8"))
+            package_data = json.loads(package_text)
         except json.JSONDecodeError:
             return [f"Skipped package.json script updates: invalid JSON in `{cls.display_path(package_json_path, cwd)}`"]
 
-        scripts = package_data.setdefault("scripts", {})
-        added = []
+        scripts = package_data.get("scripts", {})
+        missing = {}
 
         for script_name, script_cmd in scripts_to_add.items():
             if script_name not in scripts:
-                scripts[script_name] = script_cmd
-                added.append(script_name)
+                missing.setdefault(script_name, script_cmd)
 
         for script_name, script_cmd in (conditional_scripts or {}).items():
             if script_name not in scripts:
-                scripts[script_name] = script_cmd
-                added.append(script_name)
+                missing.setdefault(script_name, script_cmd)
 
-        if not added:
+        if not missing:
             return ["Kept existing package.json scripts"]
 
-        package_json_path.write_text(json.dumps(package_data, indent=2) + "\n", encoding="utf-8")
+        # Insert only the new entries so the rest of package.json stays byte-identical
+        try:
+            content, added = insert_members(package_text, ["scripts"], missing)
+        except ValueError as error:
+            return [f"Skipped package.json script updates: {error}"]
+
+        atomic_write_text(package_json_path, content)
         added_display = ", ".join(f"`{name}`" for name in added)
         return [f"Added package.json scripts: {added_display}"]
@@ -1,9 +1,13 @@
 import os
+import re
 import curses
 from pathlib import Path
 from plubo.utils import project, interface
+from plubo.utils.php_source import PhpEditor
 from plubo.generators import functionality
 
+ENDPOINT_TYPES = ["GetEndpoint", "PostEndpoint", "PutEndpoint", "DeleteEndpoint"]
+
 def handle_selection(stdscr, current_row, menu_options, height, width):
     """Handle the selection of a menu option"""
     if current_row < 0 or current_row >= len(menu_options):
@@ -48,7 +52,7 @@ def configure_endpoint(stdscr):
     stdscr.addstr(2, 2, "Configure Endpoint")
     stdscr.refresh()
     
-    type_options = ["GetEndpoint", "PostEndpoint", "PutEndpoint", "DeleteEndpoint"]
+    type_options = ENDPOINT_TYPES
     type_index = 0
     
     while True:
@@ -77,40 +81,40 @@ def configure_endpoint(stdscr):
     
     curses.curs_set(1)
     
-    stdscr.addstr(12, 2, "Namespace (default: " + project.detect_plugin_name() + "/v1):")
+    plugin_slug = project.get_context().plugin_slug
+    stdscr.addstr(12, 2, "Namespace (default: " + plugin_slug + "/v1):")
     curses.echo()
     stdscr.move(14, 2)
     namespace = stdscr.getstr().decode("utf-8").strip()
     if not namespace:
-        namespace = project.detect_plugin_name() + "/v1"
+        namespace = plugin_slug + "/v1"
     
     stdscr.addstr(16, 2, "Path (example: test):")
     stdscr.move(18, 2)
     path = stdscr.getstr().decode("utf-8").strip()
     curses.noecho()
     
-    create_api_endpoint_file(namespace, path, type_choice)
+    created = create_api_endpoint_file(namespace, path, type_choice)
     
     stdscr.clear()
-    stdscr.addstr(2, 2, f"✅ Endpoint '{namespace}/{path}' ({type_choice}) created.")
+    if created:
+        stdscr.addstr(2, 2, f"✅ Endpoint '{namespace}/{path}' ({type_choice}) created.")
+    else:
+        stdscr.addstr(2, 2, "❌ No class found in Functionality/ApiEndpoints.php to add the endpoint to.")
     stdscr.addstr(6, 2, "Press any key to return.")
     stdscr.refresh()
     stdscr.getch()
 
-def create_api_endpoint_file(namespace, path, type_choice):
-    """Creates or updates the ApiEndpoints.php file with a new endpoint inside add_endpoints function."""
-    plugin_root = Path(os.getcwd())
-    functionality_dir = plugin_root / "Functionality"
-    api_file = functionality_dir / "ApiEndpoints.php"
-    
-    functionality_dir.mkdir(parents=True, exist_ok=True)
-    
-    if not api_file.exists():
-        functionality.create_functionality('Api Endpoints', "ApiEndpoints.php")
-    
-    with api_file.open("r", encoding="utf-8") as f:
-        content = f.read()
-    
+def endpoint_registered(content, namespace, path, type_choice):
+    pattern = rf"new\s+{re.escape(type_choice)}\(\s*['\"]{re.escape(namespace)}['\"]\s*,\s*['\"]{re.escape(path)}['\"]"
+    return re.search(pattern, content) is not None
+
+
+def append_endpoint(editor, namespace, path, type_choice):
+    """Queue a new endpoint in add_endpoints(), adding the method when the class lacks it.
+
+    Returns False when the file has no class to add it to.
+    """
     endpoint_code = f"""
         $endpoints[] = new {type_choice}(
             '{namespace}',
@@ -121,28 +125,49 @@ def create_api_endpoint_file(namespace, path, type_choice):
             }}
         );
     """
-    
-    # Find the start of the add_endpoints function
-    function_start = content.find("public function add_endpoints")
-    if function_start == -1:
-        # If the function doesn't exist, create it
-        insert_position = content.rfind("}")
-        content = content[:insert_position] + f"""
+
+    # Insert the endpoint code before the return statement (or the closing brace) of add_endpoints
+    if editor.insert_before_return("add_endpoints", endpoint_code + "\n    "):
+        return True
+
+    # If the function doesn't exist, create it
+    added = editor.add_to_class(f"""
     public function add_endpoints($endpoints) {{
         {endpoint_code.strip()}
         return $endpoints;
     }}
-}}""" + content[insert_position+1:]
-    else:
-        # Find the return statement inside the add_endpoints function
-        return_start = content.find("return $endpoints;", function_start)
-        if return_start == -1:
-            # If there's no return statement, append the endpoint code before the closing brace
-            closing_brace = content.rfind("}", function_start)
-            content = content[:closing_brace] + endpoint_code + "\n    " + content[closing_brace:]
-        else:
-            # Insert the endpoint code before the return statement
-            content = content[:return_start] + endpoint_code + "\n    " + content[return_start:]
+""")
+    if added:
+        editor.refresh()  # Index the new method for the next endpoints
+    return added
+
+
+def insert_endpoint(content, namespace, path, type_choice):
+    """Return the ApiEndpoints.php content with a new endpoint added to add_endpoints(), or None."""
+    editor = PhpEditor(content)
+    if not append_endpoint(editor, namespace, path, type_choice):
+        return None
+    return editor.text()
+
+
+def create_api_endpoint_file(namespace, path, type_choice):
+    """Creates or updates the ApiEndpoints.php file with a new endpoint inside add_endpoints function."""
+    plugin_root = Path(os.getcwd())
+    functionality_dir = plugin_root / "Functionality"
+    api_file = functionality_dir / "ApiEndpoints.php"
+    
+    functionality_dir.mkdir(parents=True, exist_ok=True)
+    
+    if not api_file.exists():
+        functionality.create_functionality('Api Endpoints', "ApiEndpoints.php")
+    
+    with api_file.open("r", encoding="utf-8") as f:
+        content = f.read()
+    
+    content = insert_endpoint(content, namespace, path, type_choice)
+    if content is None:
+        return False
     
     with api_file.open("w", encoding="utf-8") as f:
         f.write(content)
+    return True
@@ -1,9 +1,8 @@
 import os
 from pathlib import Path
 from plubo.utils import project, interface  # Import function to get the plugin name
+from plubo.utils.templates import TEMPLATES_DIR, render_template
 
-# Define the absolute path to the templates directory (sibling folder)
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"  # Move up one level to reach sibling
 
 def add_entity(stdscr):
     """Main function to handle entity creation within the curses menu."""
@@ -27,6 +26,11 @@ def add_entity(stdscr):
     stdscr.getch()  # Waits for a key press before returning
 
 
+def entity_class_name(entity_name):
+    """PascalCase class name for a hyphenated entity name."""
+    return ''.join(word.capitalize() for word in entity_name.split('-'))
+
+
 def create_entity(entity_name):
     """Creates a new entity file in the Entities directory with the given name."""
 
@@ -36,31 +40,28 @@ def create_entity(entity_name):
     template_file = TEMPLATES_DIR / "Entity.php"  # Path to the template file
 
     # Convert entity name to PascalCase
-    entity_class_name = ''.join(word.capitalize() for word in entity_name.split('-'))
+    class_name = entity_class_name(entity_name)
 
     # Define file path
-    entity_file = entities_dir / f"{entity_class_name}.php"
+    entity_file = entities_dir / f"{class_name}.php"
 
     # Ensure the Entities directory exists
     entities_dir.mkdir(parents=True, exist_ok=True)
 
     # Check if the entity file already exists
     if entity_file.exists():
-        return False, f"Entity '{entity_class_name}' already exists at {entity_file}"
+        return False, f"Entity '{class_name}' already exists at {entity_file}"
 
-    # Ensure template file exists
-    if not template_file.exists():
+    # Render the template (parsed once per process)
+    plugin_name = project.get_context(plugin_root).namespace  # PHP namespace of the plugin
+    try:
+        php_code = render_template("Entity.php", PluginPlaceholder=plugin_name, EntityName=class_name)
+    except FileNotFoundError:
         return False, f"❌ Template file '{template_file}' not found."
-
-    # Read the template
-    with template_file.open("r", encoding="utf-8") as f:
-        php_template = f.read()
-
-    # Replace placeholders
-    plugin_name = ''.join(word.capitalize() for word in project.detect_plugin_name().split('-'))  # Get actual plugin name
-    php_code = php_template.replace("PluginPlaceholder", plugin_name).replace("EntityName", entity_class_name)
+    except ValueError as error:
+        return False, f"❌ {error}"
 
     # Write the entity file
     entity_file.write_text(php_code, encoding="utf-8")
     
-    return True, f"Entity '{entity_class_name}' created successfully at {entity_file}"
+    return True, f"Entity '{class_name}' created successfully at {entity_file}"
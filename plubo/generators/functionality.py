@@ -4,9 +4,8 @@ import curses
 import re
 import json
 from plubo.utils import project, interface  # Import function to get the plugin name
+from plubo.utils.templates import TEMPLATES_DIR, render_template
 
-# Define the absolute path to the templates directory (sibling folder)
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 BLADE_PACKAGE = "eftec/bladeone"
 BLADE_TEMPLATE_OVERRIDES = {
     "Admin/AdminMenus.php": "Admin/AdminMenusBlade.php",
@@ -106,23 +105,34 @@ def add_functionality(stdscr):
             
 
 
+def functionality_class_name(name):
+    """PascalCase class name for a functionality name or preset ("ADMIN MENUS" -> "AdminMenus")."""
+    parts = re.split(r'[-\s]+', name)
+    return ''.join(word.capitalize() for word in parts)
+
+
+def functionality_path(plugin_root, name, template_filename):
+    """Path of the class file; presets in a subfolder (e.g. "Admin/AdminMenus.php") keep it."""
+    subfolder, _ = os.path.split(template_filename)
+    return plugin_root / "Functionality" / subfolder / f"{functionality_class_name(name)}.php"
+
+
+def resolve_template(template_filename, plugin_root, blade=None):
+    """Template to render: the Blade variant when one exists and BladeOne is (or will be) installed."""
+    blade_template = BLADE_TEMPLATE_OVERRIDES.get(template_filename)
+    if blade is None:
+        blade = bool(blade_template) and _is_blade_installed(plugin_root)
+    return blade_template if blade_template and blade else template_filename
+
+
 def create_functionality(name, template_filename):
     """Creates a new functionality file based on the given template."""
     plugin_root = Path(os.getcwd())  # Plugin directory (assumed current working directory)
-    functionality_dir = plugin_root / "Functionality"
-    resolved_template_filename = template_filename
-    blade_template = BLADE_TEMPLATE_OVERRIDES.get(template_filename)
-    if blade_template and _is_blade_installed(plugin_root):
-        resolved_template_filename = blade_template
+    resolved_template_filename = resolve_template(template_filename, plugin_root)
     template_file = TEMPLATES_DIR / resolved_template_filename  # Get the template file path
 
-    # Convert name to PascalCase
-    parts = re.split(r'[-\s]+', name)
-    class_name = ''.join(word.capitalize() for word in parts)
-
-    # Handle subfolders like "Admin/AdminMenus.php"
-    subfolder, file_name = os.path.split(template_filename)
-    file_path = functionality_dir / subfolder / f"{class_name}.php"
+    class_name = functionality_class_name(name)
+    file_path = functionality_path(plugin_root, name, template_filename)
 
     # Ensure the directory structure exists
     file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -131,17 +141,14 @@ def create_functionality(name, template_filename):
     if file_path.exists():
         return False, f"Functionality '{class_name}' already exists at {file_path}"
 
-    # Ensure the template exists
-    if not template_file.exists():
+    # Render the template (parsed once per process) with the plugin namespace and class name
+    plugin_name = project.get_context(plugin_root).namespace  # PHP namespace of the plugin
+    try:
+        php_code = render_template(resolved_template_filename, PluginPlaceholder=plugin_name, FunctionalityName=class_name)
+    except FileNotFoundError:
         return False, f"❌ Template file '{template_file}' not found."
-
-    # Read the template file
-    with template_file.open("r", encoding="utf-8") as f:
-        php_template = f.read()
-
-    # Replace placeholders
-    plugin_name = ''.join(word.capitalize() for word in project.detect_plugin_name().split('-'))  # Get plugin name
-    php_code = php_template.replace("PluginPlaceholder", plugin_name).replace("FunctionalityName", class_name)
+    except ValueError as error:
+        return False, f"❌ {error}"
 
     # Write the new functionality file
     file_path.write_text(php_code, encoding="utf-8")
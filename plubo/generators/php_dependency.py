@@ -1,12 +1,11 @@
-import subprocess
 import curses
 import json
 import os
-import re
 from pathlib import Path
-from plubo.utils import project, interface
+from plubo.utils import project, interface, packagist
 from plubo.generators import functionality
 from plubo.generators.dependency_utils import DependencyScaffoldUtils
+from plubo.utils.templates import TEMPLATES_DIR, render_template
 
 DEPENDENCY_OPTIONS = {
     "ROUTES": {"package": "joanrodas/plubo-routes"},
@@ -68,23 +67,6 @@ def resolve_dependency(value):
 
     return {"package": value}, False
 
-def _detect_plugin_name(cwd):
-    for file_path in cwd.glob("*.php"):
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-
-        match = re.search(r"Text Domain:\s*(.+)", content)
-        if match:
-            return match.group(1).strip()
-
-    return None
-
-def _plugin_namespace(plugin_name):
-    parts = re.split(r"[-_\s]+", plugin_name)
-    return "".join(part.capitalize() for part in parts if part)
-
 def _scaffold_carbon_fields_functionality(cwd):
     created, message = functionality.create_functionality("Custom Fields", "CustomFields.php")
     return [message if created else message]
@@ -94,20 +76,18 @@ def _scaffold_crons_functionality(cwd):
     return [message if created else message]
 
 def _scaffold_blade_loader(cwd):
-    template_path = Path(__file__).parent.parent / "templates" / "Includes" / "BladeLoader.php"
+    template_name = "Includes/BladeLoader.php"
     destination_path = cwd / "Includes" / "BladeLoader.php"
 
-    if not template_path.exists():
+    namespace = project.get_context(cwd).namespace or "PluginPlaceholder"
+    try:
+        rendered_content = render_template(template_name, PluginPlaceholder=namespace)
+    except FileNotFoundError:
         return [
             f"Skipped `{DependencyScaffoldUtils.display_path(destination_path, cwd)}`: "
-            f"missing template `{template_path}`"
+            f"missing template `{TEMPLATES_DIR / template_name}`"
         ]
 
-    plugin_name = _detect_plugin_name(cwd) or "plugin-placeholder"
-    namespace = _plugin_namespace(plugin_name)
-    template_content = template_path.read_text(encoding="utf-8")
-    rendered_content = template_content.replace("PluginPlaceholder", namespace)
-
     return [DependencyScaffoldUtils.write_file_if_missing(destination_path, rendered_content, cwd)]
 
 def apply_post_install_actions(dependency_option, cwd=None):
@@ -148,16 +128,11 @@ def get_installed_dependencies():
 
 def get_latest_version(package_name):
     """Retrieve the latest available version of a Composer package."""
-    try:
-        command = ["lando", "composer", "show", "--all", package_name] if project.is_lando_project() else ["composer", "show", "--all", package_name]
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
-        
-        for line in result.stdout.split("\n"):
-            if line.startswith("versions :"):
-                versions = line.split(":")[1].strip().split(", ")
-                return versions[-1]  # Latest version is usually the last in the list
-    except subprocess.CalledProcessError:
-        return None  # Error occurred
+    latest = packagist.latest_stable_versions([package_name]).get(package_name)
+    if latest is None:
+        # Not on Packagist: ask Composer, which also knows the project's own repositories
+        latest = packagist.composer_latest_version(package_name, os.getcwd(), project.is_lando_project())
+    return latest
 
 def install_dependency(stdscr, dependency_option):
     """Install a specific Composer dependency, handling Lando projects."""
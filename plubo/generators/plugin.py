@@ -1,14 +1,29 @@
 import os
-import json
-import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import fnmatch
-from plubo.utils import project, interface, colors
+from plubo.utils import project, interface, colors, steps, build_stamp
+from plubo.utils.ignore import IgnoreRules
+from plubo.utils.replace import MultiReplacer
+from plubo.utils.files import atomic_write_bytes
+from plubo.utils.json_edit import replace_strings
+from plubo.utils.skeleton import create_skeleton
+from plubo.utils.dist_archive import build_dist_archive, dist_archive_path
+from plubo.generators.rename_journal import RenameJournal
 from plubo.settings.Config import Config
 from plubo.git.github import ask_for_github_namespace, create_github_repo, create_github_release
 from plubo.git.gitlab import ask_for_gitlab_namespace, create_gitlab_repo, get_custom_gitlab_domains
 from plubo.git.git_utils import initialize_git_repository, set_remote_and_push, get_git_remote_repo, clear_git_lock
+from plubo.git.release import bump_version, commit_command, current_branch, push_release, tag_command
+
+# Files rewritten by rename_plugin (Blade views are covered by *.php).
+RENAME_PATTERNS = ("*.php", "*.js", "*.jsx", "*.ts", "*.tsx", "*.vue", "*.scss", "*.css", "*.po", "*.pot")
+RENAME_SKIPPED_DIRECTORIES = ("vendor", "node_modules", ".git")
+RENAME_JSON_FILES = ("composer.json", "package.json")
+DEFAULT_RENAME_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+BINARY_SNIFF_BYTES = 8000  # Same window git uses to detect binary files
+
 
 def handle_repo_selection(stdscr, current_row, menu_options, plugin_directory, plugin_name, custom_domains):
     """Handle the selection of a menu option"""
@@ -132,42 +147,43 @@ def rename_project(stdscr):
     box_x = (stdscr.getmaxyx()[1] - 50) // 2  # Center box horizontally
     y_start = 8  # Position inputs inside the box
     
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    context = project.get_context()
+    if not context.wp_root:
         interface.display_message(stdscr, "❌ No WordPress installation detected. Aborting.", "error", 15)
         stdscr.getch() 
         return
     
-    old_name = project.detect_plugin_name()
+    old_name = context.plugin_slug
     new_name = interface.get_user_input(stdscr, y_start, box_x, "Plugin name (empty to cancel):", 40)
     
-    plugins_directory = wp_root / "wp-content/plugins"
-    plugin_directory = plugins_directory / old_name
+    plugin_directory = context.plugin_root
     
     if not new_name:
         interface.display_message(stdscr, "⚠️ Rename cancelled.", "error", 15)
     else:
         interface.display_message(stdscr, f"Renaming {old_name} to {new_name}... ⏳", "info", 15)
-        rename_plugin(old_name, new_name, plugin_directory, stdscr=stdscr)
-        interface.display_message(stdscr, "✅ Plugin renamed successfully!", "success", 16)
+        progress = interface.progress_reporter(stdscr, "Files processed", 17)
+        try:
+            rename_plugin(old_name, new_name, plugin_directory, stdscr=stdscr, progress=progress)
+            interface.display_message(stdscr, "✅ Plugin renamed successfully!", "success", 16)
+        except Exception as e:
+            interface.display_message(stdscr, f"❌ Rename failed, changes rolled back: {e}", "error", 16)
     
     stdscr.getch()  # Wait for user input before returning
 
 def init_repo(stdscr):
     """Init repo for the plugin."""
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    context = project.get_context()
+    if not context.wp_root:
         interface.display_message(stdscr, "❌ No WordPress installation detected. Aborting.", "error", 15)
         return
     
-    plugin_name = project.detect_plugin_name()
-    if not plugin_name:
+    if not context.plugin_slug:
         interface.display_message(stdscr, "❌ No plugin detected. Aborting.", "error", 15)
         return
     
-    plugin_name = plugin_name.lower().replace(" ", "-")
-    plugins_directory = wp_root / "wp-content/plugins"
-    plugin_directory = plugins_directory / plugin_name
+    plugin_name = context.plugin_slug.lower().replace(" ", "-")
+    plugin_directory = context.plugin_root
     
     ask_for_repo_creation(stdscr, plugin_directory, plugin_name)
 
@@ -186,11 +202,22 @@ def create_plugin(stdscr, new_name, wp_root):
     height, width = stdscr.getmaxyx()
 
     try:       
-        command = ["lando", "composer", "create-project", "joanrodas/plubo", plugin_name] if project.is_lando_project() else ["composer", "create-project", "joanrodas/plubo", plugin_name]
+        try:
+            # Copied from the local skeleton cache when it is warm; composer create-project otherwise
+            skeleton_source = create_skeleton(
+                plugins_directory,
+                plugin_name,
+                project.is_lando_project(),
+                lambda command, cwd: project.run_command(command, cwd, stdscr),
+            )
+        except RuntimeError:
+            skeleton_source = None
         
-        if project.run_command(command, plugins_directory, stdscr):
+        if skeleton_source:
+            project.invalidate_context(plugins_directory)
             interface.display_message(stdscr, f"✅ Successfully created {plugin_name}", "success", height - 3)
-            rename_plugin("plugin-placeholder", new_name, plugin_directory, stdscr=stdscr)
+            progress = interface.progress_reporter(stdscr, "Renaming files", height - 2)
+            rename_plugin("plugin-placeholder", new_name, plugin_directory, stdscr=stdscr, progress=progress)
             # os.chdir(plugin_directory)  # Change directory to the newly created plugin folder
             stdscr.clear()
             activate_plugin(stdscr, plugin_name, plugin_directory)
@@ -209,65 +236,136 @@ def create_plugin(stdscr, new_name, wp_root):
     stdscr.getch()  # Wait user input
             
 
-def rename_plugin(old_name, new_name, plugin_root= Path(os.getcwd()), stdscr=None):
-    """Replaces the plugin name in all relevant files with correct casing."""
+def rename_plugin(old_name, new_name, plugin_root=None, stdscr=None, patterns=None,
+                  ignore_files=(".gitignore",), workers=None, progress=None, journal=None):
+    """Replaces the plugin name in all relevant files with correct casing.
+
+    Files matching `patterns` are processed on a bounded thread pool; paths
+    excluded by `ignore_files` and files that look binary are skipped.
+    `progress(done, total)` is called as files complete. Returns a dict
+    mapping each changed file to its number of replacements.
+
+    The rename is transactional: new contents are staged in memory, the
+    original bytes are saved to a RenameJournal, and files are then swapped
+    in atomically. If anything fails (including composer dump-autoload) the
+    plugin is rolled back; a successful rename can be reverted with
+    `undo_rename`.
+    """
+    plugin_root = Path(plugin_root) if plugin_root else Path(os.getcwd())
     parent_directory = plugin_root.parent  # The directory containing the plugin folder
     
     casing_variants = {
         old_name.lower().replace("_", "-"): new_name.lower().replace("_", "-"),
         old_name.upper().replace("-", "_"): new_name.upper().replace("-", "_"),
-        old_name.title().replace("-", ""): new_name.title().replace("-", ""),
+        project.plugin_namespace(old_name): project.plugin_namespace(new_name),
         old_name.upper().replace("-", "").replace("_", ""): new_name.upper().replace("-", "").replace("_", "-")
     }
-    
-    # Update PHP files
-    for file in iter_files(plugin_root, "*.php"):
-        replace_in_file(file, casing_variants)
-    
-    # Update JSON files (composer.json, package.json)
-    for json_file in ["composer.json", "package.json"]:
-        json_path = plugin_root / json_file
-        if json_path.exists():
-            replace_in_json(json_path, casing_variants)
-    
-    # Update .pot file
-    pot_file = plugin_root / "languages" / f"{old_name.lower()}.pot"
-    if pot_file.exists():
-        new_pot_file = plugin_root / "languages" / f"{new_name.lower()}.pot"
-        replace_in_file(pot_file, casing_variants)
-        pot_file.rename(new_pot_file)
-    
-    # Rename main plugin file
-    old_plugin_file = plugin_root / f"{old_name.lower()}.php"
-    new_plugin_file = plugin_root / f"{new_name.lower()}.php"
-    if old_plugin_file.exists():
-        old_plugin_file.rename(new_plugin_file)
-    
-    # Rename plugin folder
-    new_plugin_folder = parent_directory / new_name.lower().replace(" ", "-")  # Normalize new folder name
-    if plugin_root.exists():
-        plugin_root.rename(new_plugin_folder)
-
-    composer_json = new_plugin_folder / "composer.json"
-    if composer_json.exists():
-        command = (
-            ["lando", "composer", "dump-autoload"]
-            if is_lando_project_path(new_plugin_folder)
-            else ["composer", "dump-autoload"]
-        )
-        if stdscr:
-            project.run_command(command, new_plugin_folder, stdscr)
-        else:
-            subprocess.run(command, cwd=str(new_plugin_folder), check=True)
-
+    replacer = MultiReplacer(casing_variants)
+    max_workers = workers or DEFAULT_RENAME_WORKERS
+    staged = {}
+    
+    # Stage source files (PHP, Blade, scripts, styles, translations)
+    files = list(iter_rename_files(plugin_root, patterns or RENAME_PATTERNS, ignore_files))
+    json_files = [plugin_root / json_file for json_file in RENAME_JSON_FILES if (plugin_root / json_file).exists()]
+    total = len(files) + len(json_files)
+    done = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(stage_file, file, replacer): file for file in files}
+        for future in as_completed(futures):
+            result = future.result()
+            if result:
+                staged[futures[future]] = result
+            done += 1
+            if progress:
+                progress(done, total)
+    
+    # Stage JSON files (composer.json, package.json)
+    for json_path in json_files:
+        result = stage_json(json_path, replacer)
+        if result:
+            staged[json_path] = result
+        done += 1
+        if progress:
+            progress(done, total)
+
+    journal = journal or RenameJournal()
+    journal.begin(
+        plugin_root, old_name, new_name,
+        [(path, original, updated) for path, (original, updated, count) in staged.items()],
+    )
+    match_counts = {path: count for path, (original, updated, count) in staged.items() if count}
 
-def is_lando_project_path(start_path):
-    current_path = Path(start_path).resolve()
-    for directory in [current_path, *current_path.parents]:
-        if (directory / ".lando.yml").exists():
-            return True
-    return False
+    try:
+        # Swap staged contents in, each file atomically
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            writes = [executor.submit(atomic_write_bytes, path, updated) for path, (original, updated, count) in staged.items()]
+            for future in writes:
+                future.result()
+        
+        # Rename .pot file
+        pot_file = plugin_root / "languages" / f"{old_name.lower()}.pot"
+        if pot_file.exists():
+            new_pot_file = plugin_root / "languages" / f"{new_name.lower()}.pot"
+            if pot_file in match_counts:
+                match_counts[new_pot_file] = match_counts.pop(pot_file)
+            journal.record_move(pot_file, new_pot_file)
+            pot_file.rename(new_pot_file)
+        
+        # Rename main plugin file
+        old_plugin_file = plugin_root / f"{old_name.lower()}.php"
+        new_plugin_file = plugin_root / f"{new_name.lower()}.php"
+        if old_plugin_file.exists():
+            journal.record_move(old_plugin_file, new_plugin_file)
+            old_plugin_file.rename(new_plugin_file)
         
+        # Rename plugin folder
+        new_plugin_folder = parent_directory / new_name.lower().replace(" ", "-")  # Normalize new folder name
+        if plugin_root.exists() and new_plugin_folder != plugin_root:
+            if new_plugin_folder.exists():
+                raise FileExistsError(f"{new_plugin_folder} already exists")
+            journal.record_move(plugin_root, new_plugin_folder)
+            plugin_root.rename(new_plugin_folder)
+        project.invalidate_context()
+
+        if not dump_autoload(new_plugin_folder, stdscr):
+            raise RuntimeError("composer dump-autoload failed")
+    except BaseException:
+        journal.rollback()
+        project.invalidate_context()
+        raise
+
+    journal.commit()
+    return match_counts
+
+
+def undo_rename(stdscr=None, journal=None):
+    """Revert the last successful rename_plugin. Returns the restored plugin folder."""
+    journal = journal or RenameJournal.load()
+    if journal is None:
+        raise RuntimeError("No rename to undo.")
+
+    plugin_root = journal.undo()
+    project.invalidate_context()
+    dump_autoload(plugin_root, stdscr)
+    return plugin_root
+
+
+def dump_autoload(plugin_root, stdscr=None):
+    """Regenerate the Composer autoloader of a plugin, if it uses Composer."""
+    if not (plugin_root / "composer.json").exists():
+        return True
+
+    command = (
+        ["lando", "composer", "dump-autoload"]
+        if project.get_context(plugin_root).is_lando
+        else ["composer", "dump-autoload"]
+    )
+    if stdscr:
+        return project.run_command(command, plugin_root, stdscr)
+    return subprocess.run(command, cwd=str(plugin_root)).returncode == 0
+
+
 def iter_files(root, pattern):
     for dirpath, dirnames, filenames in os.walk(root):
         # Remove vendor and node_modules directories from the search
@@ -275,45 +373,94 @@ def iter_files(root, pattern):
         for filename in filenames:
             if fnmatch.fnmatch(filename, pattern):
                 yield Path(dirpath) / filename
+
+def iter_rename_files(root, patterns=RENAME_PATTERNS, ignore_files=(".gitignore",)):
+    """Yield the files rename_plugin rewrites, honouring the given ignore files."""
+    root = Path(root)
+    ignore_rules = IgnoreRules.from_files(root, ignore_files)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        relative_dir = Path(dirpath).relative_to(root)
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in RENAME_SKIPPED_DIRECTORIES
+            and not ignore_rules.is_ignored((relative_dir / d).as_posix(), is_dir=True)
+        ]
+        for filename in filenames:
+            if not any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+                continue
+            relative_path = (relative_dir / filename).as_posix()
+            if relative_path in RENAME_JSON_FILES or ignore_rules.is_ignored(relative_path):
+                continue
+            yield Path(dirpath) / filename
                 
-def replace_in_file(file_path, replacements):
-    """Replaces occurrences of old names with new ones in a file."""
+def _as_replacer(replacements):
+    return replacements if isinstance(replacements, MultiReplacer) else MultiReplacer(replacements)
+
+def stage_file(file_path, replacements):
+    """Compute the renamed content of a file without writing it.
+
+    Returns (original_bytes, new_bytes, count), or None when the file is
+    binary, not UTF-8 or has nothing to replace.
+    """
     # Skip if the path is not a file
     if not file_path.is_file():
-        return
+        return None
+
+    replacer = _as_replacer(replacements)
+    with file_path.open("rb") as f:
+        head = f.read(BINARY_SNIFF_BYTES)
+        if b"\0" in head:
+            return None
+        raw_content = head + f.read()
 
-    with file_path.open("r", encoding="utf-8") as f:
-        content = f.read()
+    try:
+        content = raw_content.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
     
-    for old, new in replacements.items():
-        content = content.replace(old, new)
+    new_content, count = replacer.subn(content)
+    if new_content == content:
+        return None
+
+    return raw_content, new_content.encode("utf-8"), count
+
+def replace_in_file(file_path, replacements):
+    """Replaces occurrences of old names with new ones in a file.
+
+    Binary and non UTF-8 files are left alone, and the file is only rewritten
+    when something matched. Returns the number of replacements.
+    """
+    staged = stage_file(file_path, replacements)
+    if not staged:
+        return 0
+
+    original, updated, count = staged
+    atomic_write_bytes(file_path, updated)
+    return count
+
+def stage_json(file_path, replacements):
+    """Compute the renamed content of a JSON file; see stage_file.
+
+    Only the matching string tokens are rewritten, so formatting and key
+    order are preserved byte for byte.
+    """
+    raw_content = file_path.read_bytes()
+    content, count = replace_strings(raw_content.decode("utf-8"), _as_replacer(replacements))
+    if not count:
+        return None
     
-    with file_path.open("w", encoding="utf-8") as f:
-        f.write(content)
+    return raw_content, content.encode("utf-8"), count
 
 def replace_in_json(file_path, replacements):
-    """Updates JSON values containing the old name."""
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    def replace_string(text):
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
+    """Updates JSON values containing the old name. Returns the number of replacements."""
+    staged = stage_json(file_path, replacements)
+    if not staged:
+        return 0
 
-    def recursive_replace(obj):
-        if isinstance(obj, str):
-            return replace_string(obj)
-        elif isinstance(obj, dict):
-            return {replace_string(key): recursive_replace(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [recursive_replace(item) for item in obj]
-        return obj
-    
-    updated_data = recursive_replace(data)
-    
-    with file_path.open("w", encoding="utf-8") as f:
-        json.dump(updated_data, f, indent=4)
+    original, updated, count = staged
+    atomic_write_bytes(file_path, updated)
+    return count
 
 
 def activate_plugin(stdscr, plugin_name, plugin_directory):
@@ -324,18 +471,25 @@ def activate_plugin(stdscr, plugin_name, plugin_directory):
     
     height, width = stdscr.getmaxyx()
     
-    commands = [
-        (["lando", "composer", "update"] if project.is_lando_project() else ["composer", "update"], "Updating Composer dependencies"),
-        (["yarn"], "Installing Node.js dependencies"),
-        (["yarn", "build"], "Building assets")
+    # Composer and the Node toolchain are independent; only the build waits for yarn.
+    # yarn / yarn build are left out when their inputs match the last successful run.
+    node_steps, skipped, stamp = build_stamp.node_steps(plugin_directory)
+    install_steps = [
+        steps.Step("composer", ["lando", "composer", "update"] if project.is_lando_project() else ["composer", "update"]),
+        *node_steps,
     ]
 
-    for cmd, description in commands:
-        interface.display_message(stdscr, f"🔄 {description}...", "info", 2)
-        if not project.run_command(cmd, plugin_directory, stdscr):
-            interface.display_message(stdscr, f"❌ Failed: {description}", "error", height - 3)
-            stdscr.getch()
-            return
+    message = "🔄 Installing dependencies and building assets..."
+    if skipped:
+        message += f" (unchanged, skipping: {', '.join(skipped)})"
+    interface.display_message(stdscr, message, "info", 2)
+    results = steps.run_steps(install_steps, plugin_directory, stdscr)
+    stamp.record(results)
+    failed = steps.first_failure(results)
+    if failed:
+        interface.display_message(stdscr, f"❌ Failed: {failed.name}", "error", height - 3)
+        stdscr.getch()
+        return
 
     if project.is_wp_cli_available():
         activation_command = ["wp", "plugin", "activate", plugin_name]
@@ -367,21 +521,19 @@ def prepare_release(stdscr):
     interface.draw_background(stdscr, "🚀 Prepare Release")
     height, width = stdscr.getmaxyx()
     
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    context = project.get_context()
+    if not context.wp_root:
         interface.display_message(stdscr, "❌ No WordPress installation detected. Aborting.", "error", 15)
         stdscr.getch()
         return
     
-    plugin_name = project.detect_plugin_name()
-    if not plugin_name:
+    if not context.plugin_slug:
         interface.display_message(stdscr, "❌ No plugin detected. Aborting.", "error", 15)
         stdscr.getch()
         return
     
-    plugin_name = plugin_name.lower().replace(" ", "-")
-    plugins_directory = wp_root / "wp-content/plugins"
-    plugin_root = plugins_directory / plugin_name
+    plugin_name = context.plugin_slug.lower().replace(" ", "-")
+    plugin_root = context.plugin_root
 
     # Ask for the release number/version
     box_x = (width - 50) // 2
@@ -398,48 +550,25 @@ def prepare_release(stdscr):
         stdscr.getch()
         return
     
-    plugin_constant = plugin_name.upper().replace("-", "_") + "_VERSION"
-
-    # Update version in plugin header and version variable using regex substitutions.
-    with open(main_plugin_file, "r", encoding="utf-8") as f:
-        content = f.read()
-    
-    # 1. Update header version
-    new_content = re.sub(
-        r"(Version:\s*)([\d\.]+)",
-        lambda m: m.group(1) + release,
-        content,
-        flags=re.IGNORECASE
-    )
-
-    # 2. Update version constant
-    pattern = rf"(define\(\s*['\"]{re.escape(plugin_constant)}['\"]\s*,\s*['\"])([\d\.]+)(['\"]\s*\))"
+    branch = current_branch(plugin_root)
+    if not branch:
+        interface.display_message(stdscr, "HEAD is detached; check out the branch to release from.", "error", 4)
+        stdscr.getch()
+        return
 
-    new_content = re.sub(
-        pattern,
-        lambda m: m.group(1) + release + m.group(3),
-        new_content
-    )
+    plugin_constant = plugin_name.upper().replace("-", "_") + "_VERSION"
 
-    with open(main_plugin_file, "w", encoding="utf-8") as f:
-        f.write(new_content)
+    # Update version in plugin header and version constant.
+    bump_version(Path(main_plugin_file), plugin_constant, release)
 
     interface.display_message(stdscr, f"Updated version in {main_plugin_file}", "success", 4)
     stdscr.refresh()
     
     clear_git_lock(plugin_root)
 
-    # Commit the version change and create a tag.
-    if not project.run_command(["git", "add", main_plugin_file], plugin_root, stdscr):
-        interface.display_message(stdscr, "Failed to stage changes.", "error", 4)
-        stdscr.getch()
-        return
-    
-    interface.display_message(stdscr, f"Added file", "success", 5)
-    stdscr.refresh()
-
+    # Commit the version change (staged by the commit itself) and create a tag.
     commit_msg = f"Release version {release}"
-    if not project.run_command(["git", "commit", "-m", commit_msg], plugin_root, stdscr):
+    if not project.run_command(commit_command(commit_msg, [main_plugin_file]), plugin_root, stdscr):
         interface.display_message(stdscr, "Git commit failed.", "error", 4)
         stdscr.getch()
         return
@@ -447,7 +576,7 @@ def prepare_release(stdscr):
     interface.display_message(stdscr, f"Commited file", "success", 5)
     stdscr.refresh()
 
-    if not project.run_command(["git", "tag", release], plugin_root, stdscr):
+    if not project.run_command(tag_command(release), plugin_root, stdscr):
         interface.display_message(stdscr, "Git tag creation failed.", "error", 4)
         stdscr.getch()
         return
@@ -455,8 +584,12 @@ def prepare_release(stdscr):
     interface.display_message(stdscr, f"Tag created", "success", 5)
     stdscr.refresh()
     
-    if not project.run_command(["git", "push", "origin", "main"], plugin_root, stdscr):
-        interface.display_message(stdscr, "Git push failed.", "error", 4)
+    # Branch and tag in one push, atomic when the remote supports it
+    try:
+        push_release(plugin_root, branch, release)
+    except subprocess.CalledProcessError as e:
+        details = (e.stderr or "").strip().splitlines()
+        interface.display_message(stdscr, f"Git push failed: {details[-1] if details else e}", "error", 4)
         stdscr.getch()
         return
     
@@ -467,16 +600,12 @@ def prepare_release(stdscr):
     repo = get_git_remote_repo(plugin_root)
     create_github_release(release, repo, token)
 
-    # Execute the WP distribution archive command.
-    # if project.is_lando_project():
-    #     archive_cmd = ["lando", "wp", "dist", "archive", "."]
-    # else:
-    #     archive_cmd = ["wp", "dist", "archive", "."]
-
-    # if not project.run_command(archive_cmd, plugin_root, stdscr):
-    #     interface.display_message(stdscr, "Failed to create distribution archive.", "error", 4)
-    #     stdscr.getch()
-    #     return
+    # Build the distribution archive natively (no wp-cli needed).
+    try:
+        report = build_dist_archive(plugin_root, dist_archive_path(plugin_root, plugin_name, release), plugin_name)
+        interface.display_message(stdscr, f"Created {report.path.name} ({report.files} files)", "success", 6)
+    except (OSError, ValueError) as e:
+        interface.display_message(stdscr, f"Failed to create distribution archive: {e}", "error", 6)
 
     stdscr.addstr(height - 2, 4, "Press any key to return to the main menu.")
     stdscr.getch()
@@ -0,0 +1,136 @@
+import json
+import shutil
+import time
+from pathlib import Path
+from plubo.utils.files import atomic_write_bytes, atomic_write_text, cache_dir, sha256_bytes
+
+STATUS_PENDING = "pending"
+STATUS_COMMITTED = "committed"
+STATUS_ROLLED_BACK = "rolled_back"
+STATUS_UNDONE = "undone"
+
+
+class RenameJournal:
+    """Journal of the last plugin rename, used for rollback and `pb-cli rename --undo`.
+
+    Before any file is touched the journal stores the original bytes of every
+    file that will change (content-addressed by SHA-256) plus the hash of its
+    new content. Moves are recorded right before they happen. Rolling back
+    replays the moves in reverse and restores only the journaled files, so it
+    costs O(changed files) and never rescans the plugin tree.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else cache_dir("rename-journal")
+        self.journal_path = self.directory / "journal.json"
+        self.objects_directory = self.directory / "objects"
+        self.data = None
+
+    @classmethod
+    def load(cls, directory=None):
+        """Return the journal of the last rename, or None when there is none."""
+        journal = cls(directory)
+        if not journal.journal_path.exists():
+            return None
+        try:
+            journal.data = json.loads(journal.journal_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return None
+        return journal
+
+    @property
+    def status(self):
+        return self.data.get("status") if self.data else None
+
+    def _save(self):
+        atomic_write_text(self.journal_path, json.dumps(self.data, indent=2))
+
+    def begin(self, plugin_root, old_name, new_name, edits):
+        """Start a journal for edits, a list of (path, original_bytes, updated_bytes)."""
+        if self.objects_directory.exists():
+            shutil.rmtree(self.objects_directory)
+        self.objects_directory.mkdir(parents=True)
+
+        files = []
+        for path, original_bytes, updated_bytes in edits:
+            original_hash = sha256_bytes(original_bytes)
+            object_path = self.objects_directory / original_hash
+            if not object_path.exists():
+                atomic_write_bytes(object_path, original_bytes)
+            files.append({
+                "path": str(path),
+                "original": original_hash,
+                "updated": sha256_bytes(updated_bytes),
+            })
+
+        self.data = {
+            "status": STATUS_PENDING,
+            "created_at": time.time(),
+            "plugin_root": str(plugin_root),
+            "old_name": old_name,
+            "new_name": new_name,
+            "files": files,
+            "moves": [],
+        }
+        self._save()
+
+    def record_move(self, source, destination):
+        """Record a file or folder move; call before performing it."""
+        self.data["moves"].append([str(source), str(destination)])
+        self._save()
+
+    def commit(self):
+        self.data["status"] = STATUS_COMMITTED
+        self._save()
+
+    def current_path(self, original_path):
+        """Where a journaled file lives now, after the recorded moves."""
+        path = str(original_path)
+        for source, destination in self.data["moves"]:
+            if path == source:
+                path = destination
+            elif path.startswith(source.rstrip("/") + "/"):
+                path = destination + path[len(source):]
+        return Path(path)
+
+    def modified_files(self):
+        """Journaled files whose content no longer matches what the rename wrote."""
+        modified = []
+        for entry in self.data["files"]:
+            current_path = self.current_path(entry["path"])
+            if not current_path.exists() or sha256_bytes(current_path.read_bytes()) != entry["updated"]:
+                modified.append(current_path)
+        return modified
+
+    def _restore(self):
+        for source, destination in reversed(self.data["moves"]):
+            destination_path = Path(destination)
+            if destination_path.exists() and not Path(source).exists():
+                destination_path.rename(source)
+
+        for entry in self.data["files"]:
+            path = Path(entry["path"])
+            if path.exists() and sha256_bytes(path.read_bytes()) == entry["original"]:
+                continue
+            atomic_write_bytes(path, (self.objects_directory / entry["original"]).read_bytes())
+
+    def rollback(self):
+        """Undo a rename that failed part-way."""
+        self._restore()
+        self.data["status"] = STATUS_ROLLED_BACK
+        self._save()
+
+    def undo(self):
+        """Restore the last committed rename. Returns the restored plugin root."""
+        if self.status != STATUS_COMMITTED:
+            raise RuntimeError(f"Last rename cannot be undone (status: {self.status}).")
+
+        modified = self.modified_files()
+        if modified:
+            listed = ", ".join(str(path) for path in modified[:5])
+            raise RuntimeError(f"Files changed since the rename, refusing to undo: {listed}")
+
+        self._restore()
+        self.data["status"] = STATUS_UNDONE
+        self._save()
+        return Path(self.data["plugin_root"])
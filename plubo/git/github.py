@@ -1,13 +1,17 @@
-import requests
+import os
 import curses
-from plubo.utils import interface
+from plubo.git.namespace_cache import cached_namespaces
+from plubo.utils import http, interface
 
-def create_github_release(tag, repo, token):
-    url = f"https://api.github.com/repos/{repo}/releases"
-    headers = {
+GITHUB_API_URL = os.environ.get("PB_CLI_GITHUB_API_URL", "https://api.github.com")
+
+def _client(token):
+    return http.get_client(GITHUB_API_URL, {
         "Authorization": f"token {token}",
-        "Content-Type": "application/json"
-    }
+        "Accept": "application/vnd.github.v3+json"
+    })
+
+def create_github_release(tag, repo, token):
     payload = {
         "tag_name": tag,
         "name": f"Release {tag}",
@@ -16,29 +20,25 @@ def create_github_release(tag, repo, token):
         "prerelease": False
     }
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = _client(token).post(f"/repos/{repo}/releases", json=payload)
     return response.status_code == 201, response.json()
 
 def validate_github_token(token):
     """Check if GitHub token is valid before storing it."""
-    headers = {"Authorization": f"token {token}"}
-    response = requests.get("https://api.github.com/user", headers=headers)
-    return response.status_code == 200
+    try:
+        response = _client(token).get("/user")
+        return response.status_code == 200
+    except http.RequestError:
+        return False
 
-def fetch_github_organizations(token):
-    """Fetch the GitHub organizations the authenticated user belongs to."""
-    url = "https://api.github.com/user/orgs"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
+def fetch_github_organizations(token, refresh=False):
+    """Fetch all GitHub organizations the authenticated user belongs to (cached per token)."""
+    def fetch():
+        orgs = _client(token).get_all("/user/orgs")
+        return [{"id": org["id"], "login": org["login"]} for org in orgs]
 
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response.json()  # List of organizations
-        else:
-            return []
+        return cached_namespaces("github.com", token, fetch, refresh=refresh)
     except Exception as e:
         return []
     
@@ -66,18 +66,13 @@ def ask_for_github_namespace(stdscr, token, username):
 def create_github_repo(username, token, plugin_name, org_name=None):
     """Create a new GitHub repository under a user or organization."""
     if org_name and org_name != username:
-        url = f"https://api.github.com/orgs/{org_name}/repos"  # Create repo in org
+        path = f"/orgs/{org_name}/repos"  # Create repo in org
     else:
-        url = "https://api.github.com/user/repos"  # Create repo in user namespace
+        path = "/user/repos"  # Create repo in user namespace
 
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json"
-    }
-    
     data = {"name": plugin_name, "private": True}
 
-    response = requests.post(url, headers=headers, json=data)
+    response = _client(token).post(path, json=data)
     if response.status_code == 201:
         repo_owner = org_name if org_name else username
         return f"git@github.com:{repo_owner}/{plugin_name}.git"
@@ -1,31 +1,31 @@
-import requests
+import os
 import curses
 from plubo.settings.Config import Config
-from plubo.utils import interface
+from plubo.git.namespace_cache import cached_namespaces
+from plubo.utils import http, interface
+
+# "{domain}" is replaced by the GitLab host, e.g. gitlab.com or a custom domain
+GITLAB_API_URL = os.environ.get("PB_CLI_GITLAB_API_URL", "https://{domain}/api/v4")
+
+def _client(token, gitlab_domain):
+    return http.get_client(GITLAB_API_URL.format(domain=gitlab_domain), {"PRIVATE-TOKEN": token})
 
 def validate_gitlab_token(token, gitlab_domain="gitlab.com"):
     """Check if GitLab token is valid before storing it."""
-    headers = {"PRIVATE-TOKEN": token}
-    url = f"https://{gitlab_domain}/api/v4/user"
-    
     try:
-        response = requests.get(url, headers=headers, timeout=5)  # Add a timeout to avoid long waits
+        response = _client(token, gitlab_domain).get("/user", timeout=5)  # Short timeout to avoid long waits
         return response.status_code == 200
-    except requests.exceptions.RequestException as e:
+    except http.RequestError as e:
         return False
     
-def fetch_gitlab_groups(token, gitlab_domain="gitlab.com"):
-    """Fetch the GitLab groups of the authenticated user."""
-    url = f"https://{gitlab_domain}/api/v4/groups"
-    headers = {"PRIVATE-TOKEN": token}
-    params = {"per_page": 100}  # Max allowed per page
-    
+def fetch_gitlab_groups(token, gitlab_domain="gitlab.com", refresh=False):
+    """Fetch all GitLab groups of the authenticated user (cached per domain and token)."""
+    def fetch():
+        groups = _client(token, gitlab_domain).get_all("/groups")
+        return [{"id": group["id"], "full_path": group["full_path"]} for group in groups]
+
     try:
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response.json()  # List of groups
-        else:
-            return []
+        return cached_namespaces(gitlab_domain, token, fetch, refresh=refresh)
     except Exception as e:
         return []
 
@@ -57,15 +57,12 @@ def get_custom_gitlab_domains():
 
 def create_gitlab_repo(namespace, namespace_id, token, plugin_name, gitlab_domain="gitlab.com"):
     """Create a new GitLab repository under the selected namespace (group or personal)."""
-    url = f"https://{gitlab_domain}/api/v4/projects"
-    headers = {"PRIVATE-TOKEN": token}
-    
     data = {"name": plugin_name, "visibility": "public"}
     
     if namespace_id:  # Only send if it's a group
         data["namespace_id"] = namespace_id
 
-    response = requests.post(url, headers=headers, json=data)
+    response = _client(token, gitlab_domain).post("/projects", json=data)
     
     if response.status_code == 201:
         return f"git@{gitlab_domain}:{namespace}/{plugin_name}.git"
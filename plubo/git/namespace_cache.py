@@ -0,0 +1,29 @@
+import json
+import time
+from plubo.utils.files import atomic_write_text, cache_dir, env_seconds, sha256_bytes
+
+NAMESPACE_TTL_SECONDS = env_seconds("PB_CLI_NAMESPACE_TTL", 3600)
+
+
+def _cache_path(domain, token):
+    # Keyed by a hash of the token: different accounts see different namespaces
+    return cache_dir("namespaces") / f"{domain}-{sha256_bytes(token.encode())[:16]}.json"
+
+
+def cached_namespaces(domain, token, fetch, refresh=False, ttl=NAMESPACE_TTL_SECONDS):
+    """Return the namespaces of an account, calling `fetch()` only when the cache is stale.
+
+    `fetch` returns a list of namespaces or raises; failures are not cached.
+    """
+    path = _cache_path(domain, token)
+    if not refresh:
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - cached.get("fetched_at", 0) < ttl:
+                return cached["namespaces"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    namespaces = fetch()
+    atomic_write_text(path, json.dumps({"fetched_at": time.time(), "namespaces": namespaces}))
+    return namespaces
@@ -0,0 +1,90 @@
+"""Release pipeline shared by `pb-cli release` and the curses release menu.
+
+The version bump is committed with `git commit -- <file>` (no separate
+`git add`), and the branch and the tag go out in a single
+`git push --atomic`, so a release costs one connection to the remote and
+either both refs are updated or neither is.
+"""
+import re
+import subprocess
+import time
+from contextlib import contextmanager
+from plubo.utils.files import atomic_write_text
+
+HEADER_VERSION_PATTERN = re.compile(r"(Version:\s*)([\d\.]+)", re.IGNORECASE)
+
+
+def bump_version(main_plugin_file, plugin_constant, release):
+    """Update the plugin header and version constant. Returns (header_count, constant_count)."""
+    content = main_plugin_file.read_text(encoding="utf-8")
+    new_content, header_count = HEADER_VERSION_PATTERN.subn(lambda match: match.group(1) + release, content)
+
+    constant_pattern = rf"(define\(\s*['\"]{re.escape(plugin_constant)}['\"]\s*,\s*['\"])([\d\.]+)(['\"]\s*\))"
+    new_content, constant_count = re.subn(
+        constant_pattern,
+        lambda match: match.group(1) + release + match.group(3),
+        new_content
+    )
+
+    if new_content != content:
+        atomic_write_text(main_plugin_file, new_content)
+    return header_count, constant_count
+
+
+def commit_command(message, paths):
+    """Commit only `paths`, staging them in the same process."""
+    return ["git", "commit", "-m", message, "--", *[str(path) for path in paths]]
+
+
+def tag_command(tag):
+    return ["git", "tag", tag]
+
+
+def push_command(branch, tag, remote="origin", atomic=True):
+    command = ["git", "push"]
+    if atomic:
+        command.append("--atomic")
+    return command + [remote, f"refs/heads/{branch}:refs/heads/{branch}", f"refs/tags/{tag}:refs/tags/{tag}"]
+
+
+def current_branch(repo):
+    """Return the checked-out branch name, or None on a detached HEAD."""
+    result = subprocess.run(
+        ["git", "symbolic-ref", "--short", "-q", "HEAD"],
+        cwd=str(repo),
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip() or None
+
+
+def push_release(repo, branch, tag, remote="origin"):
+    """Push branch and tag together, atomically when the remote supports it."""
+    result = subprocess.run(push_command(branch, tag, remote), cwd=str(repo), capture_output=True, text=True)
+    if result.returncode != 0 and "does not support --atomic" in result.stderr:
+        result = subprocess.run(push_command(branch, tag, remote, atomic=False), cwd=str(repo), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+    return result
+
+
+class StageTimer:
+    """Records how long each release stage takes."""
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - started))
+
+    def summary(self):
+        width = max((len(name) for name, _ in self.stages), default=0)
+        lines = [f"{name.ljust(width)}  {seconds * 1000:8.1f} ms" for name, seconds in self.stages]
+        total = sum(seconds for _, seconds in self.stages)
+        lines.append(f"{'total'.ljust(width)}  {total * 1000:8.1f} ms")
+        return lines
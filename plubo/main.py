@@ -1,9 +1,5 @@
-import curses
 import sys
 import time
-from plubo.generators import functionality, component, entity, elements, php_dependency, node_dependency, plugin, dependencies
-from plubo.utils import project, interface, colors
-from plubo.settings import settings
 from plubo.cli.dispatcher import dispatch
 
 MENU_OPTIONS_ALL = [
@@ -34,12 +30,13 @@ MENU_OPTIONS_NO_WP = [
 
 def get_menu_options():
     """Determine the correct menu options based on the environment."""
-    wp_root = project.detect_wp_root()
-    if not wp_root:
+    from plubo.utils import project
+
+    context = project.get_context()
+    if not context.wp_root:
         return MENU_OPTIONS_NO_WP  # Not in a WordPress installation
     
-    plugin_name = project.detect_plugin_name()
-    if not plugin_name:
+    if not context.plugin_slug:
         return MENU_OPTIONS_WP_ONLY  # In WordPress but not inside a plugin
     
     return MENU_OPTIONS_ALL  # Inside a plugin
@@ -47,6 +44,11 @@ def get_menu_options():
     
 def menu(stdscr):
     """Displays the interactive full-terminal menu"""
+    # Only the menu needs curses and the UI helpers; direct commands (and the
+    # thin client talking to `pb-cli serve`) skip these imports.
+    import curses
+    from plubo.utils import interface, colors
+
     curses.curs_set(0)  # Hide cursor
     stdscr.keypad(True)
 
@@ -78,6 +80,8 @@ def menu(stdscr):
                 
 def handle_selection(stdscr, current_row, menu_options, height, width):
     """Handle the selection of a menu option"""
+    import curses
+
     if current_row < 0 or current_row >= len(menu_options):
         return False  # Invalid selection
     
@@ -86,6 +90,11 @@ def handle_selection(stdscr, current_row, menu_options, height, width):
     if selection == "EXIT":
         return True # Exit the CLI
 
+    # Generators and settings pull in requests/packaging, so only load them
+    # once the interactive menu actually needs them.
+    from plubo.generators import functionality, component, entity, elements, php_dependency, node_dependency, plugin, dependencies
+    from plubo.settings import settings
+
     try:
         if selection == "RENAME PLUGIN":
             plugin.rename_project(stdscr)
@@ -1,63 +1,124 @@
 import os
 import json
+import copy
+from contextlib import contextmanager
+from plubo.utils.files import atomic_write_text
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locking
+    fcntl = None
 
 CONFIG_FILE = os.path.expanduser("~/.pb_cli_config.json")
 
+# Parsed config shared by every Config call in this process, keyed by the
+# file's (mtime, size) so edits from other processes are picked up. A single
+# (stamp, config) tuple, always replaced in one assignment, so a thread never
+# sees the stamp of one load paired with the config of another.
+_CACHE = (None, {})
+
+def _stamp():
+    try:
+        stat = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
 class Config:
     @staticmethod
     def _load_config():
-        """Loads the configuration file if it exists."""
-        if os.path.exists(CONFIG_FILE):
+        """Loads the configuration file if it exists (cached until the file changes)."""
+        global _CACHE
+        stamp = _stamp()
+        cached_stamp, cached_config = _CACHE
+        if stamp == cached_stamp:
+            return cached_config
+
+        config = {}
+        if stamp is not None:
             try:
                 with open(CONFIG_FILE, "r") as file:
-                    return json.load(file)
-            except json.JSONDecodeError:
-                return {}
-        return {}
+                    config = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                config = {}
+        config = config if isinstance(config, dict) else {}
+        _CACHE = (stamp, config)
+        return config
 
     @staticmethod
     def _save_config(config):
-        """Saves the configuration to the file."""
-        with open(CONFIG_FILE, "w") as file:
-            json.dump(config, file, indent=4)
-    
+        """Saves the configuration atomically (temp file + os.replace)."""
+        global _CACHE
+        atomic_write_text(CONFIG_FILE, json.dumps(config, indent=4))
+        _CACHE = (_stamp(), config)
+
+    @staticmethod
+    @contextmanager
+    def _locked():
+        """Holds an exclusive advisory lock so concurrent pb-cli runs don't lose updates."""
+        if fcntl is None:
+            yield
+            return
+        with open(CONFIG_FILE + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """Yields the config for several changes, written once when the block exits.
+
+        with Config.batch() as config:
+            config.setdefault("github", {}).update(username=..., token=...)
+        """
+        with cls._locked():
+            config = copy.deepcopy(cls._load_config())
+            yield config
+            if config != cls._load_config():
+                cls._save_config(config)
+
     @classmethod
     def set(cls, section, key, value):
         """Sets a configuration value."""
-        config = cls._load_config()
-        if section not in config:
-            config[section] = {}
-        config[section][key] = value
-        cls._save_config(config)
-    
+        cls.set_many(section, {key: value})
+
+    @classmethod
+    def set_many(cls, section, values):
+        """Sets several values of a section with a single write."""
+        with cls.batch() as config:
+            config.setdefault(section, {}).update(values)
+
     @classmethod
     def get(cls, section, key, default=None):
         """Gets a configuration value."""
         config = cls._load_config()
         return config.get(section, {}).get(key, default)
-    
+
     @classmethod
     def delete(cls, section, key):
         """Deletes a configuration key."""
-        config = cls._load_config()
-        if section in config and key in config[section]:
-            del config[section][key]
-            cls._save_config(config)
-    
+        with cls.batch() as config:
+            if section in config and key in config[section]:
+                del config[section][key]
+
     @classmethod
     def clear_section(cls, section):
         """Clears all settings under a section."""
-        config = cls._load_config()
-        if section in config:
-            del config[section]
-            cls._save_config(config)
-    
+        with cls.batch() as config:
+            config.pop(section, None)
+
     @classmethod
     def clear_all(cls):
         """Clears the entire configuration file."""
-        if os.path.exists(CONFIG_FILE):
-            os.remove(CONFIG_FILE)
-    
+        global _CACHE
+        with cls._locked():
+            if os.path.exists(CONFIG_FILE):
+                os.remove(CONFIG_FILE)
+            _CACHE = (None, {})
+
     @classmethod
     def sections(cls):
         """Returns a list of all top-level sections in the configuration."""
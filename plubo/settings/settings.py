@@ -65,8 +65,7 @@ def configure_service(stdscr, service):
     is_valid = validate_github_token(token) if service_key == 'github' else validate_gitlab_token(token)
     
     if is_valid:
-        Config.set(service_key, "username", username)
-        Config.set(service_key, "token", token)
+        Config.set_many(service_key, {"username": username, "token": token})
         interface.display_message(stdscr, f"✅ {service} credentials saved!", "success")
     else:
         interface.display_message(stdscr, f"❌ {service} credentials not saved! Invalid token.", "error")
@@ -87,8 +86,7 @@ def add_custom_domain(stdscr):
 
     try:
         if token and validate_gitlab_token(token, domain):
-            Config.set(domain, "username", username)
-            Config.set(domain, "token", token)
+            Config.set_many(domain, {"username": username, "token": token})
             interface.display_message(stdscr, f"✅ Custom domain {domain} saved!", "success")
         else:
             interface.display_message(stdscr, f"❌ Custom domain {domain} not saved! Invalid token.", "error")
@@ -113,10 +111,11 @@ def modify_custom_domain(stdscr, domain):
     new_token = interface.get_user_input(stdscr, y_start, box_x, "Enter your token:", 40, hidden=True)    
         
     if new_token and validate_gitlab_token(new_token, domain):
+        credentials = {"token": new_token}
         if new_username:
-            Config.set(domain, "username", new_username)
-        
-        Config.set(domain, "token", new_token)
+            credentials["username"] = new_username
+
+        Config.set_many(domain, credentials)
         interface.display_message(stdscr, f"✅ Credentials for {domain} updated!", "success")
     else:
         interface.display_message(stdscr, f"❌ Credentials for {domain} not updated! Token is not valid.", "error")
@@ -0,0 +1,152 @@
+"""Content-hash build stamps so unchanged plugins skip `yarn` and `yarn build`.
+
+The stamp of a plugin records three hashes from its last successful run:
+
+- install: package.json, yarn.lock and .yarnrc.yml;
+- sources: the install inputs plus vite.config.* and the src/scripts and
+  src/styles trees;
+- outputs: the Vite output directory (build.outDir, `dist` by default).
+
+`yarn` is skipped while the install hash matches and the dependencies are
+still installed; `yarn build` is skipped while both the sources and the
+outputs match what the last build produced.
+"""
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from plubo.utils import steps
+from plubo.utils.files import atomic_write_text, cache_dir, sha256_bytes
+
+INSTALL_INPUTS = ("package.json", "yarn.lock", ".yarnrc.yml")
+SOURCE_TREES = ("src/scripts", "src/styles")
+DEFAULT_OUTPUT_DIRECTORY = "dist"
+OUT_DIR_PATTERN = re.compile(r"""outDir\s*:\s*['"`]([^'"`]+)['"`]""")
+
+
+def _iter_files(path):
+    if path.is_file():
+        yield path
+    elif path.is_dir():
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                yield Path(directory) / filename
+
+
+def hash_paths(root, paths):
+    """Hash the names and contents of the given files and trees under root.
+
+    Returns None when none of them exist.
+    """
+    root = Path(root)
+    digest = hashlib.sha256()
+    found = False
+    for relative in paths:
+        for file in _iter_files(root / relative):
+            found = True
+            digest.update(Path(os.path.relpath(file, root)).as_posix().encode("utf-8") + b"\0")
+            with file.open("rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+    return digest.hexdigest() if found else None
+
+
+def vite_configs(root):
+    return sorted(path.name for path in Path(root).glob("vite.config.*"))
+
+
+def output_directory(root):
+    """The Vite build.outDir of the plugin, relative to root."""
+    for name in vite_configs(root):
+        try:
+            match = OUT_DIR_PATTERN.search((Path(root) / name).read_text(encoding="utf-8"))
+        except OSError:
+            continue
+        if match:
+            return os.path.normpath(match.group(1))
+    return DEFAULT_OUTPUT_DIRECTORY
+
+
+def install_hash(root):
+    return hash_paths(root, INSTALL_INPUTS)
+
+
+def source_hash(root):
+    return hash_paths(root, (*INSTALL_INPUTS, *vite_configs(root), *SOURCE_TREES))
+
+
+def output_hash(root):
+    return hash_paths(root, (output_directory(root),))
+
+
+def dependencies_installed(root):
+    root = Path(root)
+    return (root / "node_modules").is_dir() or (root / ".pnp.cjs").is_file()
+
+
+class BuildStamp:
+    """The last successful install/build hashes of one plugin, kept in the pb-cli cache."""
+
+    def __init__(self, plugin_root):
+        self.plugin_root = Path(plugin_root).resolve()
+        self.path = cache_dir("builds") / f"{sha256_bytes(str(self.plugin_root).encode())[:16]}.json"
+        try:
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.data = {}
+
+    def install_needed(self):
+        current = install_hash(self.plugin_root)
+        return current is None or current != self.data.get("install") or not dependencies_installed(self.plugin_root)
+
+    def build_needed(self):
+        current_sources = source_hash(self.plugin_root)
+        current_outputs = output_hash(self.plugin_root)
+        return (
+            current_sources is None
+            or current_outputs is None
+            or current_sources != self.data.get("sources")
+            or current_outputs != self.data.get("outputs")
+        )
+
+    def record_install(self):
+        self.data["install"] = install_hash(self.plugin_root)
+        self._save()
+
+    def record_build(self):
+        # Hashed after the run: `yarn` may rewrite yarn.lock, the build writes the outputs
+        self.data["sources"] = source_hash(self.plugin_root)
+        self.data["outputs"] = output_hash(self.plugin_root)
+        self._save()
+
+    def record(self, results):
+        """Store the hashes of the node steps that succeeded in a run_steps() result."""
+        if "yarn" in results and results["yarn"].ok:
+            self.record_install()
+        if "yarn build" in results and results["yarn build"].ok:
+            self.record_build()
+
+    def _save(self):
+        atomic_write_text(self.path, json.dumps(self.data, indent=2))
+
+
+def node_steps(plugin_root, force=False, lane="node"):
+    """Return (steps, skipped_names, stamp) for the `yarn` / `yarn build` steps still needed."""
+    stamp = BuildStamp(plugin_root)
+    install = force or stamp.install_needed()
+    build = force or stamp.build_needed()  # The source hash covers the lockfile too
+
+    node = []
+    skipped = []
+    if install:
+        node.append(steps.Step("yarn", ["yarn"], lane=lane))
+    else:
+        skipped.append("yarn")
+    if build:
+        node.append(steps.Step("yarn build", ["yarn", "build"], after=("yarn",) if install else (), lane=lane))
+    else:
+        skipped.append("yarn build")
+    return node, skipped, stamp
@@ -23,6 +23,8 @@ CUSTOM_RGB_COLORS = {
 
 # Regex pattern to match ANSI escape sequences
 ANSI_PATTERN = re.compile(r'\x1B\[(\d+)m')
+# Any CSI escape sequence (colors, cursor movement, line clearing)
+ANSI_ANY_PATTERN = re.compile(r'\x1B\[[0-9;?]*[A-Za-z]')
 
 def init_colors():
     curses.start_color()
@@ -127,4 +129,8 @@ def wrap_text(segments, max_width):
     if current_line:
         wrapped_lines.append(current_line)  # Append any remaining text
 
-    return wrapped_lines
\ No newline at end of file
+    return wrapped_lines
+
+def strip_ansi(text):
+    """Remove every ANSI escape sequence from text (used for plain-text logs)."""
+    return ANSI_ANY_PATTERN.sub('', text)
@@ -0,0 +1,118 @@
+"""Plan file edits in memory and write each touched file once.
+
+Every change goes through an EditPlan: reads see the pending content of
+files already edited in the plan, so several edits to the same file
+accumulate into a single write. Nothing touches the disk until write(),
+which first checks that no planned file changed since it was read and
+then writes the files in parallel, each one atomically.
+"""
+import difflib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+from plubo.utils.files import atomic_write_text
+
+WRITE_WORKERS = 8
+
+
+@dataclass
+class PlannedFile:
+    path: Path
+    original: Optional[str]  # None for a file the plan creates
+    content: str
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def is_new(self):
+        return self.original is None
+
+
+class EditPlan:
+    def __init__(self, root):
+        self.root = Path(root)
+        self.files = {}
+
+    def exists(self, path):
+        return Path(path) in self.files or Path(path).exists()
+
+    def read(self, path):
+        """Pending content of path, falling back to the file on disk."""
+        path = Path(path)
+        planned = self.files.get(path)
+        if planned is not None:
+            return planned.content
+        return path.read_text(encoding="utf-8")
+
+    def create(self, path, content, note):
+        path = Path(path)
+        if self.exists(path):
+            raise FileExistsError(path)
+        self.files[path] = PlannedFile(path, None, content, [note])
+
+    def update(self, path, content, note):
+        path = Path(path)
+        planned = self.files.get(path)
+        if planned is None:
+            planned = self.files[path] = PlannedFile(path, path.read_text(encoding="utf-8"), content)
+        planned.content = content
+        planned.notes.append(note)
+
+    def relative(self, path):
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path)
+
+    def changed_files(self):
+        return [planned for planned in self.files.values() if planned.content != planned.original]
+
+    def diff(self):
+        """Unified diff of every planned change, relative to the plan root."""
+        lines = []
+        for planned in self.changed_files():
+            name = self.relative(planned.path)
+            lines.extend(difflib.unified_diff(
+                (planned.original or "").splitlines(keepends=True),
+                planned.content.splitlines(keepends=True),
+                fromfile="/dev/null" if planned.is_new else f"a/{name}",
+                tofile=f"b/{name}",
+            ))
+        return "".join(line if line.endswith("\n") else line + "\n" for line in lines)
+
+    def conflicts(self):
+        """Planned files that were created or modified on disk since they were planned."""
+        conflicting = []
+        for planned in self.changed_files():
+            if planned.is_new:
+                if planned.path.exists():
+                    conflicting.append(planned.path)
+                continue
+            try:
+                current = planned.path.read_text(encoding="utf-8")
+            except OSError:
+                current = None
+            if current != planned.original:
+                conflicting.append(planned.path)
+        return conflicting
+
+    def write(self, workers=WRITE_WORKERS):
+        """Write every changed file once, in parallel. Returns the written paths.
+
+        Raises FileExistsError when a planned file changed on disk since
+        it was planned; nothing is written in that case.
+        """
+        conflicting = self.conflicts()
+        if conflicting:
+            raise FileExistsError(", ".join(self.relative(path) for path in conflicting))
+
+        def write_file(planned):
+            planned.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(planned.path, planned.content)
+            return planned.path
+
+        changed = self.changed_files()
+        if not changed:
+            return []
+        with ThreadPoolExecutor(max_workers=min(workers, len(changed))) as executor:
+            return list(executor.map(write_file, changed))
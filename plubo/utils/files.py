@@ -0,0 +1,72 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+# Read once at import time: os.umask() can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def cache_dir(*parts):
+    """Return (and create) a directory under the pb-cli cache.
+
+    The cache lives in $PB_CLI_CACHE_DIR, falling back to
+    $XDG_CACHE_HOME/pb-cli or ~/.cache/pb-cli.
+    """
+    base = os.environ.get("PB_CLI_CACHE_DIR")
+    if not base:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(xdg_cache, "pb-cli")
+
+    path = Path(base).joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def env_seconds(name, default):
+    """Read a duration in seconds from the environment, falling back to default when unset or invalid."""
+    value = os.environ.get(name, "").strip()
+    try:
+        seconds = int(value)
+    except ValueError:
+        return default
+    return seconds if seconds >= 0 else default
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(path, data):
+    """Write data to path through a temporary sibling file and os.replace.
+
+    Readers never observe a half-written file. The original permissions are
+    kept when path already exists; new files get the usual umask defaults.
+    """
+    path = Path(path)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as f:
+            f.write(data)
+        if path.exists():
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        else:
+            os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def atomic_write_text(path, text, encoding="utf-8"):
+    atomic_write_bytes(path, text.encode(encoding))
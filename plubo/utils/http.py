@@ -0,0 +1,214 @@
+"""Shared HTTP client for the GitHub and GitLab APIs.
+
+One pooled `requests.Session` per API and credentials keeps connections
+alive between calls. Every request gets a default timeout, 429/5xx answers
+are retried with exponential backoff (honouring `Retry-After` and the
+rate-limit reset headers), and GET responses that carry an ETag are
+revalidated with `If-None-Match`, so an unchanged resource costs a 304.
+"""
+import email.utils
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 0.5
+MAX_RETRY_WAIT = 60  # Give up instead of sleeping longer than this
+POOL_SIZE = 10
+PAGE_SIZE = 100
+PAGE_WORKERS = 8
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+RequestError = requests.RequestException
+
+
+def _header_seconds(response):
+    """Seconds to wait according to Retry-After or a rate-limit reset header, or None."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        if retry_after.strip().isdigit():
+            return int(retry_after)
+        try:
+            return max(0, email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    # GitHub: X-RateLimit-Reset (epoch), GitLab: RateLimit-Reset (epoch)
+    remaining = response.headers.get("X-RateLimit-Remaining", response.headers.get("RateLimit-Remaining"))
+    reset = response.headers.get("X-RateLimit-Reset", response.headers.get("RateLimit-Reset"))
+    if remaining == "0" and reset and reset.isdigit():
+        return max(0, int(reset) - time.time())
+    return None
+
+
+def _is_rate_limited(response):
+    if response.status_code == 429:
+        return True
+    # GitHub answers 403 once the primary rate limit is exhausted
+    return response.status_code == 403 and (
+        response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers
+    )
+
+
+def _total_pages(response):
+    total = response.headers.get("X-Total-Pages")
+    if total and total.isdigit():
+        return int(total)
+    last_url = response.links.get("last", {}).get("url")
+    if last_url:
+        page = parse_qs(urlparse(last_url).query).get("page", [""])[0]
+        if page.isdigit():
+            return int(page)
+    if not response.links.get("next"):
+        return 1  # Single page
+    return None
+
+
+class ApiClient:
+    """Session-backed client for one API base URL.
+
+    POST/PATCH requests are only retried when the server says it did not
+    process them (rate limiting), so a retry never creates a repository or
+    a release twice.
+    """
+
+    def __init__(self, base_url, headers=None, timeout=DEFAULT_TIMEOUT, retries=MAX_RETRIES, backoff=BACKOFF_SECONDS):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(headers or {})
+        self._etags = {}
+        self._lock = threading.Lock()
+
+    def url(self, path):
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def _retry_delay(self, response, attempt):
+        delay = _header_seconds(response) if response is not None else None
+        if delay is None:
+            delay = self.backoff * (2 ** attempt)
+        return delay
+
+    def _should_retry(self, method, response, attempt):
+        if attempt >= self.retries:
+            return False
+        if _is_rate_limited(response):
+            return True
+        return response.status_code in RETRY_STATUSES and method in IDEMPOTENT_METHODS
+
+    def request(self, method, path, headers=None, **kwargs):
+        method = method.upper()
+        url = self.url(path)
+        kwargs.setdefault("timeout", self.timeout)
+        headers = dict(headers or {})
+
+        cache_key = None
+        cached = None
+        if method == "GET":
+            cache_key = (url, repr(sorted((kwargs.get("params") or {}).items())), repr(sorted(headers.items())))
+            with self._lock:
+                cached = self._etags.get(cache_key)
+            if cached:
+                headers["If-None-Match"] = cached[0]
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, headers=headers, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.retries or method not in IDEMPOTENT_METHODS:
+                    raise
+                time.sleep(self._retry_delay(None, attempt))
+                attempt += 1
+                continue
+
+            if not self._should_retry(method, response, attempt):
+                break
+            delay = self._retry_delay(response, attempt)
+            if delay > MAX_RETRY_WAIT:
+                break
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        if cache_key is None:
+            return response
+        if response.status_code == 304 and cached:
+            return cached[1]
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            response.content  # Read the body now so the cached response can be reused
+            with self._lock:
+                self._etags[cache_key] = (etag, response)
+        return response
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def get_all(self, path, params=None, per_page=PAGE_SIZE, workers=PAGE_WORKERS):
+        """Return the items of every page of a list endpoint.
+
+        The first page tells how many pages there are (GitLab's
+        X-Total-Pages, or the page number of GitHub's `rel="last"` link);
+        the remaining pages are then fetched concurrently. Without either,
+        `rel="next"` links are followed one by one. Raises HTTPError on
+        a failed page.
+        """
+        params = dict(params or {}, per_page=per_page)
+        first = self.get(path, params=dict(params, page=1))
+        first.raise_for_status()
+        items = list(first.json())
+
+        total_pages = _total_pages(first)
+        if total_pages is None:
+            next_url = first.links.get("next", {}).get("url")
+            while next_url:
+                response = self.get(next_url)
+                response.raise_for_status()
+                items.extend(response.json())
+                next_url = response.links.get("next", {}).get("url")
+            return items
+
+        def fetch(page):
+            response = self.get(path, params=dict(params, page=page))
+            response.raise_for_status()
+            return response.json()
+
+        pages = range(2, total_pages + 1)
+        if pages:
+            with ThreadPoolExecutor(max_workers=min(workers, len(pages))) as executor:
+                for page_items in executor.map(fetch, pages):
+                    items.extend(page_items)
+        return items
+
+    def close(self):
+        self.session.close()
+
+
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(base_url, headers=None):
+    """Return the shared ApiClient for a base URL and set of headers (e.g. a token)."""
+    key = (base_url.rstrip("/"), tuple(sorted((headers or {}).items())))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = ApiClient(base_url, headers)
+        return client
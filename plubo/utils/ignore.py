@@ -0,0 +1,104 @@
+import re
+from pathlib import Path
+
+
+def _glob_to_regex(pattern):
+    """Translate a gitignore glob (without leading/trailing slashes) to a regex body."""
+    regex = ""
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            regex += "(?:.*/)?"
+            index += 3
+            continue
+        if pattern.startswith("/**", index) and index + 3 == len(pattern):
+            regex += "/.*"
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            regex += ".*"
+            index += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            closing = pattern.find("]", index + 1)
+            if closing < 0:
+                regex += re.escape(char)
+            else:
+                body = pattern[index + 1:closing]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                regex += f"[{body}]"
+                index = closing
+        elif char == "\\" and index + 1 < len(pattern):
+            index += 1
+            regex += re.escape(pattern[index])
+        else:
+            regex += re.escape(char)
+        index += 1
+    return regex
+
+
+class IgnoreRules:
+    """A small gitignore-style matcher for .gitignore/.distignore files.
+
+    Supports comments, negation (`!`), directory-only rules (trailing `/`),
+    anchored rules (leading or inner `/`) and `*`, `?`, `[...]` and `**`
+    globs. Paths are matched relative to the root the rules were loaded for;
+    the last matching rule wins, as in git.
+    """
+
+    def __init__(self, patterns=()):
+        self.rules = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern):
+        pattern = pattern.rstrip("\n").rstrip()
+        if not pattern or pattern.startswith("#"):
+            return
+
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        if pattern.startswith("\\"):
+            pattern = pattern[1:]
+
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = "/" in pattern
+        pattern = pattern.lstrip("/")
+        if not pattern:
+            return
+
+        prefix = "^" if anchored else "^(?:.*/)?"
+        self.rules.append((re.compile(prefix + _glob_to_regex(pattern) + "$"), negated, directory_only))
+
+    @classmethod
+    def from_files(cls, root, filenames=(".gitignore",)):
+        """Load the rules of every existing ignore file in root, in order."""
+        rules = cls()
+        for filename in filenames:
+            ignore_file = Path(root) / filename
+            if not ignore_file.is_file():
+                continue
+            for line in ignore_file.read_text(encoding="utf-8", errors="replace").splitlines():
+                rules.add(line)
+        return rules
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def is_ignored(self, relative_path, is_dir=False):
+        """Return True when the POSIX-style relative_path is excluded by the rules."""
+        ignored = False
+        for regex, negated, directory_only in self.rules:
+            if directory_only and not is_dir:
+                continue
+            if regex.match(relative_path):
+                ignored = not negated
+        return ignored
@@ -44,12 +44,13 @@ def draw_background(stdscr, title=None):
             stdscr.addstr(2 + i, (width // 2) - (len(line) // 2), line, curses.color_pair(3) | curses.A_BOLD)
 
     # Plugin Name / WordPress Path Info
-    plugin_name = project.detect_plugin_name()
+    context = project.get_context()
+    plugin_name = context.plugin_slug
     if plugin_name:
         plugin_text = f"Plugin: {plugin_name}"
         stdscr.addstr(text_position, (width - len(plugin_text)) // 2, plugin_text, curses.color_pair(3) | curses.A_DIM)
     else:
-        wp_root = project.detect_wp_root()
+        wp_root = context.wp_root
         if not wp_root:
             wp_text = f"No WordPress installation found!"
             stdscr.addstr(text_position, (width - len(wp_text)) // 2, wp_text, curses.color_pair(3) | curses.A_DIM)
@@ -89,12 +90,13 @@ def render_menu(stdscr, menu_options, current_row, height, width):
         stdscr.addstr(2 + i, (width // 2) - (len(line) // 2), line, curses.color_pair(4) | curses.A_BOLD)
     
     # Plugin name display
-    plugin_name = project.detect_plugin_name()
+    context = project.get_context()
+    plugin_name = context.plugin_slug
     if plugin_name:
         plugin_text = f"Plugin: {plugin_name}"
         stdscr.addstr(5, (width - len(plugin_text)) // 2, plugin_text, curses.color_pair(3) | curses.A_DIM)
     else:
-        wp_root = project.detect_wp_root()
+        wp_root = context.wp_root
         if not wp_root:
             wp_text = "No WordPress installation found!"
             stdscr.addstr(5, (width - len(wp_text)) // 2, wp_text, curses.color_pair(3) | curses.A_DIM)
@@ -213,6 +215,32 @@ def display_message(stdscr, message, msg_type="info", y=15, x=4):
 
 
 
+def progress_reporter(stdscr, label, y, x=4):
+    """Return a progress(done, total) callback that draws a counter line.
+
+    The line is only repainted when the percentage changes, so reporting
+    thousands of files costs at most a hundred screen updates.
+    """
+    last_percent = None
+
+    def report(done, total):
+        nonlocal last_percent
+        percent = done * 100 // total if total else 100
+        if percent == last_percent:
+            return
+        last_percent = percent
+
+        max_y, max_x = stdscr.getmaxyx()
+        if y >= max_y:
+            return
+        text = f"{label}: {done}/{total} ({percent}%)"
+        stdscr.addstr(y, x, text[: max(0, max_x - x - 1)], curses.color_pair(2) | curses.A_BOLD)
+        stdscr.refresh()
+
+    return report
+
+
+
 def draw_input_box(stdscr, y, x, question_lines, input_lines, box_width, border_color, text_color, hidden=False):
     """
     Redraws the entire input box based on the current content.
@@ -0,0 +1,189 @@
+"""Format-preserving edits on JSON text.
+
+These helpers work on the raw document instead of a parse/dump round trip,
+so indentation, key order, spacing and trailing newlines survive untouched
+and only the edited tokens change in the output.
+"""
+import json
+import re
+
+STRING_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+WHITESPACE = " \t\r\n"
+
+
+def _string_start(text, index):
+    """Return the opening quote of the string token containing index."""
+    while True:
+        index = text.rfind('"', 0, index)
+        backslashes = 0
+        while text[index - backslashes - 1] == "\\":
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return index
+
+
+def replace_strings(text, replacer):
+    """Apply a MultiReplacer to every string token (keys and values) of a JSON document.
+
+    Returns (new_text, count). Names can only occur inside string tokens,
+    so the document is searched for matches directly and only the tokens
+    around them are visited. Strings without escapes are edited in place;
+    strings with escapes are decoded, replaced and re-encoded individually.
+    """
+    if replacer.pattern is None:
+        return text, 0
+
+    pieces = []
+    count = 0
+    last_end = 0
+    match = replacer.pattern.search(text)
+    while match:
+        token = STRING_TOKEN.match(text, _string_start(text, match.start()))
+        raw = token.group(0)[1:-1]
+        if "\\" in raw:
+            value, replaced = replacer.subn(json.loads(token.group(0)))
+            new_token = json.dumps(value, ensure_ascii=False)
+        else:
+            value, replaced = replacer.subn(raw)
+            new_token = f'"{value}"'
+
+        if replaced:
+            pieces.append(text[last_end:token.start()])
+            pieces.append(new_token)
+            last_end = token.end()
+            count += replaced
+        match = replacer.pattern.search(text, token.end())
+
+    pieces.append(text[last_end:])
+    return "".join(pieces), count
+
+
+def _skip_whitespace(text, index):
+    while index < len(text) and text[index] in WHITESPACE:
+        index += 1
+    return index
+
+
+def _value_end(text, index):
+    """Return the index right after the JSON value starting at index."""
+    if text[index] == '"':
+        return STRING_TOKEN.match(text, index).end()
+
+    if text[index] in "{[":
+        depth = 0
+        while index < len(text):
+            char = text[index]
+            if char == '"':
+                index = STRING_TOKEN.match(text, index).end()
+                continue
+            if char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+            index += 1
+        raise ValueError("Unterminated JSON container")
+
+    while index < len(text) and text[index] not in ",}]" + WHITESPACE:
+        index += 1
+    return index
+
+
+def _object_members(text, open_index):
+    """Return ([(key, key_start, value_start, value_end)], close_index) for the object at open_index."""
+    members = []
+    index = _skip_whitespace(text, open_index + 1)
+    while text[index] != "}":
+        key_end = STRING_TOKEN.match(text, index).end()
+        key = json.loads(text[index:key_end])
+        value_start = _skip_whitespace(text, _skip_whitespace(text, key_end) + 1)
+        value_end = _value_end(text, value_start)
+        members.append((key, index, value_start, value_end))
+        index = _skip_whitespace(text, value_end)
+        if text[index] == ",":
+            index = _skip_whitespace(text, index + 1)
+    return members, index
+
+
+def _line_indent(text, index):
+    line_start = text.rfind("\n", 0, index) + 1
+    indent_end = line_start
+    while indent_end < len(text) and text[indent_end] in " \t":
+        indent_end += 1
+    return text[line_start:indent_end]
+
+
+def _indent_unit(text):
+    """Guess the document's indentation step (defaults to two spaces)."""
+    match = re.search(r"\n([ \t]+)\S", text)
+    return match.group(1) if match else "  "
+
+
+def insert_members(text, path, members):
+    """Add members to the object at path (a list of keys) unless the keys already exist.
+
+    Missing objects along path are created. New members follow the
+    indentation and key/value separator of their siblings. Returns
+    (new_text, added_keys).
+    """
+    open_index = _skip_whitespace(text, 0)
+    if text[open_index] != "{":
+        raise ValueError("The JSON document is not an object")
+
+    for position, key in enumerate(path):
+        object_members, close_index = _object_members(text, open_index)
+        found = next((member for member in object_members if member[0] == key), None)
+        if found is None:
+            nested = dict(members)
+            for missing_key in reversed(path[position + 1:]):
+                nested = {missing_key: nested}
+            text, _ = _insert_into_object(text, open_index, {key: nested})
+            return text, list(members)
+        if text[found[2]] != "{":
+            raise ValueError(f"JSON member {key!r} is not an object")
+        open_index = found[2]
+
+    return _insert_into_object(text, open_index, members)
+
+
+def _insert_into_object(text, open_index, members):
+    object_members, close_index = _object_members(text, open_index)
+    existing = {member[0] for member in object_members}
+    additions = {key: value for key, value in members.items() if key not in existing}
+    if not additions:
+        return text, []
+
+    unit = _indent_unit(text)
+    closing_indent = _line_indent(text, close_index)
+    multiline = "\n" in text[open_index:close_index] or not object_members
+    if object_members:
+        first_key, key_start, value_start, value_end = object_members[0]
+        member_indent = _line_indent(text, key_start)
+        key_end = STRING_TOKEN.match(text, key_start).end()
+        separator = text[key_end:value_start]
+    else:
+        member_indent = closing_indent + unit
+        separator = ": "
+
+    def render(key, value):
+        if multiline:
+            rendered = json.dumps(value, indent=unit, ensure_ascii=False).replace("\n", "\n" + member_indent)
+        else:
+            rendered = json.dumps(value, ensure_ascii=False)
+        return json.dumps(key, ensure_ascii=False) + separator + rendered
+
+    rendered_members = [render(key, value) for key, value in additions.items()]
+    joiner = ",\n" + member_indent if multiline else ", "
+    block = joiner.join(rendered_members)
+
+    if object_members:
+        insert_at = object_members[-1][3]
+        insertion = joiner + block
+    else:
+        insert_at = open_index + 1
+        insertion = "\n" + member_indent + block + "\n" + closing_indent
+        # Drop whitespace already inside the empty braces
+        text = text[:insert_at] + text[close_index:]
+
+    return text[:insert_at] + insertion + text[insert_at:], list(additions)
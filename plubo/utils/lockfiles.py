@@ -0,0 +1,130 @@
+"""Read installed dependency versions straight from lock files.
+
+Only the direct dependencies declared in composer.json / package.json are
+reported, with the version the lock file (or the installed tree, as a
+fallback) pins them to.
+"""
+import json
+from pathlib import Path
+
+
+def _load_json(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _is_composer_package(name):
+    return "/" in name and not name.startswith(("ext-", "lib-"))
+
+
+def composer_direct_dependencies(project_dir):
+    composer_data = _load_json(Path(project_dir) / "composer.json") or {}
+    names = []
+    for section in ("require", "require-dev"):
+        requirements = composer_data.get(section)
+        if isinstance(requirements, dict):
+            names.extend(name for name in requirements if _is_composer_package(name))
+    return names
+
+
+def composer_installed_versions(project_dir):
+    """Return {package: version} for direct Composer dependencies.
+
+    Reads composer.lock, falling back to vendor/composer/installed.json
+    (Composer 1 list or Composer 2 `packages` object).
+    """
+    project_dir = Path(project_dir)
+    packages = []
+    lock_data = _load_json(project_dir / "composer.lock")
+    if isinstance(lock_data, dict):
+        packages = (lock_data.get("packages") or []) + (lock_data.get("packages-dev") or [])
+    else:
+        installed = _load_json(project_dir / "vendor" / "composer" / "installed.json")
+        if isinstance(installed, dict):
+            packages = installed.get("packages") or []
+        elif isinstance(installed, list):
+            packages = installed
+
+    locked = {package.get("name"): package.get("version") for package in packages if isinstance(package, dict)}
+    return {
+        name: locked[name]
+        for name in composer_direct_dependencies(project_dir)
+        if locked.get(name)
+    }
+
+
+def node_direct_dependencies(project_dir):
+    """Return {package: range} for dependencies and devDependencies in package.json."""
+    package_data = _load_json(Path(project_dir) / "package.json") or {}
+    dependencies = {}
+    for section in ("dependencies", "devDependencies"):
+        requirements = package_data.get(section)
+        if isinstance(requirements, dict):
+            dependencies.update(requirements)
+    return dependencies
+
+
+def _descriptor_name(descriptor):
+    at_index = descriptor.find("@", 1)  # Skip the leading @ of scoped packages
+    return descriptor[:at_index] if at_index > 0 else descriptor
+
+
+def parse_yarn_lock(text):
+    """Parse a Yarn v1 or Berry lock file.
+
+    Returns {descriptor: version} where descriptors look like `name@range`
+    (Berry's `name@npm:range` is also indexed without the `npm:` protocol).
+    """
+    versions = {}
+    descriptors = []
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        if not line[0].isspace():
+            descriptors = []
+            if line.endswith(":"):
+                for descriptor in line[:-1].split(","):
+                    descriptor = descriptor.strip().strip('"')
+                    if descriptor and descriptor != "__metadata":
+                        descriptors.append(descriptor)
+            continue
+
+        stripped = line.strip()
+        if descriptors and stripped.startswith("version"):
+            version = stripped[len("version"):].lstrip(":").strip().strip('"')
+            for descriptor in descriptors:
+                versions[descriptor] = version
+                versions[descriptor.replace("@npm:", "@", 1)] = version
+            descriptors = []
+    return versions
+
+
+def node_installed_versions(project_dir):
+    """Return {package: version} for direct Node dependencies.
+
+    Reads yarn.lock, falling back to node_modules/<package>/package.json.
+    """
+    project_dir = Path(project_dir)
+    dependencies = node_direct_dependencies(project_dir)
+    try:
+        locked = parse_yarn_lock((project_dir / "yarn.lock").read_text(encoding="utf-8"))
+    except OSError:
+        locked = {}
+
+    versions_by_name = {}
+    for descriptor, version in locked.items():
+        versions_by_name.setdefault(_descriptor_name(descriptor), set()).add(version)
+
+    installed = {}
+    for name, requested_range in dependencies.items():
+        version = locked.get(f"{name}@{requested_range}")
+        if not version and len(versions_by_name.get(name, ())) == 1:
+            version = next(iter(versions_by_name[name]))
+        if not version:
+            manifest = _load_json(project_dir / "node_modules" / name / "package.json")
+            version = manifest.get("version") if isinstance(manifest, dict) else None
+        if version:
+            installed[name] = version
+    return installed
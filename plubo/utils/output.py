@@ -0,0 +1,194 @@
+import curses
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from plubo.utils import colors
+from plubo.utils.files import cache_dir
+
+FRAMES_PER_SECOND = 20
+SCROLLBACK_LINES = 5000  # Lines kept in memory per pane; the log file has everything
+MAX_COMMAND_LOGS = 50  # Older logs are deleted when a new one is created
+
+
+def _prune_logs(log_directory, keep):
+    """Delete all but the `keep` most recently modified logs."""
+    logs = []
+    for path in log_directory.glob("*.log"):
+        try:
+            logs.append((path.stat().st_mtime, path))
+        except OSError:
+            continue  # Removed concurrently
+    logs.sort(reverse=True)
+    for _, path in logs[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def command_log_path(command):
+    """Return a fresh log file path under the pb-cli cache for a command, pruning old logs."""
+    parts = [Path(str(command[0])).name] + [str(part) for part in command[1:3]] if command else []
+    name = re.sub(r"[^A-Za-z0-9]+", "-", " ".join(parts)).strip("-")[:60]
+    log_directory = cache_dir("logs")
+    _prune_logs(log_directory, MAX_COMMAND_LOGS - 1)
+    return log_directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{name or 'command'}.log"
+
+
+class OutputPane:
+    """Bordered curses window that shows the tail of a command's output.
+
+    Lines are appended from a reader thread into a bounded ring buffer and
+    only marked dirty; `render` repaints the visible rows with
+    `noutrefresh`, so callers batch several panes into a single `doupdate`.
+    PageUp/PageDown and the arrow keys scroll back through the buffer.
+    """
+
+    def __init__(self, y, x, height, width, title=None, log_path=None):
+        self.window = curses.newwin(height, width, y, x)
+        self.window.keypad(True)
+        self.window.nodelay(True)
+        self.height = height
+        self.width = width
+        self.title = title
+        self.lines = deque(maxlen=SCROLLBACK_LINES)
+        self.lock = threading.Lock()
+        self.dirty = True
+        self.offset = 0  # Rows scrolled back from the bottom
+        self.log_path = log_path
+        self.log_file = log_path.open("w", encoding="utf-8") if log_path else None
+
+    @property
+    def rows(self):
+        return max(1, self.height - 2)
+
+    def append(self, line):
+        # Progress bars redraw with \r; only the last state of the line matters
+        line = line.rstrip("\r\n").rsplit("\r", 1)[-1]
+        with self.lock:
+            self.lines.append(line)
+            self.dirty = True
+        if self.log_file:
+            self.log_file.write(colors.strip_ansi(line) + "\n")
+
+    def scroll(self, delta):
+        with self.lock:
+            self.offset = min(max(0, self.offset + delta), max(0, len(self.lines) - 1))
+            self.dirty = True
+
+    def handle_key(self, key):
+        steps = {
+            curses.KEY_PPAGE: self.rows,
+            curses.KEY_NPAGE: -self.rows,
+            curses.KEY_UP: 1,
+            curses.KEY_DOWN: -1,
+        }
+        if key in steps:
+            self.scroll(steps[key])
+
+    def _visible_rows(self):
+        inner_width = max(1, self.width - 4)
+        wrapped = []
+        for line in islice(reversed(self.lines), self.offset, None):
+            wrapped[:0] = colors.wrap_text(colors.parse_ansi_colors(line), inner_width) or [[]]
+            if len(wrapped) >= self.rows:
+                break
+        return wrapped[-self.rows:]
+
+    def render(self):
+        """Repaint into the virtual screen if needed. Returns True when something was drawn."""
+        with self.lock:
+            if not self.dirty:
+                return False
+            self.dirty = False
+            visible_rows = self._visible_rows()
+
+        inner_width = max(1, self.width - 4)
+        self.window.erase()
+        self.window.border()
+        if self.title:
+            self.window.addnstr(0, 2, f" {self.title} ", inner_width)
+        if self.offset:
+            self.window.addnstr(self.height - 1, 2, f" ↑ {self.offset} ", inner_width)
+
+        for row, wrapped_line in enumerate(visible_rows, start=1):
+            col_x = 2
+            for segment_text, color_pair in wrapped_line:
+                remaining = inner_width + 2 - col_x
+                if remaining <= 0:
+                    break
+                self.window.addnstr(row, col_x, segment_text, remaining, color_pair)
+                col_x += len(segment_text)
+
+        self.window.noutrefresh()
+        return True
+
+    def close(self):
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+
+
+def start_reader(process, pane):
+    """Drain a process' stdout into pane on a daemon thread."""
+    def pump():
+        for line in iter(process.stdout.readline, ""):
+            pane.append(line)
+        process.stdout.close()
+
+    reader = threading.Thread(target=pump, daemon=True)
+    reader.start()
+    return reader
+
+
+def repaint(panes, focused=None):
+    """Handle pending scroll keys and flush every dirty pane with one doupdate."""
+    focused = focused or panes[0]
+    key = focused.window.getch()
+    while key != -1:
+        focused.handle_key(key)
+        key = focused.window.getch()
+
+    if any([pane.render() for pane in panes]):
+        curses.doupdate()
+
+
+def follow(jobs, frames_per_second=FRAMES_PER_SECOND):
+    """Stream (process, pane) pairs until every process exits.
+
+    The screen is repainted at most `frames_per_second` times per second,
+    however fast the processes write.
+    """
+    frame_interval = 1 / frames_per_second
+    readers = [start_reader(process, pane) for process, pane in jobs]
+    panes = [pane for process, pane in jobs]
+
+    while any(reader.is_alive() for reader in readers):
+        next_frame = time.monotonic() + frame_interval
+        for reader in readers:
+            reader.join(max(0, next_frame - time.monotonic()))
+        repaint(panes)
+
+    for process, pane in jobs:
+        process.wait()
+        pane.close()
+    repaint(panes)
+
+
+def run_in_pane(command, cwd, pane):
+    """Run command, streaming its output into pane. Returns True on success."""
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        cwd=str(cwd),
+    )
+    follow([(process, pane)])
+    return process.returncode == 0
@@ -0,0 +1,148 @@
+"""Batched latest-version lookups against Packagist's p2 metadata.
+
+Metadata of every requested package is fetched concurrently (conditional
+requests with the stored ETag) and the parsed version list is cached on disk
+per package, so later lookups only do a max-scan over pre-parsed keys.
+
+Set PB_CLI_PACKAGIST_DIR to a directory laid out like the p2 API
+(`<dir>/p2/<vendor>/<package>.json`, or `<dir>/<vendor>/<package>.json`) to
+use it as an offline stand-in for the repository.
+
+Packages Packagist does not know (private or custom repositories) can be
+looked up with composer_latest_version(), which asks Composer itself.
+"""
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from plubo.utils.files import atomic_write_text, cache_dir
+from plubo.utils.http import RequestError, get_client
+from plubo.utils.registry import REGISTRY_TTL_SECONDS
+
+PACKAGIST_URL = os.environ.get("PB_CLI_PACKAGIST_URL", "https://repo.packagist.org").rstrip("/")
+DEFAULT_LOOKUP_WORKERS = 8
+
+
+def version_key(version_normalized):
+    """Return a comparable tuple for a stable normalized version (`1.2.3.0`), or None."""
+    if not version_normalized or "-" in version_normalized:
+        return None  # Pre-releases (`-beta1`, `-RC1`) and dev branches (`9999999-dev`)
+    try:
+        return tuple(int(part) for part in version_normalized.split("."))
+    except ValueError:
+        return None
+
+
+def parse_versions(metadata, package_name):
+    """Return [[key, version], ...] for the stable releases in a p2 metadata document.
+
+    Handles the `composer/2.0` minified format, where each entry only lists
+    the fields that changed since the previous one.
+    """
+    entries = (metadata.get("packages") or {}).get(package_name) or []
+    versions = []
+    current = {}
+    for entry in entries:
+        if metadata.get("minified") == "composer/2.0":
+            current.update(entry)
+        else:
+            current = entry
+        key = version_key(current.get("version_normalized"))
+        if key is not None:
+            versions.append([list(key), current.get("version")])
+    return versions
+
+
+def latest_of(versions):
+    """Single max-scan over pre-parsed versions."""
+    best = None
+    for key, version in versions:
+        if best is None or key > best[0]:
+            best = (key, version)
+    return best[1] if best else None
+
+
+def _cache_path(package_name):
+    return cache_dir("packagist") / (package_name.replace("/", "~") + ".json")
+
+
+def _load_cached(package_name):
+    try:
+        return json.loads(_cache_path(package_name).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _fetch_local(package_name, cached, local_dir):
+    for candidate in (local_dir / "p2" / f"{package_name}.json", local_dir / f"{package_name}.json"):
+        if candidate.is_file():
+            stat = candidate.stat()
+            etag = f"{stat.st_mtime_ns}-{stat.st_size}"
+            if cached and cached.get("etag") == etag:
+                return None, etag
+            return json.loads(candidate.read_text(encoding="utf-8")), etag
+    raise FileNotFoundError(package_name)
+
+
+def _fetch_remote(package_name, cached):
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    response = get_client(PACKAGIST_URL).get(f"p2/{package_name}.json", headers=headers)
+    if response.status_code == 304:
+        return None, cached.get("etag")
+    response.raise_for_status()
+    return response.json(), response.headers.get("ETag")
+
+
+def _resolve(package_name, refresh, ttl):
+    """Return the latest stable version of one package, refreshing its cache entry if needed."""
+    cached = _load_cached(package_name)
+    if cached and not refresh and time.time() - cached.get("fetched_at", 0) < ttl:
+        return latest_of(cached["versions"])
+
+    local_dir = os.environ.get("PB_CLI_PACKAGIST_DIR")
+    try:
+        if local_dir:
+            metadata, etag = _fetch_local(package_name, cached, Path(local_dir))
+        else:
+            metadata, etag = _fetch_remote(package_name, cached)
+    except (OSError, ValueError, RequestError):
+        # Offline or unknown package: an expired entry is better than nothing
+        return latest_of(cached["versions"]) if cached else None
+
+    versions = cached["versions"] if metadata is None else parse_versions(metadata, package_name)
+    atomic_write_text(_cache_path(package_name), json.dumps({
+        "etag": etag,
+        "fetched_at": time.time(),
+        "versions": versions,
+    }))
+    return latest_of(versions)
+
+
+def latest_stable_versions(package_names, refresh=False, ttl=REGISTRY_TTL_SECONDS, workers=DEFAULT_LOOKUP_WORKERS):
+    """Return {package: latest stable version or None} for many packages in one pass."""
+    package_names = list(dict.fromkeys(package_names))
+    if not package_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(package_names))) as executor:
+        return dict(zip(package_names, executor.map(lambda name: _resolve(name, refresh, ttl), package_names)))
+
+
+def composer_latest_version(package_name, cwd=None, use_lando=False):
+    """Latest stable version Composer reports for an installed package (`composer show -l`), or None.
+
+    Composer reads the project's own repositories, so this also answers for
+    packages Packagist does not know.
+    """
+    command = ["composer", "show", "--latest", "--format=json", package_name]
+    if use_lando:
+        command = ["lando"] + command
+    try:
+        result = subprocess.run(command, cwd=cwd, capture_output=True, text=True, check=True)
+        latest = json.loads(result.stdout).get("latest")
+    except (OSError, ValueError, AttributeError, subprocess.CalledProcessError):
+        return None
+    if not latest or not latest.lstrip("v")[:1].isdigit() or "-" in latest:
+        return None  # dev branches and pre-releases
+    return latest
@@ -0,0 +1,272 @@
+"""Class/method outline of PHP source, and batched insertions against it.
+
+parse_outline() scans a file once with a small tokenizer that knows where
+strings ('...', "...", `...`), heredocs/nowdocs, comments (//, #, /* */)
+and inline HTML begin and end, so braces inside them never count. `#[`
+starts an attribute, not a comment. The outline records every class-like
+body (class, interface, trait, enum) and function body with their brace
+offsets, plus the top-level `return` statements of each function.
+
+PhpEditor queues any number of insertions against the offsets of one
+outline and applies them in a single join, so adding many blocks to a file
+does not rescan it after every insertion.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+_IDENT = r"[A-Za-z_\x80-\uffff][A-Za-z0-9_\x80-\uffff]*"
+
+TOKEN = re.compile(rf"""
+    (?P<space>\s+)
+  | (?P<comment>
+        //[^\n?]*(?:\?(?!>)[^\n?]*)*
+      | \#(?!\[)[^\n?]*(?:\?(?!>)[^\n?]*)*
+      | /\*.*?(?:\*/|\Z)
+    )
+  | (?P<heredoc><<<[ \t]*(?P<quote>['"]?)(?P<label>{_IDENT})(?P=quote)\r?\n)
+  | (?P<string>
+        '[^'\\]*(?:\\.[^'\\]*)*(?:'|\Z)
+      | "[^"\\]*(?:\\.[^"\\]*)*(?:"|\Z)
+      | `[^`\\]*(?:\\.[^`\\]*)*(?:`|\Z)
+    )
+  | (?P<close_tag>\?>)
+  | (?P<variable>\$+{_IDENT})
+  | (?P<ident>{_IDENT})
+  | (?P<op>\?->|->|::|.)
+""", re.DOTALL | re.VERBOSE)
+OPEN_TAG = re.compile(r"<\?(?:php\b|=)?", re.IGNORECASE)
+METHOD_NAME = re.compile(rf"\bfunction\s+&?\s*({_IDENT})")
+
+CLASS_KEYWORDS = {"class", "interface", "trait", "enum"}
+# A keyword after these tokens is a member or constant name (Foo::class, $x->function)
+MEMBER_ACCESS = {"::", "->", "?->"}
+
+
+@dataclass
+class FunctionOutline:
+    name: Optional[str]  # None for closures
+    start: int  # Offset of the `function` keyword
+    body_start: int = -1  # Offset just after `{`
+    body_end: int = -1  # Offset of the matching `}`
+    returns: List[int] = field(default_factory=list)  # Offsets of top-level `return` statements
+
+
+@dataclass
+class ClassOutline:
+    name: Optional[str]  # None for anonymous classes
+    kind: str
+    start: int
+    body_start: int = -1
+    body_end: int = -1
+    methods: Dict[str, FunctionOutline] = field(default_factory=dict)  # Keyed by lower-cased name
+
+
+@dataclass
+class Outline:
+    classes: List[ClassOutline] = field(default_factory=list)
+    functions: Dict[str, FunctionOutline] = field(default_factory=dict)  # Top-level functions
+
+    def find_class(self, name=None):
+        """The class named `name` (case-insensitive), or the first named class."""
+        for class_outline in self.classes:
+            if class_outline.name and (name is None or class_outline.name.lower() == name.lower()):
+                return class_outline
+        return None
+
+    def method(self, name, class_name=None):
+        """The first method called `name` (case-insensitive), optionally within class_name."""
+        key = name.lower()
+        for class_outline in self.classes:
+            if class_name and (class_outline.name or "").lower() != class_name.lower():
+                continue
+            if key in class_outline.methods:
+                return class_outline.methods[key]
+        return None
+
+
+def _heredoc_end(source, match):
+    """Offset just past the closing label of the heredoc/nowdoc opened by match."""
+    closing = re.compile(rf"^[ \t]*{re.escape(match.group('label'))}(?![A-Za-z0-9_\x80-\uffff])", re.MULTILINE)
+    end_match = closing.search(source, match.end())
+    return end_match.end() if end_match else len(source)
+
+
+def parse_outline(source):
+    """Build the Outline of source in one pass."""
+    outline = Outline()
+    stack = []  # One entry per open `{`: a ClassOutline, a FunctionOutline or None
+    pending_class = None
+    pending_function = None
+    expect_name = None  # "class" or "function" while the declared name is still to come
+    previous = None  # Previous significant token
+    index = 0
+    length = len(source)
+
+    while index < length:
+        # Inline HTML until the next open tag
+        open_tag = OPEN_TAG.search(source, index)
+        if not open_tag:
+            break
+        index = open_tag.end()
+
+        while index < length:
+            match = TOKEN.match(source, index)
+            kind = match.lastgroup
+            token = match.group()
+            index = match.end()
+
+            if kind in {"space", "comment"}:
+                continue
+            if kind == "close_tag":
+                break
+            if kind == "heredoc":
+                index = _heredoc_end(source, match)
+                previous = "string"
+                continue
+
+            if kind == "ident":
+                lowered = token.lower()
+                if expect_name == "class":
+                    pending_class.name = token
+                    expect_name = None
+                elif expect_name == "function":
+                    pending_function.name = token
+                    expect_name = None
+                elif previous not in MEMBER_ACCESS:
+                    if lowered in CLASS_KEYWORDS and previous != "new":
+                        pending_class = ClassOutline(None, lowered, match.start())
+                        expect_name = "class"
+                    elif lowered == "class":  # new class (...) { ... }
+                        pending_class = ClassOutline(None, lowered, match.start())
+                    elif lowered == "function":
+                        pending_function = FunctionOutline(None, match.start())
+                        expect_name = "function"
+                    elif lowered == "return" and stack and isinstance(stack[-1], FunctionOutline):
+                        stack[-1].returns.append(match.start())
+                previous = lowered
+                continue
+
+            if token == "&" and expect_name == "function":
+                continue  # function &name()
+            if expect_name == "class":
+                pending_class = None  # `class` as a named argument or array key, not a declaration
+            expect_name = None
+
+            if token == "{":
+                if pending_function is not None:
+                    entry, pending_function = pending_function, None
+                    container = stack[-1] if stack else None
+                    if entry.name and isinstance(container, ClassOutline):
+                        container.methods.setdefault(entry.name.lower(), entry)
+                    elif entry.name and not stack:
+                        outline.functions.setdefault(entry.name.lower(), entry)
+                elif pending_class is not None:
+                    entry, pending_class = pending_class, None
+                    outline.classes.append(entry)
+                else:
+                    entry = None
+                if entry is not None:
+                    entry.body_start = index
+                stack.append(entry)
+            elif token == "}":
+                if stack:
+                    entry = stack.pop()
+                    if entry is not None:
+                        entry.body_end = match.start()
+            elif token == ";":
+                # Abstract and interface methods have no body
+                pending_function = None
+                pending_class = None
+
+            previous = token if kind == "op" else kind
+
+    return outline
+
+
+def method_name(method_signature):
+    """Name of the method in a signature such as "public function register_post_types()"."""
+    match = METHOD_NAME.search(method_signature)
+    return match.group(1) if match else None
+
+
+def find_method_bounds(content, method_signature):
+    """Return (body_start, body_end) of the method declared by method_signature, or None.
+
+    body_start is just after the opening brace and body_end is the offset
+    of the closing brace.
+    """
+    name = method_name(method_signature)
+    method = parse_outline(content).method(name) if name else None
+    return (method.body_start, method.body_end) if method else None
+
+
+def _line_indent(source, offset):
+    line_start = source.rfind("\n", 0, offset) + 1
+    line = source[line_start:offset]
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+class PhpEditor:
+    """Queues insertions against one outline of source and applies them together.
+
+    Insertions at the same offset keep the order they were made in, which
+    matches inserting them one after the other into the updated text.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.outline = parse_outline(source)
+        self._insertions = []
+
+    def insert(self, offset, text):
+        self._insertions.append((offset, len(self._insertions), text))
+
+    def method(self, name, class_name=None):
+        return self.outline.method(name, class_name)
+
+    def append_to_method(self, name, block, class_name=None):
+        """Add block (whole lines) as the last statements of a method. Returns False if it is missing."""
+        method = self.method(name, class_name)
+        if method is None:
+            return False
+
+        line_start = self.source.rfind("\n", method.body_start, method.body_end) + 1
+        if line_start and not self.source[line_start:method.body_end].strip():
+            self.insert(line_start, block)
+        else:
+            # The closing brace shares its line with code, e.g. `function x() {}`
+            self.insert(method.body_end, "\n" + block + _line_indent(self.source, method.start))
+        return True
+
+    def insert_before_return(self, name, text, class_name=None):
+        """Insert text before the last top-level `return` of a method, or before its closing brace."""
+        method = self.method(name, class_name)
+        if method is None:
+            return False
+        self.insert(method.returns[-1] if method.returns else method.body_end, text)
+        return True
+
+    def add_to_class(self, text, class_name=None):
+        """Insert text just before the closing brace of a class (the first one by default)."""
+        class_outline = self.outline.find_class(class_name)
+        if class_outline is None:
+            return False
+        self.insert(class_outline.body_end, text)
+        return True
+
+    def text(self):
+        if not self._insertions:
+            return self.source
+        parts = []
+        last = 0
+        for offset, _, text in sorted(self._insertions):
+            parts.append(self.source[last:offset])
+            parts.append(text)
+            last = offset
+        parts.append(self.source[last:])
+        return "".join(parts)
+
+    def refresh(self):
+        """Apply the queued insertions and re-index (needed after adding new methods or classes)."""
+        self.__init__(self.text())
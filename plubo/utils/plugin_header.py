@@ -0,0 +1,105 @@
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Optional
+
+# WordPress' get_file_data() only looks at the first 8 KB of a file, so a
+# plugin header can never live further down than that.
+HEADER_WINDOW_BYTES = 8192
+
+# Attribute name -> header label, in the order WordPress documents them.
+HEADER_FIELDS = {
+    "name": "Plugin Name",
+    "plugin_uri": "Plugin URI",
+    "description": "Description",
+    "version": "Version",
+    "requires_wp": "Requires at least",
+    "requires_php": "Requires PHP",
+    "author": "Author",
+    "author_uri": "Author URI",
+    "license": "License",
+    "license_uri": "License URI",
+    "text_domain": "Text Domain",
+    "domain_path": "Domain Path",
+    "network": "Network",
+    "update_uri": "Update URI",
+    "requires_plugins": "Requires Plugins",
+}
+
+_LABEL_TO_FIELD = {label.lower(): field for field, label in HEADER_FIELDS.items()}
+
+# Longest labels first so "Plugin URI" is not shadowed by a shorter label.
+_HEADER_PATTERN = re.compile(
+    r"^(?:[ \t]*<\?php)?[ \t/*#@]*("
+    + "|".join(re.escape(label) for label in sorted(HEADER_FIELDS.values(), key=len, reverse=True))
+    + r"):(.*)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_COMMENT_END_PATTERN = re.compile(r"\s*(?:\*/|\?>).*")
+
+
+@dataclass
+class PluginHeader:
+    """Standard plugin header fields; missing fields are None."""
+
+    name: Optional[str] = None
+    plugin_uri: Optional[str] = None
+    description: Optional[str] = None
+    version: Optional[str] = None
+    requires_wp: Optional[str] = None
+    requires_php: Optional[str] = None
+    author: Optional[str] = None
+    author_uri: Optional[str] = None
+    license: Optional[str] = None
+    license_uri: Optional[str] = None
+    text_domain: Optional[str] = None
+    domain_path: Optional[str] = None
+    network: Optional[str] = None
+    update_uri: Optional[str] = None
+    requires_plugins: Optional[str] = None
+
+    @property
+    def is_plugin(self):
+        return bool(self.name)
+
+    def as_labels(self):
+        """Return the present fields keyed by their header label."""
+        return {
+            HEADER_FIELDS[field.name]: getattr(self, field.name)
+            for field in fields(self)
+            if getattr(self, field.name) is not None
+        }
+
+
+def parse_plugin_header(text):
+    """Parse every standard header field from text in a single scan."""
+    values = {}
+    for match in _HEADER_PATTERN.finditer(text.replace("\r", "\n")):
+        field = _LABEL_TO_FIELD[match.group(1).lower()]
+        if field in values:
+            continue  # WordPress keeps the first occurrence
+
+        value = _COMMENT_END_PATTERN.sub("", match.group(2)).strip()
+        if value:
+            values[field] = value
+
+    return PluginHeader(**values)
+
+
+def read_plugin_header(file_path):
+    """Read the plugin header from the first 8 KB of file_path, or None if unreadable."""
+    try:
+        with Path(file_path).open("rb") as f:
+            head = f.read(HEADER_WINDOW_BYTES)
+    except OSError:
+        return None
+
+    return parse_plugin_header(head.decode("utf-8", errors="replace"))
+
+
+def iter_plugin_headers(plugin_directory):
+    """Yield (file, header) for each top-level PHP file in plugin_directory, in name order."""
+    for php_file in sorted(Path(plugin_directory).glob("*.php")):
+        header = read_plugin_header(php_file)
+        if header is not None:
+            yield php_file, header
@@ -1,94 +1,126 @@
 import os
-import re
 import subprocess
-import curses
 from pathlib import Path
-from plubo.utils import interface, colors
+from plubo.utils import output
+from plubo.utils.plugin_header import iter_plugin_headers
+
+# Resolved contexts keyed by directory. Each entry remembers the stamp it was
+# resolved against so it is dropped as soon as the directory (or the detected
+# main plugin file) changes on disk.
+_CONTEXT_CACHE = {}
+
+def plugin_namespace(plugin_name):
+    """PHP namespace for a plugin name, as the renamer writes it into the skeleton (`my-plugin` -> `MyPlugin`)."""
+    return plugin_name.title().replace("-", "")
+
+def _find_upwards(start_path, filename):
+    """Return the first directory from start_path upwards that contains filename."""
+    current_path = start_path
+    while True:
+        if (current_path / filename).exists():
+            return current_path
+        if current_path == current_path.parent:
+            return None
+        current_path = current_path.parent
+
+def _find_main_plugin_file(plugin_root):
+    """Return (main_file, header) for the first top-level PHP file declaring a Text Domain."""
+    for file, header in iter_plugin_headers(plugin_root):
+        if header.text_domain:
+            return file, header
+
+    return None, None
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+class ProjectContext:
+    """Everything pb-cli needs to know about the project around a directory, resolved once."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.wp_root = _find_upwards(self.path, "wp-config.php")
+        self.is_lando = _find_upwards(self.path, ".lando.yml") is not None
+        self.main_file, self.header = _find_main_plugin_file(self.path)
+        self.plugin_slug = self.header.text_domain if self.header else None
+        self.resolved_stamp = self.stamp()
+
+    @property
+    def plugin_root(self):
+        """Directory holding the main plugin file, or None outside a plugin."""
+        return self.main_file.parent if self.main_file else None
+
+    @property
+    def plugins_directory(self):
+        """The wp-content/plugins directory of the detected WordPress install."""
+        return self.wp_root / "wp-content/plugins" if self.wp_root else None
+
+    @property
+    def namespace(self):
+        """PHP namespace used by the plugin classes (see plugin_namespace)."""
+        if not self.plugin_slug:
+            return None
+        return plugin_namespace(self.plugin_slug)
+
+    def stamp(self):
+        return (_mtime(self.path), _mtime(self.main_file) if self.main_file else None)
+
+def get_context(path=None):
+    """Return the cached ProjectContext for path (defaults to the working directory)."""
+    path = Path(path or os.getcwd()).resolve()
+    context = _CONTEXT_CACHE.get(path)
+    if context is not None and context.stamp() == context.resolved_stamp:
+        return context
+
+    context = ProjectContext(path)
+    _CONTEXT_CACHE[path] = context
+    return context
+
+def invalidate_context(path=None):
+    """Forget cached contexts, e.g. after a plugin folder was created or moved."""
+    if path is None:
+        _CONTEXT_CACHE.clear()
+    else:
+        _CONTEXT_CACHE.pop(Path(path).resolve(), None)
+
+def find_plugins(plugins_directory):
+    """Return the contexts of every plugin in plugins_directory that manages Composer or Node dependencies."""
+    contexts = []
+    for plugin_directory in sorted(Path(plugins_directory).iterdir()):
+        if not plugin_directory.is_dir():
+            continue
+        if not ((plugin_directory / "composer.json").exists() or (plugin_directory / "package.json").exists()):
+            continue
+        context = get_context(plugin_directory)
+        if context.plugin_slug:
+            contexts.append(context)
+    return contexts
 
 def is_lando_project():
     """Check if the project is running inside a Lando environment by searching for .lando.yml in parent directories."""
-    current_dir = os.getcwd()  # Get the current working directory
-    while True:
-        lando_file = os.path.join(current_dir, ".lando.yml")
-        if os.path.exists(lando_file):
-            return True #subprocess.run(["which", "lando"], capture_output=True, text=True).returncode == 0
-        parent_dir = os.path.dirname(current_dir)
-        if parent_dir == current_dir:
-            break  # Reached the root directory
-        current_dir = parent_dir
-    return False  # .lando.yml not found
+    return get_context().is_lando
 
 def detect_wp_root():
     """Find the WordPress root directory by checking for wp-config.php."""
-    current_path = Path(os.getcwd())
-    while current_path != current_path.parent:
-        if (current_path / "wp-config.php").exists():
-            return current_path
-        current_path = current_path.parent
-    return None
+    return get_context().wp_root
 
 def detect_plugin_name():
     """Finds the main plugin file and extracts the plugin name from 'Text Domain'."""
-    plugin_root = Path(os.getcwd())
-    
-    for file in plugin_root.glob("*.php"):
-        with file.open("r", encoding="utf-8") as f:
-            content = f.read()
-            match = re.search(r"Text Domain:\s*(.+)", content)
-            if match:
-                return match.group(1).strip()
-    
-    return None
+    return get_context().plugin_slug
 
 def is_wp_cli_available():
     """Check if WP-CLI is installed."""
     return subprocess.run(["which", "wp"], capture_output=True, text=True).returncode == 0
 
 def run_command(command, cwd, stdscr):
-    """Execute a shell command and display output in curses UI."""
-    height, width = stdscr.getmaxyx()
-    box_height = height - 6  # Leave space for the message
-    box_width = width - 8
-    box_start_y = 3
-    box_start_x = 4
-
-    # Draw the bordered box for output
-    output_win = curses.newwin(box_height, box_width, box_start_y, box_start_x)
-    output_win.border()
-    output_win.scrollok(True)  # Allow scrolling
-    output_win.refresh()
-    
-    # Start process with live output capture
-    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, cwd=str(cwd))
-
-    line_y = 1  # First line inside the box
-    inner_width = box_width - 4
-    
-    while True:
-        line = process.stdout.readline()
-        if not line and process.poll() is not None:
-            break  # Exit loop if process is done and no more output
-
-        # Parse ANSI color codes and split text into segments
-        segments = colors.parse_ansi_colors(line.strip())
-        wrapped_lines = colors.wrap_text(segments, inner_width)  # Wrap text if necessary
-
-        for wrapped_line in wrapped_lines:
-            if line_y >= box_height - 2:  # Scroll if output exceeds window height
-                output_win.scroll()
-            else:
-                line_y += 1
-
-            output_win.addstr(line_y, 1, " " * (inner_width + 2), curses.color_pair(10))
+    """Execute a shell command and display output in curses UI.
 
-            col_x = 2  # Starting position for text inside the box
-            for segment_text, color_pair in wrapped_line:
-                output_win.addstr(line_y, col_x, segment_text, color_pair)
-                col_x += len(segment_text)
-        
-        output_win.border()  # Keep the border visible
-        output_win.refresh()
-
-    process.wait()  # Ensure the process completes
-
-    return process.returncode == 0
\ No newline at end of file
+    Output is drained by a reader thread and repainted at a capped frame
+    rate; the full log is written under the pb-cli cache (`logs/`).
+    """
+    height, width = stdscr.getmaxyx()
+    pane = output.OutputPane(3, 4, height - 6, width - 8, log_path=output.command_log_path(command))
+    return output.run_in_pane(command, cwd, pane)
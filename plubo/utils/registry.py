@@ -0,0 +1,54 @@
+import json
+import time
+from plubo.utils.files import atomic_write_text, cache_dir, env_seconds
+
+REGISTRY_TTL_SECONDS = env_seconds("PB_CLI_REGISTRY_TTL", 24 * 3600)
+
+
+class RegistrySnapshot:
+    """Latest known version of each package of one ecosystem, cached on disk.
+
+    Entries are shared by every project on the machine and expire after
+    `ttl` seconds. `save` merges with whatever another process wrote in the
+    meantime, so concurrent checks do not drop each other's entries.
+    """
+
+    def __init__(self, ecosystem, ttl=REGISTRY_TTL_SECONDS):
+        self.ecosystem = ecosystem
+        self.ttl = ttl
+        self.path = cache_dir("registry") / f"{ecosystem}.json"
+        self.entries = self._load()
+        self.updated = {}
+
+    def _load(self):
+        try:
+            entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def latest(self, name):
+        """Return the cached latest version, or None when unknown or expired."""
+        entry = self.entries.get(name)
+        if not entry or time.time() - entry.get("fetched_at", 0) >= self.ttl:
+            return None
+        return entry.get("latest")
+
+    def missing(self, names):
+        return [name for name in names if self.latest(name) is None]
+
+    def update(self, latest_versions):
+        now = time.time()
+        for name, latest in latest_versions.items():
+            entry = {"latest": latest, "fetched_at": now}
+            self.entries[name] = entry
+            self.updated[name] = entry
+
+    def save(self):
+        if not self.updated:
+            return
+        entries = self._load()
+        entries.update(self.updated)
+        atomic_write_text(self.path, json.dumps(entries, indent=2, sort_keys=True))
+        self.entries = entries
+        self.updated = {}
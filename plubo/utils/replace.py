@@ -0,0 +1,41 @@
+import re
+
+
+class MultiReplacer:
+    """Replace many literal strings in a single scan.
+
+    All keys are compiled into one alternation, longest first, so when two
+    variants overlap the longer one wins and every position in the text is
+    visited only once. Literal `str.find` probes (much faster than the regex)
+    skip texts without any key and start the regex at the first hit.
+    """
+
+    def __init__(self, replacements):
+        self.replacements = {old: new for old, new in replacements.items() if old}
+        ordered = sorted(self.replacements, key=len, reverse=True)
+        self.pattern = re.compile("|".join(re.escape(old) for old in ordered)) if ordered else None
+
+    def subn(self, text):
+        """Return (new_text, count) where count only includes replacements that changed text."""
+        if self.pattern is None:
+            return text, 0
+
+        hits = [position for position in (text.find(old) for old in self.replacements) if position >= 0]
+        if not hits:
+            return text, 0
+        start = min(hits)
+
+        count = 0
+
+        def substitute(match):
+            nonlocal count
+            old = match.group(0)
+            new = self.replacements[old]
+            if new != old:
+                count += 1
+            return new
+
+        return text[:start] + self.pattern.sub(substitute, text[start:]), count
+
+    def sub(self, text):
+        return self.subn(text)[0]
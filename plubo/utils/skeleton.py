@@ -0,0 +1,140 @@
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from plubo.utils.files import atomic_write_text, cache_dir, env_seconds, sha256_bytes, sha256_file
+
+SKELETON_PACKAGE = "joanrodas/plubo"
+SKELETON_TTL_SECONDS = env_seconds("PB_CLI_SKELETON_TTL", 7 * 24 * 3600)
+SKELETON_EXCLUDED = (".git",)
+
+
+def _skeleton_root(package=SKELETON_PACKAGE):
+    return cache_dir("skeletons", package.replace("/", "-"))
+
+
+def _hash_tree(root):
+    """Return {relative_path: sha256} for every file under root."""
+    hashes = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKELETON_EXCLUDED)
+        for filename in sorted(filenames):
+            file_path = Path(dirpath) / filename
+            if file_path.is_symlink():
+                continue
+            hashes[file_path.relative_to(root).as_posix()] = sha256_file(file_path)
+    return hashes
+
+
+def _tree_digest(hashes):
+    return sha256_bytes("\n".join(f"{path} {digest}" for path, digest in sorted(hashes.items())).encode("utf-8"))
+
+
+class SkeletonCache:
+    """Local, content-addressed copy of the `composer create-project` skeleton.
+
+    Each fetched skeleton is stored under its tree digest next to an
+    `index.json` naming the current one, its per-file hashes and when it was
+    fetched. Expanding copies files (not hard links: rename and later
+    scaffolds edit the new plugin in place, which would corrupt the cache).
+    """
+
+    def __init__(self, package=SKELETON_PACKAGE, ttl=SKELETON_TTL_SECONDS):
+        self.package = package
+        self.ttl = ttl
+        self.root = _skeleton_root(package)
+        self.index_path = self.root / "index.json"
+
+    def _index(self):
+        try:
+            return json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _tree(self, index):
+        return self.root / index["digest"][:16]
+
+    def is_available(self):
+        index = self._index()
+        return bool(index) and self._tree(index).is_dir()
+
+    def is_fresh(self):
+        index = self._index()
+        return bool(index) and self.is_available() and time.time() - index["fetched_at"] < self.ttl
+
+    def verify(self):
+        """Return True when the cached tree still matches its recorded hashes."""
+        index = self._index()
+        if not index or not self._tree(index).is_dir():
+            return False
+        return _hash_tree(self._tree(index)) == index["files"]
+
+    def store(self, source_directory):
+        """Snapshot a freshly created skeleton into the cache."""
+        hashes = _hash_tree(source_directory)
+        digest = _tree_digest(hashes)
+        tree = self.root / digest[:16]
+
+        if not tree.is_dir():
+            staging = self.root / f".{digest[:16]}.{os.getpid()}.tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(source_directory, staging, symlinks=True, ignore=shutil.ignore_patterns(*SKELETON_EXCLUDED))
+            os.replace(staging, tree)
+
+        atomic_write_text(self.index_path, json.dumps({
+            "package": self.package,
+            "digest": digest,
+            "fetched_at": time.time(),
+            "files": hashes,
+        }))
+
+        # Keep only the current skeleton version
+        for entry in self.root.iterdir():
+            if entry.is_dir() and entry != tree:
+                shutil.rmtree(entry, ignore_errors=True)
+        return digest
+
+    def expand(self, destination):
+        """Copy the cached skeleton to destination, which must not exist yet."""
+        shutil.copytree(self._tree(self._index()), destination, symlinks=True)
+
+
+def create_skeleton(plugins_directory, plugin_name, use_lando, run_command, refresh=False, cache=None):
+    """Create `plugins_directory/plugin_name` from the skeleton cache or `composer create-project`.
+
+    `run_command(command, cwd)` must return True on success. Composer only
+    runs when the cache is missing, stale, fails verification or `refresh`
+    is set; when Composer fails (e.g. offline) a stale but intact cache is
+    used instead. Returns "cache", "composer" or "stale-cache"; raises
+    RuntimeError when neither source works.
+    """
+    cache = cache or SkeletonCache()
+    plugin_directory = Path(plugins_directory) / plugin_name
+
+    if not refresh and cache.is_fresh() and cache.verify():
+        cache.expand(plugin_directory)
+        return "cache"
+
+    command = (
+        ["lando", "composer", "create-project", cache.package, plugin_name]
+        if use_lando
+        else ["composer", "create-project", cache.package, plugin_name]
+    )
+    try:
+        created = run_command(command, plugins_directory)
+    except OSError:
+        created = False
+
+    if created:
+        try:
+            cache.store(plugin_directory)
+        except OSError:
+            pass  # The plugin exists; a cache we cannot write only costs the next create
+        return "composer"
+
+    if not plugin_directory.exists() and cache.is_available() and cache.verify():
+        cache.expand(plugin_directory)
+        return "stale-cache"
+
+    raise RuntimeError(f"`{' '.join(command)}` failed and no cached skeleton is available")
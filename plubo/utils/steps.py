@@ -0,0 +1,198 @@
+import subprocess
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from plubo.utils import output
+
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class Step:
+    """A unit of work in a step graph.
+
+    A step either runs `command`, or calls `action(run)` where `run(command)`
+    streams a command's output like a command step would and raises
+    CalledProcessError on failure; the action may return a list of messages.
+    Steps only wait for the steps named in `after`. Steps sharing a `lane`
+    share an output pane (curses) or prefix (plain mode).
+    """
+    name: str
+    command: Optional[List[str]] = None
+    action: Optional[Callable] = None
+    after: Tuple[str, ...] = ()
+    lane: Optional[str] = None
+    cwd: Optional[Path] = None
+
+    @property
+    def lane_name(self):
+        return self.lane or self.name
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str
+    messages: List[str] = field(default_factory=list)
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self):
+        return self.status == STATUS_OK
+
+
+def _check_graph(steps):
+    """Raise ValueError for duplicate names, unknown dependencies or cycles."""
+    names = [step.name for step in steps]
+    if len(names) != len(set(names)):
+        raise ValueError("Step names must be unique")
+
+    by_name = {step.name: step for step in steps}
+    for step in steps:
+        unknown = [dependency for dependency in step.after if dependency not in by_name]
+        if unknown:
+            raise ValueError(f"Step '{step.name}' depends on unknown step(s): {', '.join(unknown)}")
+
+    visited = set()
+    visiting = set()
+
+    def visit(name):
+        if name in visiting:
+            raise ValueError(f"Step graph has a cycle through '{name}'")
+        if name in visited:
+            return
+        visiting.add(name)
+        for dependency in by_name[name].after:
+            visit(dependency)
+        visiting.discard(name)
+        visited.add(name)
+
+    for name in names:
+        visit(name)
+
+
+class _PlainSink:
+    """Prints lines with a `[lane]` prefix, one whole line at a time."""
+
+    lock = threading.Lock()
+
+    def __init__(self, lane):
+        self.prefix = f"[{lane}] "
+
+    def append(self, line):
+        text = line.rstrip("\r\n").rsplit("\r", 1)[-1]
+        with self.lock:
+            print(self.prefix + text, flush=True)
+
+
+def _make_runner(step, sink, default_cwd):
+    cwd = step.cwd or default_cwd
+
+    def run(command):
+        sink.append("$ " + " ".join(str(part) for part in command))
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+            cwd=str(cwd),
+        )
+        for line in iter(process.stdout.readline, ""):
+            sink.append(line)
+        process.stdout.close()
+        if process.wait() != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+    return run
+
+
+def _execute(step, sink, default_cwd):
+    run = _make_runner(step, sink, default_cwd)
+    try:
+        if step.command:
+            run(step.command)
+            messages = []
+        else:
+            messages = step.action(run) or []
+    except Exception as error:
+        sink.append(f"❌ {step.name} failed: {error}")
+        return StepResult(step.name, STATUS_FAILED, error=error)
+    return StepResult(step.name, STATUS_OK, messages=list(messages))
+
+
+def _layout_panes(stdscr, lanes):
+    """Stack one pane per lane in the output area used by run_command."""
+    height, width = stdscr.getmaxyx()
+    top, available = 3, height - 6
+    pane_height = max(3, available // len(lanes))
+    panes = {}
+    for index, lane in enumerate(lanes):
+        y = top + index * pane_height
+        rows = pane_height if index < len(lanes) - 1 else available - index * pane_height
+        panes[lane] = output.OutputPane(
+            y, 4, max(3, rows), width - 8, title=lane, log_path=output.command_log_path([lane])
+        )
+    return panes
+
+
+def run_steps(steps, cwd, stdscr=None):
+    """Run a step graph, starting each step as soon as its dependencies succeed.
+
+    Independent steps run concurrently. Steps whose dependencies failed are
+    skipped. In curses mode every lane gets its own pane and the screen is
+    repainted at a capped frame rate; otherwise output lines are prefixed
+    with the lane name. Returns a dict of StepResult by step name, in the
+    order the steps were given.
+    """
+    _check_graph(steps)
+    lanes = list(dict.fromkeys(step.lane_name for step in steps))
+    if stdscr:
+        panes = _layout_panes(stdscr, lanes)
+        sinks = panes
+    else:
+        panes = {}
+        sinks = {lane: _PlainSink(lane) for lane in lanes}
+
+    pending = list(steps)
+    results = {}
+    running = {}
+    frame_interval = 1 / output.FRAMES_PER_SECOND
+
+    with ThreadPoolExecutor(max_workers=max(1, len(steps))) as executor:
+        while pending or running:
+            for step in list(pending):
+                dependency_results = [results.get(dependency) for dependency in step.after]
+                if any(result and not result.ok for result in dependency_results):
+                    results[step.name] = StepResult(step.name, STATUS_SKIPPED)
+                    pending.remove(step)
+                elif all(dependency_results):
+                    running[executor.submit(_execute, step, sinks[step.lane_name], cwd)] = step
+                    pending.remove(step)
+
+            if not running:
+                continue
+
+            done, _ = wait(running, timeout=frame_interval if panes else None, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                results[step.name] = future.result()
+            if panes:
+                output.repaint(list(panes.values()))
+
+    for pane in panes.values():
+        pane.close()
+    if panes:
+        output.repaint(list(panes.values()))
+
+    return {step.name: results[step.name] for step in steps}
+
+
+def first_failure(results):
+    """Return the first failed StepResult, or None."""
+    return next((result for result in results.values() if result.status == STATUS_FAILED), None)
@@ -0,0 +1,76 @@
+"""Registry of the PHP class templates used by the generators.
+
+Each template is read once and split into literal and placeholder segments;
+rendering joins the segments with the given values and refuses to leave a
+placeholder unfilled. Templates stay parsed for the rest of the process
+(including a `pb-cli serve` daemon), so generating many classes only costs
+a join per file.
+"""
+import re
+import threading
+from pathlib import Path
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+PLACEHOLDERS = ("PluginPlaceholder", "FunctionalityName", "ComponentName", "EntityName")
+
+
+class Template:
+    """A template pre-split on its placeholders.
+
+    `segments` alternates literal text and placeholder names, starting and
+    ending with literal text (possibly empty).
+    """
+
+    __slots__ = ("name", "segments", "placeholders")
+
+    def __init__(self, name, text, placeholders=PLACEHOLDERS):
+        pattern = re.compile("(" + "|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)) + ")")
+        self.name = name
+        self.segments = tuple(pattern.split(text))
+        self.placeholders = frozenset(self.segments[1::2])
+
+    def render(self, **values):
+        """Fill every placeholder; values for placeholders the template lacks are ignored."""
+        missing = sorted(name for name in self.placeholders if values.get(name) is None)
+        if missing:
+            raise ValueError(f"Template '{self.name}' has unfilled placeholders: {', '.join(missing)}")
+
+        parts = list(self.segments)
+        parts[1::2] = [values[name] for name in self.segments[1::2]]
+        return "".join(parts)
+
+
+class TemplateRegistry:
+    def __init__(self, directory=TEMPLATES_DIR):
+        self.directory = Path(directory)
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """Return the parsed template at `name` (relative POSIX path); raises FileNotFoundError."""
+        template = self._templates.get(name)
+        if template is None:
+            template = Template(name, (self.directory / name).read_text(encoding="utf-8"))
+            with self._lock:
+                template = self._templates.setdefault(name, template)
+        return template
+
+    def render(self, name, **values):
+        return self.get(name).render(**values)
+
+    def load_all(self):
+        """Parse every PHP template up front (used to warm the daemon)."""
+        for path in sorted(self.directory.rglob("*.php")):
+            self.get(path.relative_to(self.directory).as_posix())
+        return self
+
+
+_REGISTRY = TemplateRegistry()
+
+
+def get_registry():
+    return _REGISTRY
+
+
+def render_template(name, **values):
+    return _REGISTRY.render(name, **values)
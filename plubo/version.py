@@ -1,11 +1,12 @@
-from importlib import metadata
-
 PACKAGE_NAME = "plubo-cli"
 __version__ = "0.1.0"
 
 
 def get_version():
     """Return installed package version when available, otherwise local source version."""
+    # importlib.metadata is slow to import; only pay for it when asked.
+    from importlib import metadata
+
     try:
         return metadata.version(PACKAGE_NAME)
     except metadata.PackageNotFoundError:
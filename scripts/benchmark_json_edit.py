@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark format-preserving JSON rewriting against parse-and-dump.
+
+Builds a composer.json-like document with --packages entries (2-space
+indented, like Composer writes it) and renames the plugin in it twice: once
+with the legacy json.loads / recursive replace / json.dumps(indent=4) path
+and once with `plubo.utils.json_edit.replace_strings`. Reports the best time
+of --rounds runs and how many lines each approach changed.
+
+Usage: python scripts/benchmark_json_edit.py [--packages 2000] [--rounds 20]
+"""
+import argparse
+import difflib
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from plubo.utils.json_edit import replace_strings  # noqa: E402
+from plubo.utils.replace import MultiReplacer  # noqa: E402
+
+
+def _build_document(package_count):
+    document = {
+        "name": "joanrodas/plugin-placeholder",
+        "description": "Plugin Placeholder – a WordPress plugin",
+        "autoload": {"psr-4": {"PluginPlaceholder\\": "Includes/"}},
+        "require": {f"vendor{index}/package-{index}": f"^{index % 9}.{index % 7}" for index in range(package_count)},
+        "extra": {"installer-paths": {"vendor/{$name}/": ["type:wordpress-plugin"]}},
+    }
+    return json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+
+
+def _legacy(text, replacer):
+    count = 0
+
+    def replace_string(value):
+        nonlocal count
+        value, replaced = replacer.subn(value)
+        count += replaced
+        return value
+
+    def recursive_replace(obj):
+        if isinstance(obj, str):
+            return replace_string(obj)
+        if isinstance(obj, dict):
+            return {replace_string(key): recursive_replace(value) for key, value in obj.items()}
+        if isinstance(obj, list):
+            return [recursive_replace(item) for item in obj]
+        return obj
+
+    data = recursive_replace(json.loads(text))
+    return json.dumps(data, indent=4), count
+
+
+def _best_of(rounds, function, *args):
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _changed_lines(before, after):
+    return sum(
+        1 for line in difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm="", n=0)
+        if line.startswith(("+", "-")) and not line.startswith(("+++", "---"))
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--packages", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    options = parser.parse_args()
+
+    text = _build_document(options.packages)
+    replacer = MultiReplacer({
+        "plugin-placeholder": "acme-shop",
+        "PLUGIN_PLACEHOLDER": "ACME_SHOP",
+        "PluginPlaceholder": "AcmeShop",
+        "PLUGINPLACEHOLDER": "ACMESHOP",
+    })
+    print(f"Document: {len(text) / 1024:.0f} KB, {options.packages} require entries")
+
+    legacy_seconds, (legacy_text, legacy_count) = _best_of(options.rounds, _legacy, text, replacer)
+    edit_seconds, (edit_text, edit_count) = _best_of(options.rounds, replace_strings, text, replacer)
+
+    assert json.loads(legacy_text) == json.loads(edit_text), "Both approaches must produce the same data"
+    print(
+        f"parse + dump:   {legacy_seconds * 1000:8.2f} ms, "
+        f"{legacy_count} replacements, {_changed_lines(text, legacy_text)} lines changed"
+    )
+    print(
+        f"replace_strings:{edit_seconds * 1000:8.2f} ms, "
+        f"{edit_count} replacements, {_changed_lines(text, edit_text)} lines changed"
+    )
+    if edit_seconds:
+        print(f"speed-up: {legacy_seconds / edit_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark plugin renaming on a synthetic plugin tree.
+
+Builds a plugin with --files PHP files (a fraction of them mentioning the
+plugin name in its different casings) and renames it twice: once with the
+legacy approach (one str.replace pass per casing variant, every file
+rewritten) and once through `plubo.generators.plugin.rename_plugin`.
+
+Each approach runs --rounds times on fresh copies and the best time is
+reported, which keeps filesystem noise out of the comparison.
+
+Usage: python scripts/benchmark_rename.py [--files 5000] [--match-ratio 0.2] [--rounds 3]
+"""
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from plubo.generators.plugin import iter_files, rename_plugin  # noqa: E402
+
+OLD_NAME = "plugin-placeholder"
+NEW_NAME = "acme-shop"
+FILLER = "    // " + "lorem ipsum dolor sit amet " * 3 + "\n"
+
+
+def _build_tree(root, file_count, match_ratio):
+    plugin_root = root / OLD_NAME
+    rng = random.Random(42)
+    for index in range(file_count):
+        file_path = plugin_root / f"Module{index % 50}" / f"Class{index}.php"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        lines = ["<?php\n", "namespace Vendor\\Module;\n"]
+        if rng.random() < match_ratio:
+            lines = ["<?php\n", "namespace PluginPlaceholder\\Module;\n", "define('PLUGIN_PLACEHOLDER_X', 'plugin-placeholder');\n"]
+        lines.extend([FILLER] * 120)
+        file_path.write_text("".join(lines), encoding="utf-8")
+    return plugin_root
+
+
+def _legacy_rename(plugin_root, replacements):
+    for file_path in iter_files(plugin_root, "*.php"):
+        content = file_path.read_text(encoding="utf-8")
+        for old, new in replacements.items():
+            content = content.replace(old, new)
+        file_path.write_text(content, encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--match-ratio", type=float, default=0.2)
+    parser.add_argument("--rounds", type=int, default=3)
+    options = parser.parse_args()
+
+    replacements = {
+        OLD_NAME: NEW_NAME,
+        OLD_NAME.upper().replace("-", "_"): NEW_NAME.upper().replace("-", "_"),
+        OLD_NAME.title().replace("-", ""): NEW_NAME.title().replace("-", ""),
+        OLD_NAME.upper().replace("-", ""): NEW_NAME.upper().replace("-", ""),
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        template_root = _build_tree(Path(temp_dir) / "template", options.files, options.match_ratio)
+        print(f"Synthetic plugin: {options.files} PHP files, ~{options.match_ratio:.0%} containing the name")
+
+        legacy_times = []
+        engine_times = []
+        for round_index in range(options.rounds):
+            legacy_root = shutil.copytree(template_root, Path(temp_dir) / f"legacy{round_index}" / OLD_NAME)
+            engine_root = shutil.copytree(template_root, Path(temp_dir) / f"engine{round_index}" / OLD_NAME)
+
+            started = time.perf_counter()
+            _legacy_rename(Path(legacy_root), replacements)
+            legacy_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            match_counts = rename_plugin(OLD_NAME, NEW_NAME, Path(engine_root))
+            engine_times.append(time.perf_counter() - started)
+
+        legacy_seconds = min(legacy_times)
+        engine_seconds = min(engine_times)
+        total_matches = sum(match_counts.values())
+        print(f"legacy (4 passes, rewrite all): {legacy_seconds * 1000:8.1f} ms ({options.files} files written)")
+        print(
+            f"rename_plugin:                  {engine_seconds * 1000:8.1f} ms "
+            f"({len(match_counts)} files written, {total_matches} replacements)"
+        )
+
+        if engine_seconds:
+            print(f"speed-up: {legacy_seconds / engine_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Measure pb-cli cold start for every registered command.
+
+For each entry in `plubo.cli.dispatcher.COMMANDS` a fresh interpreter imports
+`plubo.main` and resolves the command through the dispatcher, which is exactly
+the work done before a command starts running. Wall-clock time is reported
+relative to a bare interpreter, together with the slowest modules reported by
+`-X importtime`. The script exits with code 1 when any command exceeds the
+budget, so it can run as a CI regression check.
+
+Usage: python scripts/benchmark_startup.py [--budget-ms 100] [--runs 5] [--top 3]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from plubo.cli.dispatcher import COMMANDS  # noqa: E402
+
+LOAD_SNIPPET = (
+    "import plubo.main\n"
+    "from plubo.cli.dispatcher import load_command\n"
+    "load_command({command!r})\n"
+)
+
+
+def _run(code, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", code]
+
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=str(ROOT_DIR), capture_output=True, text=True, check=True)
+    return time.perf_counter() - started, result.stderr
+
+
+def _median_ms(code, runs):
+    return statistics.median(_run(code)[0] for _ in range(runs)) * 1000
+
+
+def _imported_modules(stderr):
+    return {line.rsplit("|", 1)[1].strip() for line in stderr.splitlines() if line.startswith("import time:")}
+
+
+def _slowest_imports(stderr, top, ignore=()):
+    """Return the heaviest modules imported directly by the measured snippet's imports."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, raw_name = line[len("import time:"):].split("|")
+        depth = (len(raw_name) - len(raw_name.lstrip()) - 1) // 2
+        if depth == 1 and raw_name.strip() not in ignore:
+            imports.append((int(cumulative_us), raw_name.strip()))
+
+    return sorted(imports, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="allowed overhead over a bare interpreter")
+    parser.add_argument("--runs", type=int, default=5, help="runs per command (median is reported)")
+    parser.add_argument("--top", type=int, default=3, help="slowest imports to list per command")
+    options = parser.parse_args()
+
+    baseline_ms = _median_ms("pass", options.runs)
+    baseline_modules = _imported_modules(_run("pass", importtime=True)[1])
+    print(f"Bare interpreter: {baseline_ms:.1f} ms (subtracted below)")
+    print(f"{'command':<16} {'overhead':>10}  slowest imports")
+
+    over_budget = []
+    for command_name in COMMANDS:
+        code = LOAD_SNIPPET.format(command=command_name)
+        overhead_ms = max(0.0, _median_ms(code, options.runs) - baseline_ms)
+        _, stderr = _run(code, importtime=True)
+        slowest = ", ".join(
+            f"{name} {cumulative / 1000:.1f}ms"
+            for cumulative, name in _slowest_imports(stderr, options.top, baseline_modules)
+        )
+        marker = "" if overhead_ms <= options.budget_ms else "  ⚠️ over budget"
+        print(f"{command_name:<16} {overhead_ms:>8.1f}ms  {slowest}{marker}")
+        if overhead_ms > options.budget_ms:
+            over_budget.append(command_name)
+
+    if over_budget:
+        print(f"❌ {len(over_budget)} command(s) exceed the {options.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+    print(f"✅ All commands start within {options.budget_ms:.0f} ms of a bare interpreter.")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ fi
   --clean \
   --onefile \
   --name pb-cli \
+  --collect-submodules plubo \
   --runtime-hook scripts/pyinstaller_subprocess_env_hook.py \
   --add-data "plubo/templates${ADD_DATA_SEP}plubo/templates" \
   plubo/main.py